@@ -0,0 +1,303 @@
+"""
+Mikrobenchmarki gorących ścieżek map.py i Game.py.
+
+Uruchamiane bez okna (sterownik SDL 'dummy'). Cały zestaw, razem z pomiarem
+odniesienia, wykonywany jest w kilku przebiegach (--rounds) przeplatanych w
+czasie; dla każdego benchmarku porównywana jest mediana z przebiegów
+najlepszego czasu serii, więc pojedynczy zakłócony przebieg nie zmienia wyniku.
+Spowolnienie większe niż próg kończy program kodem 1. Domyślny próg to 50%:
+na współdzielonej maszynie wyniki kolejnych uruchomień różnią się nawet
+o 30-40% mimo normalizacji, więc niższy próg ma sens tylko na maszynie bez
+innego obciążenia. Mapa jest syntetyczną siatką regionów, więc wyniki nie
+zależą od plików w assets/map_assets.
+
+    python benchmarks/bench.py                   # porównanie z baseline.json
+    python benchmarks/bench.py --update          # zapis nowego baseline.json
+    python benchmarks/bench.py --threshold 0.25  # ostrzejszy próg na spokojnej maszynie
+    python benchmarks/bench.py --rounds 9        # więcej przebiegów na zaszumionej maszynie
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+import pygame
+import shapefile
+
+from Game import Game
+from map import SUPERSAMPLE, PolandMapWidget, baked_map_path
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+MAP_RECT = (50, 110, 540, 510)
+GRID = 4
+SIDE_VERTICES = 150
+CALIBRATION = "_calibration"
+
+
+def _jagged_line(start, end, seed):
+    """Zwraca poszarpaną linię między punktami (deterministyczną dla danej krawędzi)."""
+    rng = random.Random(seed)
+    (x0, y0), (x1, y1) = start, end
+    points = []
+    for k in range(SIDE_VERTICES):
+        t = k / SIDE_VERTICES
+        wobble = 0.0 if k == 0 else rng.uniform(-300, 300)
+        if x0 == x1:
+            points.append((x0 + wobble, y0 + (y1 - y0) * t))
+        else:
+            points.append((x0 + (x1 - x0) * t, y0 + wobble))
+    return points
+
+
+def _edge(a, b):
+    """Zwraca krawędź siatki a->b; ta sama krawędź u sąsiada ma te same wierzchołki."""
+    if a <= b:
+        return _jagged_line(a, b, hash((a, b)) & 0xFFFF)
+    forward = _jagged_line(b, a, hash((b, a)) & 0xFFFF) + [a]
+    forward = forward[::-1]
+    return forward[:-1]
+
+
+def write_synthetic_shapefile(folder: str) -> str:
+    """Zapisuje siatkę GRID x GRID regionów o wspólnych, poszarpanych granicach."""
+    path = os.path.join(folder, "siatka")
+    cell = 100_000
+    with shapefile.Writer(path, shapeType=shapefile.POLYGON) as w:
+        for field in ("A", "B", "C", "D", "NAZWA"):
+            w.field(field, "C")
+        for row in range(GRID):
+            for col in range(GRID):
+                x0, y0 = 200_000 + col * cell, 200_000 + row * cell
+                corners = [(x0, y0), (x0, y0 + cell), (x0 + cell, y0 + cell), (x0 + cell, y0)]
+                ring = []
+                for k in range(4):
+                    ring += _edge(corners[k], corners[(k + 1) % 4])
+                w.poly([ring + [ring[0]]])
+                w.record("", "", "", "", f"region {row}-{col}")
+    return path + ".shp"
+
+
+def measure(func, repeat: int, number: int) -> dict:
+    """Mierzy `func` (repeat serii po number wywołań); zwraca czasy jednego wywołania w µs."""
+    func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number * 1e6)
+    return {"median_us": statistics.median(samples), "min_us": min(samples)}
+
+
+def calibration() -> dict:
+    """Mierzy stałe obciążenie odniesienia (Python + wypełnianie powierzchni)."""
+    surface = pygame.Surface((256, 256))
+
+    def work():
+        total = 0
+        for k in range(2000):
+            total += k * k
+        surface.fill((k & 255, 0, 0))
+        return total
+
+    return measure(work, 7, 200)
+
+
+def aggregate(rounds: list) -> dict:
+    """Łączy wyniki przebiegów: dla każdego benchmarku mediana z przebiegów każdej statystyki."""
+    merged = {}
+    for name in rounds[0]:
+        merged[name] = {
+            key: statistics.median(result[name][key] for result in rounds)
+            for key in rounds[0][name]
+        }
+    return merged
+
+
+def benchmarks(shapefile_path: str):
+    """
+    Zwraca listę (nazwa, funkcja, repeat, number) oraz funkcję podającą pozycję myszy.
+
+    Pliki pomocnicze (wypalona mapa) trafiają do katalogu pliku .shp, więc
+    znikają razem z katalogiem tymczasowym tworzonym w main().
+    """
+    rng = random.Random(1234)
+    widget = PolandMapWidget(*MAP_RECT, shapefile_path)
+    points = [
+        (rng.randint(MAP_RECT[0], MAP_RECT[0] + MAP_RECT[2] - 1),
+         rng.randint(MAP_RECT[1], MAP_RECT[1] + MAP_RECT[3] - 1))
+        for _ in range(512)
+    ]
+    local_points = [(x - MAP_RECT[0], y - MAP_RECT[1]) for x, y in points]
+    screen = pygame.display.get_surface()
+    cycle = {"i": 0}
+
+    def next_point():
+        cycle["i"] = (cycle["i"] + 1) % len(points)
+        return points[cycle["i"]]
+
+    def bench_update():
+        widget.last_mouse_pos = None
+        widget.update()
+
+    def bench_handle_click():
+        widget.handle_click(local_points[cycle["i"]])
+        next_point()
+
+    def bench_draw_base_map():
+        widget.rasterize_base_map(1)
+
+    def bench_draw_base_map_aa():
+        widget.rasterize_base_map(SUPERSAMPLE)
+
+    baked_folder = os.path.join(os.path.dirname(shapefile_path), "baked")
+    os.makedirs(baked_folder, exist_ok=True)
+    pygame.image.save(widget.rasterize_base_map(), baked_map_path(baked_folder, widget.rect.size))
+    baked_widget = PolandMapWidget(*MAP_RECT, shapefile_path, baked_folder=baked_folder)
+
+    def bench_load_baked_map():
+        baked_widget.load_baked_map()
+
+    def bench_draw_overlays():
+        widget.hovered_voivodeship = widget.voivodeships[0]
+        widget.selected_voivodeship = widget.voivodeships[5]
+        widget._draw_overlays()
+
+    def bench_draw():
+        widget.needs_redraw = True
+        widget.draw(screen)
+
+    game = Game()
+    game.image_folder = os.path.join(ROOT, "assets", "photo_assets")
+    photo = sorted(os.listdir(game.image_folder))[0]
+    photo_surface = pygame.image.load(os.path.join(game.image_folder, photo)).convert_alpha()
+
+    def bench_pick_next_image():
+        game.image_cache.clear()
+        game.image_keys = [photo]
+        game.pick_next_image()
+
+    def bench_pick_next_image_cached():
+        game.image_keys = [photo]
+        game.pick_next_image()
+
+    def bench_draw_scaled_image_right():
+        game.draw_scaled_image_right(photo_surface)
+
+    return [
+        ("load_shapefile", lambda: PolandMapWidget(*MAP_RECT, shapefile_path), 7, 1),
+        ("update_hit_test", bench_update, 7, 5000),
+        ("handle_click", bench_handle_click, 7, 200),
+        ("draw_base_map", bench_draw_base_map, 7, 30),
+        ("draw_base_map_aa", bench_draw_base_map_aa, 7, 5),
+        ("load_baked_map", bench_load_baked_map, 7, 5),
+        ("draw_overlays", bench_draw_overlays, 7, 200),
+        ("draw", bench_draw, 7, 50),
+        ("pick_next_image", bench_pick_next_image, 7, 3),
+        ("pick_next_image_cached", bench_pick_next_image_cached, 7, 2000),
+        ("draw_scaled_image_right", bench_draw_scaled_image_right, 7, 100),
+    ], next_point
+
+
+def speed_factor(results: dict, baseline: dict) -> float:
+    """Zwraca stosunek szybkości maszyny teraz i przy zapisie baseline (z pomiaru odniesienia)."""
+    now = results.get(CALIBRATION)
+    then = baseline.get(CALIBRATION)
+    if not now or not then:
+        return 1.0
+    return now["min_us"] / then["min_us"]
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Zwraca listę benchmarków wolniejszych od baseline o więcej niż `threshold`.
+
+    Czasy dzielone są przez współczynnik szybkości maszyny, więc chwilowe
+    obciążenie systemu (lub inna maszyna) nie jest zgłaszane jako regresja.
+    """
+    factor = speed_factor(results, baseline)
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None or name == CALIBRATION:
+            continue
+        ratio = result["min_us"] / base["min_us"] / factor
+        if ratio > 1 + threshold:
+            regressions.append((name, ratio))
+    return regressions
+
+
+def main(argv=None) -> int:
+    """Uruchamia benchmarki, wypisuje wyniki i porównuje je z baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=0.5,
+                        help="dopuszczalne spowolnienie względem baseline (0.5 = 50%%)")
+    parser.add_argument("--rounds", type=int, default=5,
+                        help="liczba przebiegów całego zestawu (brana jest mediana)")
+    parser.add_argument("--update", action="store_true", help="zapisz wyniki jako nowy baseline")
+    parser.add_argument("--filter", default="", help="uruchom tylko benchmarki zawierające tekst")
+    args = parser.parse_args(argv)
+
+    pygame.display.init()
+    pygame.display.set_mode((1280, 720))
+    with tempfile.TemporaryDirectory() as folder:
+        suite, next_point = benchmarks(write_synthetic_shapefile(folder))
+        original_get_pos = pygame.mouse.get_pos
+        pygame.mouse.get_pos = next_point
+        rounds = []
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                for _ in range(args.rounds):
+                    results = {CALIBRATION: calibration()}
+                    for name, func, repeat, number in suite:
+                        if args.filter not in name:
+                            continue
+                        results[name] = measure(func, repeat, number)
+                    rounds.append(results)
+        finally:
+            pygame.mouse.get_pos = original_get_pos
+        results = aggregate(rounds)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    factor = speed_factor(results, baseline)
+    print(f"Współczynnik szybkości maszyny względem baseline: x{factor:.2f}")
+    for name, result in results.items():
+        base = baseline.get(name, {}).get("min_us", math.nan)
+        print(f"{name:28s} {result['min_us']:12.1f} µs   (baseline {base:12.1f} µs, "
+              f"x{result['min_us'] / base / factor:.2f} po normalizacji)")
+
+    if args.update:
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Zapisano {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for name, ratio in regressions:
+        print(f"REGRESJA: {name} jest x{ratio:.2f} wolniejszy od baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+Pamięć kilku równoczesnych procesów gry: zasoby prywatne vs wspólny magazyn (asset_store).
+
+Każdy proces wczytuje mapę (syntetyczna siatka z bench.py) i wszystkie zdjęcia
+z assets/photo_assets przeskalowane jak w grze, tak jak po długiej sesji.
+Tryb 'private' to dotychczasowa ścieżka (shapefile + ImageCache), tryb 'store'
+mapuje magazyn zbudowany przez pierwszy proces. Wypisywane są RSS, pamięć
+anonimowa (prywatna) i PSS z /proc/self/smaps_rollup, więc skrypt działa
+tylko w Linuksie.
+
+    python benchmarks/bench_asset_store.py --instances 4
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+PHOTO_FOLDER = os.path.join(ROOT, "assets", "photo_assets")
+
+
+def memory_kb() -> dict:
+    """Zwraca Rss, Anonymous i Pss bieżącego procesu w kB."""
+    values = {}
+    with open("/proc/self/smaps_rollup", encoding="ascii") as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in ("Rss", "Pss", "Anonymous"):
+                values[key] = int(rest.split()[0])
+    return values
+
+
+def child(mode: str, shapefile_path: str, store_root: str) -> None:
+    """Wczytuje zasoby, zgłasza gotowość, po sygnale wypisuje zużycie pamięci i czeka na koniec."""
+    import pygame
+
+    from asset_store import build_store, open_store
+    from Game import IMAGE_MAX_SIZE, SCREEN_HEIGHT, SCREEN_WIDTH, map_rect
+    from image_cache import ImageCache
+    from map import PolandMapWidget
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    names = sorted(os.listdir(PHOTO_FOLDER))
+    opener = lambda name: pygame.image.load(os.path.join(PHOTO_FOLDER, name))
+    rect = map_rect(SCREEN_WIDTH, SCREEN_HEIGHT)
+
+    if mode == "bare":
+        photos = []
+    elif mode == "store":
+        def build(folder):
+            widget = PolandMapWidget(*rect, shapefile_path)
+            build_store(folder, widget, [(n, n.split("_")[0]) for n in names], opener, IMAGE_MAX_SIZE)
+        store = open_store(store_root, "bench", build)
+        widget = PolandMapWidget(*rect, shapefile_path, store=store)
+        photos = [store.photo(name) for name in names]
+    else:
+        widget = PolandMapWidget(*rect, shapefile_path)
+        cache = ImageCache(1 << 30, opener)
+        photos = [cache.get(name, IMAGE_MAX_SIZE) for name in names]
+
+    if mode != "bare":
+        screen.blit(widget.render(), widget.rect)
+        widget._region_at(widget.rect.center)
+        for photo in photos:
+            screen.blit(photo, (0, 0))
+    print("ready", flush=True)
+    sys.stdin.readline()
+    print(json.dumps(memory_kb()), flush=True)
+    sys.stdin.readline()
+
+
+def run(mode: str, instances: int, shapefile_path: str, store_root: str) -> list:
+    """Uruchamia procesy jeden po drugim (jak kolejne stanowiska) i mierzy je, gdy działają wszystkie."""
+    procs = []
+    for _ in range(instances):
+        proc = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "--child", mode, shapefile_path, store_root],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        )
+        while proc.stdout.readline().strip() != "ready":
+            pass
+        procs.append(proc)
+    for proc in procs:
+        proc.stdin.write("\n")
+        proc.stdin.flush()
+    results = [json.loads(proc.stdout.readline()) for proc in procs]
+    for proc in procs:
+        proc.stdin.close()
+        proc.wait()
+    return results
+
+
+def main(argv=None) -> int:
+    """Porównuje pamięć procesów w trybach 'bare', 'private' i 'store'."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--instances", type=int, default=4)
+    parser.add_argument("--child", nargs=3, metavar=("TRYB", "SHP", "MAGAZYN"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.child:
+        child(*args.child)
+        return 0
+
+    from bench import write_synthetic_shapefile
+
+    with tempfile.TemporaryDirectory() as folder:
+        shapefile_path = write_synthetic_shapefile(folder)
+        store_root = os.path.join(folder, "magazyn")
+        print(f"{'tryb':8s} {'proces':>6s} {'RSS MB':>8s} {'prywatne MB':>12s} {'PSS MB':>8s}")
+        for mode in ("bare", "private", "store"):
+            for k, mem in enumerate(run(mode, args.instances, shapefile_path, store_root)):
+                print(f"{mode:8s} {k + 1:6d} {mem['Rss'] / 1024:8.1f} {mem['Anonymous'] / 1024:12.1f} "
+                      f"{mem['Pss'] / 1024:8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Porównanie czasu klatki rundy: backend powierzchni pygame vs Renderer/Texture SDL2.
+
+Rysowana jest klatka gry (nagłówek, zdjęcie, mapa, etykieta, licznik czasu)
+przez Game.draw_round na syntetycznej mapie z bench.py. Bez okna dostępny jest
+tylko renderer programowy SDL, więc domyślnie porównywane są 'surface' i
+'sdl2-software'; na maszynie z GPU można dodać 'sdl2'.
+
+    python benchmarks/bench_backends.py
+    python benchmarks/bench_backends.py --backends surface sdl2 --frames 600
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pygame
+
+from bench import MAP_RECT, write_synthetic_shapefile
+from Game import FONT, Game
+from map import PolandMapWidget
+from render_backend import RENDERER_ENV
+from scene import render_text
+
+
+def frame_times(backend: str, shapefile_path: str, frames: int, still: bool) -> list:
+    """Zwraca czasy kolejnych klatek rundy (ms) dla backendu; `still` - mysz nieruchoma."""
+    os.environ[RENDERER_ENV] = backend
+    pygame.display.init()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = Game()
+            widget = PolandMapWidget(*MAP_RECT, shapefile_path)
+        folder = os.path.join(ROOT, "assets", "photo_assets")
+        game.current_image_surface = pygame.image.load(os.path.join(folder, sorted(os.listdir(folder))[0]))
+
+        """Mysz przesuwa się po przekątnej mapy (zmiana podświetlenia co kilka klatek)"""
+        x0, y0, w, h = MAP_RECT
+        positions = [(x0 + w // 2, y0 + h // 2)] if still else [
+            (x0 + (k * 7) % w, y0 + (k * 5) % h) for k in range(frames)]
+        original_get_pos = pygame.mouse.get_pos
+        times = []
+        try:
+            for k in range(frames):
+                pos = positions[k % len(positions)]
+                pygame.mouse.get_pos = lambda pos=pos: pos
+                start = time.perf_counter()
+                timer = render_text(FONT, f"Czas: {8 - k * 8 // frames}s", (0, 100, 0))
+                game.draw_round(widget, (timer, (20, 70)))
+                times.append((time.perf_counter() - start) * 1000)
+        finally:
+            pygame.mouse.get_pos = original_get_pos
+        return times
+    finally:
+        pygame.display.quit()
+        os.environ.pop(RENDERER_ENV, None)
+
+
+def main(argv=None) -> int:
+    """Mierzy czasy klatek dla wybranych backendów i wypisuje porównanie."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--backends", nargs="+", default=["surface", "sdl2-software"])
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as folder:
+        shapefile_path = write_synthetic_shapefile(folder)
+        for still in (True, False):
+            print("Mysz nieruchoma:" if still else "Mysz w ruchu:")
+            for backend in args.backends:
+                times = frame_times(backend, shapefile_path, args.frames, still)[10:]
+                print(f"  {backend:14s} mediana {statistics.median(times):7.3f} ms   "
+                      f"p95 {sorted(times)[int(len(times) * 0.95)]:7.3f} ms   "
+                      f"min {min(times):7.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+Porównanie rasteryzacji bazowej mapy: czas i jakość dla skali nadpróbkowania 1-4 oraz obrazu wypalonego.
+
+Jakość to średni błąd bezwzględny kanałów RGBA (0-255) względem wzorca
+narysowanego w skali 8x, liczony na całej powierzchni i osobno na pikselach
+przy granicach (tam widać ząbki). Mapa jest syntetyczną siatką z bench.py.
+
+    python benchmarks/bench_map_aa.py
+"""
+
+import os
+import sys
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pygame
+
+from bench import MAP_RECT, measure, write_synthetic_shapefile
+from map import PolandMapWidget, baked_map_path
+
+REFERENCE_SCALE = 8
+
+
+def rgba(surface: pygame.Surface) -> np.ndarray:
+    """Zwraca piksele powierzchni jako tablicę (szerokość, wysokość, 4) liczb całkowitych."""
+    rgb = pygame.surfarray.array3d(surface).astype(np.int32)
+    alpha = pygame.surfarray.array_alpha(surface).astype(np.int32)
+    return np.dstack([rgb, alpha])
+
+
+def main() -> int:
+    """Wypisuje czas rysowania i błąd względem wzorca dla każdej skali."""
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    with tempfile.TemporaryDirectory() as folder:
+        widget = PolandMapWidget(*MAP_RECT, write_synthetic_shapefile(folder))
+        reference = rgba(widget.rasterize_base_map(REFERENCE_SCALE))
+        """Piksele przy granicach: tam, gdzie wzorzec odbiega od wypełnienia regionu"""
+        edges = (reference[..., :3] < 40).all(axis=2)
+        edges |= np.roll(edges, 1, 0) | np.roll(edges, -1, 0) | np.roll(edges, 1, 1) | np.roll(edges, -1, 1)
+
+        print(f"{'wariant':16s} {'czas (ms)':>10s} {'błąd średni':>12s} {'błąd przy granicach':>20s}")
+        for scale in (1, 2, 3, 4):
+            timing = measure(lambda: widget.rasterize_base_map(scale), 5, 1)
+            error = np.abs(rgba(widget.rasterize_base_map(scale)) - reference)
+            print(f"{f'skala {scale}x':16s} {timing['min_us'] / 1000:10.2f} "
+                  f"{error.mean():12.2f} {error[edges].mean():20.2f}")
+
+        pygame.image.save(widget.rasterize_base_map(), baked_map_path(folder, widget.rect.size))
+        baked = PolandMapWidget(*MAP_RECT, widget.shapefile_path, baked_folder=folder)
+        timing = measure(baked.load_baked_map, 5, 1)
+        error = np.abs(rgba(baked.load_baked_map()) - reference)
+        print(f"{'obraz wypalony':16s} {timing['min_us'] / 1000:10.2f} "
+              f"{error.mean():12.2f} {error[edges].mean():20.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
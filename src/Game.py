@@ -4,31 +4,57 @@ import sys
 import pygame
 from game_state import GameState
 import os
-from map import PolandMapWidget
+from map import SUPERSAMPLE, PolandMapWidget
+from regions import RegionMatrix
+from scene import (AnimatedLayer, Scene, SpriteLayer, StaticLayer, render_shadowed_text,
+                   render_text, wave_background_frames)
 import random
+import time
+from geo import puwg1992_to_wgs84
+from gps_index import GpsIndex, exact_points, write_log
+from image_cache import ImageCache
+from asset_pack import PhotoPack
+from profiling import StateProfiler, profiler_from_env
+from render_backend import create_backend
+from thumbnails import PhotoLoader, ThumbnailManifest
+from atlas import ThumbnailAtlas
+from photo_watcher import PhotoWatcher
+from asset_store import STORE_ENV, AssetStore, build_store, open_store, source_signature, store_key
+from layout import HEADER_HEIGHT, MAP_MARGIN, SCREEN_HEIGHT, SCREEN_WIDTH, map_rect
 
 """Inicjalizacja Pygame"""
 pygame.init()
 
 """Stałe"""
-SCREEN_WIDTH, SCREEN_HEIGHT = 1280, 720
 RED = (200,0,0) 
 ORANGE = (255,140,0)
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 GREEN = (0, 200, 0)
 DARK_GREEN = (0, 160, 0)
-HEADER_HEIGHT = 60
-MAP_MARGIN = 50
 IMAGE_MARGIN = 50
 IMAGE_MAX_W = SCREEN_WIDTH // 2 - 2*IMAGE_MARGIN
 IMAGE_MAX_H = SCREEN_HEIGHT - HEADER_HEIGHT - 2*IMAGE_MARGIN
+IMAGE_MAX_SIZE = (IMAGE_MAX_W, IMAGE_MAX_H)
+IMAGE_CACHE_BUDGET = int(os.environ.get("ZW_IMAGE_CACHE_MB", "64")) * 1024 * 1024
+PHOTO_PACK_PATH = os.environ.get(
+    "ZW_PHOTO_PACK", os.path.join(os.path.dirname(__file__), "..", "assets", "photo_assets.zip")
+)
+THUMBNAILS_PATH = os.path.join(os.path.dirname(__file__), "..", "assets", "photo_thumbs.npz")
+PHOTO_COORDINATES_PATH = os.path.join(os.path.dirname(__file__), "..", "assets", "photo_coordinates.csv")
+MAP_BAKED_FOLDER = os.path.join(os.path.dirname(__file__), "..", "assets", "map_assets", "baked")
+REVIEW_THUMB_SIZE = (160, 110)
+REVIEW_COLUMNS = 5
+REVIEW_CARD_W, REVIEW_CARD_H = 230, 175
+REVIEW_TOP = 140
+REVIEW_BOTTOM = SCREEN_HEIGHT - 100
 
 """Czcionki"""
 FONT = pygame.font.SysFont('Arial', 32)
 SMALL_FONT = pygame.font.SysFont('Arial', 24)
 TITLE_FONT = pygame.font.SysFont('Arial', 64, bold=True)
 HEADER_FONT = pygame.font.SysFont('Arial', 28)
+REVIEW_FONT = pygame.font.SysFont('Arial', 18)
 
 
 class Game:
@@ -37,15 +63,29 @@ class Game:
     def __init__(self)-> None:
         """Inicjalizuje atrybuty gry i stan początkowy."""
         self.state: GameState = GameState.HOMEPAGE
-        self.screen: pygame.Surface = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Znajdź Województwo")
+        self.backend = create_backend((SCREEN_WIDTH, SCREEN_HEIGHT), "Znajdź Województwo")
+        self.screen: pygame.Surface = self.backend.screen
+        self.header_cache: tuple[tuple, pygame.Surface] = ((), None)
+        self.photo_cache: tuple[pygame.Surface, pygame.Surface, tuple[int, int]] = (None, None, (0, 0))
         self.player_name: str = ""
         self.input_text: str = ""
         self.current_round: int = 0
         self.total_rounds: int = 3
         self.images: dict[str, str] = {}
         self.running: bool = True
-        self.score: int = 0
+        self.score: float = 0
+        self.scoring_mode: str = "binary"
+        self.last_points: float = 0
+        self.region_matrix: RegionMatrix = None
+        self.map_widget: PolandMapWidget = None
+        self.asset_store: AssetStore = None
+        self.exact_mode: bool = False
+        self.gps_index: GpsIndex = None
+        self.location_log: list[tuple[str, float, float]] = []
+        self.round_log: list[tuple[str, str, str, float, int]] = []
+        self.review_atlas: ThumbnailAtlas = ThumbnailAtlas(REVIEW_THUMB_SIZE, REVIEW_COLUMNS * 2)
+        self.review_scroll: int = 0
+        self.last_distance_km: float = 0.0
         self.button_glow: int = 0
         self.glow_direction: int = 1
         self.kolory_wojewodztw: dict[tuple[int, int, int], str] = {
@@ -66,6 +106,11 @@ class Game:
             (166, 123, 81): "wielkopolskie",
             (87, 133, 195): "zachodniopomorskie"
         }
+        self.scenes: dict[GameState, Scene] = {}
+        self.background_layer: AnimatedLayer = AnimatedLayer(
+            wave_background_frames(SCREEN_WIDTH, HEADER_HEIGHT, SCREEN_HEIGHT, (230, 245, 230)), 500
+        )
+        self.photo_pack: PhotoPack = PhotoPack(PHOTO_PACK_PATH) if os.path.exists(PHOTO_PACK_PATH) else None
         self.load_images()
 
         """Przygotowanie listy plików i miejsca na aktualne zdjęcie"""
@@ -73,62 +118,163 @@ class Game:
         self.image_keys: list[str] = list(self.images.keys())  
         self.current_image: str = None                      
         self.current_image_surface: pygame.Surface = None              
+        self.image_cache: ImageCache = ImageCache(
+            IMAGE_CACHE_BUDGET, self.photo_pack.load if self.photo_pack else None
+        )
+
+        """Miniatury pokazywane do czasu zdekodowania pełnego zdjęcia w tle"""
+        self.thumbnails: ThumbnailManifest = (
+            ThumbnailManifest.load(THUMBNAILS_PATH) if os.path.exists(THUMBNAILS_PATH) else None
+        )
+        self.photo_loader: PhotoLoader = PhotoLoader(self.image_cache.decode)
+        self.photo_visible_at: int = None
+        self.photo_watcher: PhotoWatcher = None
+
+        """Profilowanie stanów i rund (tylko gdy ustawiono ZW_PROFILE)"""
+        self.profiler: StateProfiler = profiler_from_env(os.path.join(os.path.dirname(__file__), "..", "profiles"))
+        if self.profiler is not None:
+            self.profiler.install(self)
 
     def load_images(self):
-        """Ładuje zdjęcia z folderu "photo_assets" """
+        """Ładuje zdjęcia z paczki (jeśli jest) lub z folderu "photo_assets" """
+        if self.photo_pack is not None:
+            for zdjecie in self.photo_pack.names():
+                self.images[zdjecie] = self.wojewodztwo_zdjecia(zdjecie)
+            return
+
         folder = os.path.join(os.path.dirname(__file__), "..",  "assets", "photo_assets")
         if not os.path.exists(folder):
             return 1
 
-        for zdjecie in os.listdir(folder):
-            wojewodztwo = zdjecie.split("_")[0].lower()
-            self.images[zdjecie] = wojewodztwo
+        """Tylko pliki, tak jak w PhotoWatcher.scan (podkatalogi nie są zdjęciami)"""
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.is_file():
+                    self.images[entry.name] = self.wojewodztwo_zdjecia(entry.name)
+
+    @staticmethod
+    def wojewodztwo_zdjecia(zdjecie: str) -> str:
+        """Zwraca województwo z nazwy pliku zdjęcia (część przed pierwszym '_')."""
+        return zdjecie.split("_")[0].lower()
+
+    def start_photo_watcher(self) -> None:
+        """Uruchamia obserwowanie folderu zdjęć (nie dotyczy paczki, która się nie zmienia)."""
+        if self.photo_watcher is None and self.photo_pack is None and os.path.isdir(self.image_folder):
+            self.photo_watcher = PhotoWatcher(self.image_folder, self.images).start()
+
+    def apply_photo_changes(self) -> None:
+        """
+        Dopisuje nowe i usuwa skasowane zdjęcia zgłoszone przez obserwatora (między rundami).
+
+        Jeśli indeks GPS jest już zbudowany, dostaje tę samą różnicę: współrzędne
+        czytane są tylko dla dodanych plików.
+        """
+        if self.photo_watcher is None:
+            return
+        added, removed = self.photo_watcher.poll()
+        if removed:
+            for zdjecie in removed:
+                self.images.pop(zdjecie, None)
+                self.image_cache.discard(os.path.join(self.image_folder, zdjecie))
+            self.image_keys = [k for k in self.image_keys if k not in removed]
+        for zdjecie in added:
+            if zdjecie not in self.images:
+                self.images[zdjecie] = self.wojewodztwo_zdjecia(zdjecie)
+                self.image_keys.append(zdjecie)
+        if self.gps_index is not None and (added or removed):
+            opener = lambda name: open(os.path.join(self.image_folder, name), "rb")
+            nowe = GpsIndex.build_from(sorted(added), opener, PHOTO_COORDINATES_PATH)
+            self.gps_index = self.gps_index.updated(nowe, removed)
 
     def pick_next_image(self) -> None:
         """Losuje nowe zdjęcie spośród dostępnych zdjęć"""        
         while self.image_keys:   
             self.current_image = random.choice(self.image_keys)
             self.image_keys.remove(self.current_image)
-            full_path = os.path.join(self.image_folder, self.current_image)
-
-            if not os.path.exists(full_path):
+            if self.photo_pack is not None:
+                full_path = self.current_image
+                exists = full_path in self.photo_pack
+            else:
+                full_path = os.path.join(self.image_folder, self.current_image)
+                exists = os.path.exists(full_path)
+
+            if not exists:
                 print(f"Ostrzeżenie: Nie znaleziono pliku {full_path}. Przechodzę do kolejnego zdjęcia.")
                 continue
             try: 
-                surf = pygame.image.load(full_path).convert_alpha()    
-                w, h = surf.get_size()
-                scale = min(IMAGE_MAX_W / w, IMAGE_MAX_H / h)
-                new_size = (int(w * scale), int(h * scale))
-                self.current_image_surface = pygame.transform.smoothscale(surf, new_size)
+                self.photo_loader.cancel()
+                self.photo_visible_at = None
+                if self.asset_store is not None and self.current_image in self.asset_store:
+                    self.current_image_surface = self.asset_store.photo(self.current_image)
+                    return
+                placeholder = None
+                if (full_path, IMAGE_MAX_SIZE) not in self.image_cache and self.thumbnails is not None:
+                    placeholder = self.thumbnails.placeholder(self.current_image, IMAGE_MAX_SIZE)
+                if placeholder is not None:
+                    self.current_image_surface = placeholder
+                    self.photo_loader.submit(full_path, IMAGE_MAX_SIZE)
+                else:
+                    self.current_image_surface = self.image_cache.get(full_path, IMAGE_MAX_SIZE)
                 return 
-            except pygame.error as e:
+            except (pygame.error, OSError) as e:
                 print(f"Błąd ładowanie obrazu: {e}. Pomijam {self.current_image}.")
+                self.image_cache.discard(full_path)
                 continue
         self.current_image = None
         self.current_image_surface = None
 
-    def draw_header(self)-> None:
-        """Rysuje nagłówek z informacjami o rundzie i wyniku."""
+    def poll_photo(self) -> None:
+        """Podmienia miniaturę na pełne zdjęcie, gdy dekodowanie w tle się skończyło."""
+        path = self.photo_loader.path
+        try:
+            result = self.photo_loader.poll()
+        except (pygame.error, OSError) as e:
+            """Np. plik usunięty po sprawdzeniu istnienia, a przed dekodowaniem"""
+            print(f"Błąd ładowanie obrazu: {e}. Pomijam {self.current_image}.")
+            self.image_cache.discard(path)
+            self.pick_next_image()
+            return
+        if result is not None:
+            path, surface = result
+            self.image_cache.put((path, IMAGE_MAX_SIZE), surface)
+            self.current_image_surface = surface
+
+    def header_surface(self) -> pygame.Surface:
+        """Zwraca nagłówek z informacjami o rundzie i wyniku (renderowany tylko po zmianie)."""
+        key = (self.current_round, self.total_rounds, self.score)
+        if self.header_cache[0] == key:
+            return self.header_cache[1]
+        header = pygame.Surface((SCREEN_WIDTH, HEADER_HEIGHT + 2))
+
         """Tło nagłówka"""
-        pygame.draw.rect(self.screen, (230, 245, 230), (0, 0, SCREEN_WIDTH, HEADER_HEIGHT))
+        header.fill((240, 240, 240))
+        pygame.draw.rect(header, (230, 245, 230), (0, 0, SCREEN_WIDTH, HEADER_HEIGHT))
 
         """Linia oddzielająca"""
-        pygame.draw.line(self.screen, (180, 220, 180), (0, HEADER_HEIGHT), (SCREEN_WIDTH, HEADER_HEIGHT), 2)
+        pygame.draw.line(header, (180, 220, 180), (0, HEADER_HEIGHT), (SCREEN_WIDTH, HEADER_HEIGHT), 2)
 
         """Licznik rund (lewy górny róg)"""
         round_text = HEADER_FONT.render(f"Runda: {self.current_round + 1}/{self.total_rounds}", True, (0, 100, 0))
-        self.screen.blit(round_text, (20, 15))
+        header.blit(round_text, (20, 15))
 
         """ Wynik (prawy górny róg)"""
-        score_text = HEADER_FONT.render(f"Wynik: {self.score}", True, (0, 100, 0))
-        self.screen.blit(score_text, (SCREEN_WIDTH - score_text.get_width() - 20, 15))
+        score_text = HEADER_FONT.render(f"Wynik: {self.score:g}", True, (0, 100, 0))
+        header.blit(score_text, (SCREEN_WIDTH - score_text.get_width() - 20, 15))
 
         """Pionowa linia oddzielająca"""
-        pygame.draw.line(self.screen, (180, 220, 180), (SCREEN_WIDTH // 2, 0), (SCREEN_WIDTH // 2, HEADER_HEIGHT), 1)
+        pygame.draw.line(header, (180, 220, 180), (SCREEN_WIDTH // 2, 0), (SCREEN_WIDTH // 2, HEADER_HEIGHT), 1)
+
+        self.header_cache = (key, header)
+        return header
+
+    def draw_header(self)-> None:
+        """Rysuje nagłówek z informacjami o rundzie i wyniku."""
+        self.screen.blit(self.header_surface(), (0, 0))
 
     def run(self)-> None:
         """Główna pętla gry obsługująca przechodzenie między stanami."""
         clock = pygame.time.Clock()
+        self.start_photo_watcher()
         while self.state != GameState.END:
             if self.state == GameState.HOMEPAGE:
                 self.handle_homepage()
@@ -146,10 +292,20 @@ class Game:
                 self.handle_difficulty_select()
             elif self.state == GameState.GAMEPAGE_HARD_MODE:
                 self.handle_gamepage_hard_mode()
+            elif self.state == GameState.GAMEPAGE_EXACT:
+                self.handle_gamepage_exact()
             clock.tick(60)
+        self.close()
         pygame.quit()
         sys.exit()
 
+    def close(self) -> None:
+        """Zatrzymuje wątki w tle (dekodowanie zdjęć, obserwator folderu) przed pygame.quit()."""
+        self.photo_loader.close()
+        if self.photo_watcher is not None:
+            self.photo_watcher.stop()
+            self.photo_watcher = None
+
     def draw_button(self, text: str, rect: pygame.Rect, color: tuple[int, int, int],
                 hover_color: tuple[int, int, int], mouse_pos: tuple[int, int],
                 glow: bool = False) -> None:
@@ -166,22 +322,44 @@ class Game:
 
         pygame.draw.rect(self.screen, button_color, rect, border_radius=10)
         pygame.draw.rect(self.screen, BLACK, rect, 2, border_radius=10)
-        text_surface: pygame.Surface = FONT.render(text, True, BLACK)
+        text_surface: pygame.Surface = render_text(FONT, text, BLACK)
         text_rect = text_surface.get_rect(center=rect.center)
         self.screen.blit(text_surface, text_rect)
 
-    def draw_animated_background(self)-> None:
-        """Rysuje animowane tło z delikatnymi falami."""
-        for y in range(HEADER_HEIGHT, SCREEN_HEIGHT, 20):
-            offset = pygame.time.get_ticks() / 500
-            wave = int(10 * abs(pygame.math.Vector2(0, y).rotate(offset).y / SCREEN_HEIGHT))
-            pygame.draw.line(
-                self.screen,
-                (230, 245, 230),
-                (0, y + wave),
-                (SCREEN_WIDTH, y + wave),
-                2
-            )
+    def get_scene(self, state: GameState) -> Scene:
+        """Zwraca scenę dla stanu gry, budując ją przy pierwszym użyciu."""
+        scene = self.scenes.get(state)
+        if scene is None:
+            scene = self.build_scene(state)
+            self.scenes[state] = scene
+        return scene
+
+    def build_scene(self, state: GameState) -> Scene:
+        """Buduje warstwy sceny dla podanego stanu gry."""
+        size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        if state == GameState.HOMEPAGE:
+            title = render_shadowed_text(TITLE_FONT, "Znajdź Województwo", (50, 100, 50), (100, 150, 100))
+            title_x = SCREEN_WIDTH//2 - (title.get_width() - 3)//2
+            return Scene([
+                StaticLayer(lambda surf: surf.fill((240, 250, 240)), size),
+                self.background_layer,
+                SpriteLayer(title, lambda elapsed: (title_x, min(100 + elapsed * 0.03, 120))),
+            ])
+        if state == GameState.DIFFICULTY_SELECT:
+            return Scene([StaticLayer(self.render_difficulty_select, size)])
+        if state in (GameState.STARTPAGE, GameState.STARTPAGE_HARD_MODE):
+            return Scene([StaticLayer(self.render_startpage, size)])
+        if state == GameState.INSTRUCTIONPAGE:
+            return Scene([StaticLayer(self.render_instructionpage, size)])
+        if state == GameState.RESULTPAGE:
+            return Scene([StaticLayer(self.render_resultpage, size)])
+        return Scene([StaticLayer(lambda surf: surf.fill((240, 250, 240)), size)])
+
+    def enter_scene(self, state: GameState) -> Scene:
+        """Przygotowuje scenę do wyświetlenia (reset animacji wejścia)."""
+        scene = self.get_scene(state)
+        scene.enter(pygame.time.get_ticks())
+        return scene
 
     def pokaz_feedback(self, status: str, poprawne_woj: str) -> None:
         """
@@ -199,6 +377,14 @@ class Game:
             naglowek = "ŹLE"
             kolor = RED
             komunikat = f"Prawidłowe województwo to: {poprawne_woj.capitalize()}."
+        elif status == 'blisko':
+            naglowek = "BLISKO!"
+            kolor = ORANGE
+            komunikat = f"Otrzymujesz {self.last_points:g} pkt. Prawidłowe województwo to: {poprawne_woj.capitalize()}."
+        elif status == 'odleglosc':
+            naglowek = f"{self.last_distance_km:.0f} km"
+            kolor = GREEN if self.last_points >= 0.5 else ORANGE
+            komunikat = f"Otrzymujesz {self.last_points:g} pkt. Województwo: {poprawne_woj.capitalize()}."
         elif status == 'czas':
             naglowek = "KONIEC CZASU!"
             kolor = ORANGE
@@ -216,26 +402,17 @@ class Game:
         komunikat_rect = komunikat_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         self.screen.blit(komunikat_surface, komunikat_rect)
 
-        pygame.display.flip()
+        self.backend.flip()
         pygame.time.wait(2500)
 
     def handle_homepage(self)-> None:
         """Obsługuje ekran startowy z przyciskiem Start i Zakończ."""
-        title_y = 100
-        title_target_y = 120
-        title_speed = 0.5
+        scene = self.enter_scene(GameState.HOMEPAGE)
 
         while self.state == GameState.HOMEPAGE:
             mouse_pos: tuple[int, int] = pygame.mouse.get_pos()
-            if title_y < title_target_y:
-                title_y += title_speed
-            self.screen.fill((240, 250, 240))
-            self.draw_animated_background()
+            scene.draw(self.screen, pygame.time.get_ticks())
 
-            title: pygame.Surface = TITLE_FONT.render("Znajdź Województwo", True, (50, 100, 50))
-            title_shadow: pygame.Surface = TITLE_FONT.render("Znajdź Województwo", True, (100, 150, 100))
-            self.screen.blit(title_shadow, (SCREEN_WIDTH//2 - title_shadow.get_width()//2 + 3, title_y + 3))
-            self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, title_y))
             start_btn: pygame.Rect = pygame.Rect(490, 250, 300, 70)
             rules_btn: pygame.Rect = pygame.Rect(490, 350, 300, 70)
             exit_btn: pygame.Rect = pygame.Rect(490, 450, 300, 70)
@@ -248,7 +425,7 @@ class Game:
                     self.change_state(GameState.END)
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if start_btn.collidepoint(event.pos):
-                        pygame.display.flip()
+                        self.backend.flip()
                         pygame.time.delay(300)
                         self.change_state(GameState.DIFFICULTY_SELECT)
                         return
@@ -260,20 +437,29 @@ class Game:
                         self.change_state(GameState.END)
                         return
 
-            pygame.display.flip()
+            self.backend.flip()
+
+    def render_difficulty_select(self, surface: pygame.Surface) -> None:
+        """Renderuje statyczną warstwę ekranu wyboru poziomu trudności."""
+        surface.fill((240,250,240))
+        title: pygame.Surface = FONT.render("Wybierz poziom trudności", True, BLACK)
+        surface.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 100))
 
     def handle_difficulty_select(self) -> None:
+        scene = self.enter_scene(GameState.DIFFICULTY_SELECT)
         while self.state == GameState.DIFFICULTY_SELECT:
-            self.screen.fill((240,250,240))
+            scene.draw(self.screen, pygame.time.get_ticks())
             mouse_pos: tuple[int, int] = pygame.mouse.get_pos()
 
-            title: pygame.Surface = FONT.render("Wybierz poziom trudności", True, BLACK)
-            self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 100))
-
             easy_btn: pygame.Rect = pygame.Rect(490, 250, 300, 70)
             hard_btn: pygame.Rect = pygame.Rect(490, 350, 300, 70)
+            exact_btn: pygame.Rect = pygame.Rect(490, 450, 300, 70)
+            partial_btn: pygame.Rect = pygame.Rect(440, 570, 400, 60)
             self.draw_button("Łatwy", easy_btn, GREEN, DARK_GREEN, mouse_pos)
             self.draw_button("Trudny", hard_btn, (200, 0, 0), (160, 0, 0), mouse_pos)
+            self.draw_button("Dokładny", exact_btn, ORANGE, (220, 120, 0), mouse_pos)
+            partial_label = "Punkty częściowe: " + ("tak" if self.scoring_mode == "partial" else "nie")
+            self.draw_button(partial_label, partial_btn, (200, 200, 200), (170, 170, 170), mouse_pos)
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -282,14 +468,29 @@ class Game:
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if easy_btn.collidepoint(event.pos):
                         self.hard_mode: bool = False
+                        self.exact_mode = False
                         self.change_state(GameState.STARTPAGE)
                         return
                     elif hard_btn.collidepoint(event.pos):
                         self.hard_mode = True
+                        self.exact_mode = False
                         self.change_state(GameState.STARTPAGE_HARD_MODE)
                         return
+                    elif exact_btn.collidepoint(event.pos):
+                        self.hard_mode = False
+                        self.exact_mode = True
+                        self.change_state(GameState.STARTPAGE)
+                        return
+                    elif partial_btn.collidepoint(event.pos):
+                        self.scoring_mode = "binary" if self.scoring_mode == "partial" else "partial"
                     
-            pygame.display.flip()
+            self.backend.flip()
+
+    def render_startpage(self, surface: pygame.Surface) -> None:
+        """Renderuje statyczną warstwę ekranu wprowadzania imienia."""
+        surface.fill((240, 250, 240))
+        title: pygame.Surface = FONT.render("Wprowadź swoje imię:", True, (50, 100, 50))
+        surface.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, SCREEN_HEIGHT//3 - 50))
 
     def handle_startpage(self)-> None:
         """Obsługuje stronę rozpoczęcia rozgrywki z wprowadzeniem imienia i paskiem ładowania."""
@@ -304,12 +505,10 @@ class Game:
 
         """Pętla wprowadzania imienia"""
         name_entered: bool = False
+        scene = self.enter_scene(GameState.STARTPAGE)
         while self.state == GameState.STARTPAGE and not name_entered:
             mouse_pos: tuple[int, int] = pygame.mouse.get_pos()
-            self.screen.fill((240, 250, 240))
-            
-            title: pygame.Surface = FONT.render("Wprowadź swoje imię:", True, (50, 100, 50))
-            self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, SCREEN_HEIGHT//3 - 50))
+            scene.draw(self.screen, pygame.time.get_ticks())
             
             pygame.draw.rect(self.screen, color, input_rect, 2, border_radius=10)
             text_surface: pygame.Surface = FONT.render(self.input_text, True, BLACK)
@@ -345,7 +544,7 @@ class Game:
                         if len(self.input_text) < 20:
                             self.input_text += event.unicode
             
-            pygame.display.flip()
+            self.backend.flip()
 
     
         
@@ -356,15 +555,15 @@ class Game:
             text: pygame.Surface = FONT.render(f"Witaj, {self.player_name}! Przygotuj się do gry!", True, BLACK)
             self.screen.blit(text, (SCREEN_WIDTH//2 - text.get_width()//2, SCREEN_HEIGHT//2 - 50))
             pygame.draw.rect(self.screen, (200, 200, 200), (SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 + 50, 300, 20))
-            pygame.display.flip()
+            self.backend.flip()
 
             for i in range(1, 101):
                 pygame.draw.rect(self.screen, GREEN, (SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 + 50, 3 * i, 20))
-                pygame.display.flip()
+                self.backend.flip()
                 pygame.time.wait(20)
 
             pygame.time.wait(500)
-            self.change_state(GameState.GAMEPAGE)
+            self.change_state(GameState.GAMEPAGE_EXACT if self.exact_mode else GameState.GAMEPAGE)
 
     def handle_startpage_hard_mode(self)-> None:
         """Obsługuje stronę rozpoczęcia rozgrywki z wprowadzeniem imienia i paskiem ładowania."""
@@ -379,12 +578,10 @@ class Game:
 
         """Pętla wprowadzania imienia"""
         name_entered: bool = False
+        scene = self.enter_scene(GameState.STARTPAGE_HARD_MODE)
         while self.state == GameState.STARTPAGE_HARD_MODE and not name_entered:
             mouse_pos: tuple[int, int] = pygame.mouse.get_pos()
-            self.screen.fill((240, 250, 240))
-            
-            title: pygame.Surface = FONT.render("Wprowadź swoje imię:", True, (50, 100, 50))
-            self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, SCREEN_HEIGHT//3 - 50))
+            scene.draw(self.screen, pygame.time.get_ticks())
             
             pygame.draw.rect(self.screen, color, input_rect, 2, border_radius=10)
             text_surface: pygame.Surface = FONT.render(self.input_text, True, BLACK)
@@ -420,7 +617,7 @@ class Game:
                         if len(self.input_text) < 20:
                             self.input_text += event.unicode
             
-            pygame.display.flip()
+            self.backend.flip()
 
     
         
@@ -431,39 +628,42 @@ class Game:
             text: pygame.Surface = FONT.render(f"Witaj, {self.player_name}! Przygotuj się do gry!", True, BLACK)
             self.screen.blit(text, (SCREEN_WIDTH//2 - text.get_width()//2, SCREEN_HEIGHT//2 - 50))
             pygame.draw.rect(self.screen, (200, 200, 200), (SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 + 50, 300, 20))
-            pygame.display.flip()
+            self.backend.flip()
 
             for i in range(1, 101):
                 pygame.draw.rect(self.screen, GREEN, (SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 + 50, 3 * i, 20))
-                pygame.display.flip()
+                self.backend.flip()
                 pygame.time.wait(20)
 
             pygame.time.wait(500)
             self.change_state(GameState.GAMEPAGE_HARD_MODE)
 
 
-    def handle_instructionpage(self) -> None:
-        """Wyświetla ekran z zasadami gry."""
-        while self.state == GameState.INSTRUCTIONPAGE:
-            self.screen.fill((240, 250, 240))
-        
-            """Naapis z efektem cienia"""
-            title = TITLE_FONT.render("Zasady Gry", True, (50, 100, 50))
-            title_shadow = TITLE_FONT.render("Zasady Gry", True, (100, 150, 100))
-            self.screen.blit(title_shadow, (SCREEN_WIDTH//2 - title_shadow.get_width()//2 + 3, 100 + 3))
-            self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 100))
-        
-            """Lista zasad"""
-            rules_text = [
+    def render_instructionpage(self, surface: pygame.Surface) -> None:
+        """Renderuje statyczną warstwę ekranu z zasadami gry."""
+        surface.fill((240, 250, 240))
+
+        """Napis z efektem cienia"""
+        title = render_shadowed_text(TITLE_FONT, "Zasady Gry", (50, 100, 50), (100, 150, 100))
+        surface.blit(title, (SCREEN_WIDTH//2 - (title.get_width() - 3)//2, 100))
+
+        """Lista zasad"""
+        rules_text = [
             "1. Kliknij na mapie województwo, które widzisz na zdjęciu.",
             "2. Masz 3 rundy, aby zdobyć jak najwięcej punktów.",
             "3. Każda poprawna odpowiedź to jeden punkt."
         ]
-            
-            """Zasady punkt po punkcie"""
-            for i, line in enumerate(rules_text):
-                text_surface = FONT.render(line, True, BLACK)
-                self.screen.blit(text_surface, (SCREEN_WIDTH//2 - text_surface.get_width()//2, 200 + i * 40))
+
+        """Zasady punkt po punkcie"""
+        for i, line in enumerate(rules_text):
+            text_surface = FONT.render(line, True, BLACK)
+            surface.blit(text_surface, (SCREEN_WIDTH//2 - text_surface.get_width()//2, 200 + i * 40))
+
+    def handle_instructionpage(self) -> None:
+        """Wyświetla ekran z zasadami gry."""
+        scene = self.enter_scene(GameState.INSTRUCTIONPAGE)
+        while self.state == GameState.INSTRUCTIONPAGE:
+            scene.draw(self.screen, pygame.time.get_ticks())
         
             mouse_pos = pygame.mouse.get_pos()
             back_btn = pygame.Rect(SCREEN_WIDTH//2 - 150, 400, 300, 70)
@@ -478,20 +678,25 @@ class Game:
                         self.change_state(GameState.HOMEPAGE)
                         return
         
-            pygame.display.flip()
+            self.backend.flip()
         
 
     def handle_gamepage(self) -> None:
         """Obsługuje stronę gry (rozgrywkę)."""
         self.current_round = 0
         self.score = 0
+        self.start_review()
+        self.apply_photo_changes()
 
         map_widget = self.load_map_widget()
         if not map_widget:
             return
 
         while self.running and self.current_round < self.total_rounds:
+            if self.current_round:
+                self.apply_photo_changes()
             self.pick_next_image()
+            map_widget.reset()
             self.run_single_round(map_widget)
             self.current_round += 1
 
@@ -501,20 +706,105 @@ class Game:
         """Obsługuje stronę gry (rozgrywkę)."""
         self.current_round = 0
         self.score = 0
+        self.start_review()
+        self.apply_photo_changes()
 
         map_widget = self.load_map_widget()
         if not map_widget:
             return
 
         while self.running and self.current_round < self.total_rounds:
+            if self.current_round:
+                self.apply_photo_changes()
             self.pick_next_image()
+            map_widget.reset()
             self.run_single_round_hard_mode(map_widget)
             self.current_round += 1
 
         self.change_state(GameState.RESULTPAGE)
 
-    def load_map_widget(self) -> None:
-        """Wczytuje widget mapy, zwraca obiekt lub None przy błędzie."""
+    def handle_gamepage_exact(self) -> None:
+        """Obsługuje rozgrywkę w trybie dokładnym (kliknięcie miejsca ze zdjęcia)."""
+        self.current_round = 0
+        self.score = 0
+        self.start_review()
+        self.apply_photo_changes()
+        self.location_log = []
+
+        map_widget = self.load_map_widget()
+        if not map_widget:
+            return
+        self.load_gps_index()
+
+        """Losowane są tylko zdjęcia ze znanymi współrzędnymi"""
+        pozostale = []
+        while self.running and self.current_round < self.total_rounds:
+            if self.current_round:
+                self.apply_photo_changes()
+            pozostale += [k for k in self.image_keys if k not in self.gps_index]
+            self.image_keys = [k for k in self.image_keys if k in self.gps_index]
+            self.pick_next_image()
+            if self.current_image is None:
+                break
+            map_widget.reset()
+            self.run_single_round_exact(map_widget)
+            self.current_round += 1
+
+        self.image_keys += [k for k in pozostale if k in self.images]
+        if self.location_log:
+            self.save_location_log()
+        if self.state == GameState.GAMEPAGE_EXACT:
+            self.change_state(GameState.RESULTPAGE)
+
+    def load_gps_index(self) -> GpsIndex:
+        """Buduje (raz) indeks współrzędnych zdjęć z pliku CSV i danych EXIF."""
+        if self.gps_index is None:
+            if self.photo_pack is not None:
+                self.gps_index = GpsIndex.build_from(self.photo_pack.names(), self.photo_pack.open,
+                                                     PHOTO_COORDINATES_PATH)
+            elif os.path.exists(self.image_folder):
+                self.gps_index = GpsIndex.build(self.image_folder, PHOTO_COORDINATES_PATH)
+            else:
+                self.gps_index = GpsIndex([], [])
+        return self.gps_index
+
+    def save_location_log(self) -> str:
+        """Zapisuje kliknięcia z trybu dokładnego do pliku CSV w katalogu logs."""
+        folder = os.path.join(os.path.dirname(__file__), "..", "logs")
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"lokalizacje_{time.strftime('%Y%m%d_%H%M%S')}.csv")
+        write_log(path, self.location_log)
+        return path
+
+    def sprawdz_lokalizacje(self, zdjecie: str, geo_pos: tuple[float, float]) -> float:
+        """Ocenia kliknięcie w trybie dokładnym na podstawie odległości od miejsca zdjęcia."""
+        lat, lon = puwg1992_to_wgs84(*geo_pos)
+        lat, lon = float(lat), float(lon)
+        self.last_distance_km = float(self.gps_index.distances_km([zdjecie], [lat], [lon])[0])
+        self.last_points = round(float(exact_points(self.last_distance_km)), 2)
+        self.score += self.last_points
+        self.location_log.append((zdjecie, lat, lon))
+        return self.last_points
+
+    def start_review(self) -> None:
+        """Czyści przegląd rund przed nową grą (atlas zachowuje przydzieloną pamięć)."""
+        self.round_log = []
+        self.review_atlas.clear()
+        self.review_scroll = 0
+
+    def record_round(self, zdjecie: str, odpowiedz: str) -> None:
+        """Zapisuje rundę do przeglądu; miniatura aktualnego zdjęcia trafia do atlasu."""
+        indeks = -1
+        if self.current_image_surface is not None:
+            self.review_atlas.add(self.current_image_surface)
+            indeks = len(self.review_atlas) - 1
+        self.round_log.append((zdjecie, self.images.get(zdjecie, ""), odpowiedz or "-", self.last_points, indeks))
+
+    def load_map_widget(self) -> PolandMapWidget:
+        """Zwraca widget mapy (wczytany raz na cały czas działania gry) lub None przy błędzie."""
+        if self.map_widget is not None:
+            self.map_widget.reset()
+            return self.map_widget
         try:
             project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
             shapefile_path = os.path.join(project_root, '..', 'assets', 'map_assets', 'wojewodztwa.shp')
@@ -522,37 +812,91 @@ class Game:
                 shapefile_path = os.path.join(os.path.dirname(__file__), '..', 'assets', 'map_assets', 'wojewodztwa.shp')
             if not os.path.exists(shapefile_path):
                 raise FileNotFoundError("Nie znaleziono pliku z mapą województw!")
-            map_x = MAP_MARGIN
-            map_y = HEADER_HEIGHT + MAP_MARGIN
-            map_w = SCREEN_WIDTH // 2 - 2*MAP_MARGIN
-            map_h = SCREEN_HEIGHT - HEADER_HEIGHT - 2*MAP_MARGIN
-            return PolandMapWidget(map_x, map_y, map_w, map_h, shapefile_path)
+            store_root = os.environ.get(STORE_ENV)
+            if store_root:
+                self.asset_store = self.load_asset_store(store_root, shapefile_path)
+            self.map_widget = PolandMapWidget(*map_rect(SCREEN_WIDTH, SCREEN_HEIGHT), shapefile_path,
+                                              baked_folder=MAP_BAKED_FOLDER, store=self.asset_store)
+            self.region_matrix = self.map_widget.region_matrix
+            return self.map_widget
 
         except Exception as e:
             print(f"Błąd ładowania mapy: {e}")
             self.screen.fill((240, 240, 240))
             error_text = FONT.render("Błąd ładowania mapy!", True, (255, 0, 0))
             self.screen.blit(error_text, (50, 50))
-            pygame.display.flip()
+            self.backend.flip()
             pygame.time.wait(3000)
             self.change_state(GameState.HOMEPAGE)
             return None
 
-    def draw_scaled_image_right(self, image: pygame.Surface) -> None:
-        """Rysuje zdjęcie po prawej stronie, proporcjonalne skalowane i wyśrodkowane."""
+    def load_asset_store(self, root: str, shapefile_path: str) -> AssetStore:
+        """Mapuje wspólny magazyn zasobów (mapa i zdjęcia), budując go, jeśli jeszcze go nie ma."""
+        photo_source = PHOTO_PACK_PATH if self.photo_pack is not None else self.image_folder
+        key = store_key(
+            source_signature(shapefile_path), source_signature(os.path.splitext(shapefile_path)[0] + ".dbf"),
+            source_signature(photo_source), map_rect(SCREEN_WIDTH, SCREEN_HEIGHT), IMAGE_MAX_SIZE, SUPERSAMPLE,
+        )
+
+        def build(folder: str) -> None:
+            widget = PolandMapWidget(*map_rect(SCREEN_WIDTH, SCREEN_HEIGHT), shapefile_path,
+                                     baked_folder=MAP_BAKED_FOLDER)
+            if self.photo_pack is not None:
+                opener = self.photo_pack.load
+            else:
+                opener = lambda name: pygame.image.load(os.path.join(self.image_folder, name))
+            build_store(folder, widget, sorted(self.images.items()), opener, IMAGE_MAX_SIZE)
+
+        return open_store(root, key, build)
+
+    def photo_layer(self, image: pygame.Surface) -> tuple[pygame.Surface, tuple[int, int]]:
+        """Zwraca zdjęcie z ramką, proporcjonalnie skalowane, i jego pozycję (liczone raz na zdjęcie)."""
+        if self.photo_cache[0] is image:
+            return self.photo_cache[1], self.photo_cache[2]
         available_width = SCREEN_WIDTH // 2 - 2 * MAP_MARGIN
         available_height = SCREEN_HEIGHT - HEADER_HEIGHT - 2 * MAP_MARGIN
         scale = min(available_width / image.get_width(), available_height / image.get_height(), 1)
         new_width = int(image.get_width() * scale)
         new_height = int(image.get_height() * scale)
-        image_scaled = pygame.transform.scale(image, (new_width, new_height))
+        image_scaled = image if scale == 1 else pygame.transform.scale(image, (new_width, new_height))
         right_x_start = SCREEN_WIDTH // 2
         x = right_x_start + (available_width - new_width) // 2 + MAP_MARGIN
         y = HEADER_HEIGHT + (available_height - new_height) // 2 + MAP_MARGIN
 
-        border_rect = pygame.Rect(x - 2, y - 2, new_width + 4, new_height + 4)
-        pygame.draw.rect(self.screen, (0, 0, 0), border_rect, 2) 
-        self.screen.blit(image_scaled, (x, y))
+        framed = pygame.Surface((new_width + 4, new_height + 4))
+        pygame.draw.rect(framed, (0, 0, 0), framed.get_rect(), 2)
+        framed.blit(image_scaled, (2, 2))
+        self.photo_cache = (image, framed, (x - 2, y - 2))
+        return framed, (x - 2, y - 2)
+
+    def draw_scaled_image_right(self, image: pygame.Surface) -> None:
+        """Rysuje zdjęcie po prawej stronie, proporcjonalne skalowane i wyśrodkowane."""
+        framed, pos = self.photo_layer(image)
+        self.screen.blit(framed, pos)
+
+    def draw_round(self, map_widget, overlay: tuple[pygame.Surface, tuple[int, int]] = None) -> None:
+        """Rysuje klatkę rundy jako warstwy: nagłówek, zdjęcie, mapa, etykieta i opcjonalna nakładka."""
+        self.poll_photo()
+        self.backend.begin((240, 240, 240))
+        self.backend.layer("header", self.header_surface(), (0, 0))
+
+        if self.current_image_surface:
+            self.backend.layer("photo", *self.photo_layer(self.current_image_surface))
+
+        map_widget.update()
+        if map_widget.visible:
+            self.backend.layer("map", map_widget.render(), map_widget.rect.topleft, map_widget.version)
+            tooltip = map_widget.tooltip()
+            if tooltip:
+                self.backend.layer("tooltip", *tooltip)
+
+        if overlay:
+            self.backend.layer("overlay", *overlay)
+        self.backend.end()
+
+        """Moment, w którym pełne zdjęcie pierwszy raz pojawiło się na ekranie"""
+        if self.photo_visible_at is None and not self.photo_loader.pending:
+            self.photo_visible_at = pygame.time.get_ticks()
 
     def run_single_round(self, map_widget) -> None:
         """Prowadzi jedną rundę gry."""
@@ -567,35 +911,30 @@ class Game:
                 if klikniete:
                     poprawne_woj = self.images[self.current_image]
                     poprawna = self.sprawdz_odpowiedz(self.current_image, klikniete)
+                    self.record_round(self.current_image, klikniete)
 
                     self.current_image_surface = None  
 
                     if poprawna:
                         self.pokaz_feedback('dobrze', poprawne_woj)
+                    elif self.last_points:
+                        self.pokaz_feedback('blisko', poprawne_woj)
                     else:
                         self.pokaz_feedback('zle', poprawne_woj)
 
                     round_running = False
 
-            self.screen.fill((240, 240, 240))
-            self.draw_header()
-
-            if self.current_image_surface:
-                self.draw_scaled_image_right(self.current_image_surface)
-
-            map_widget.update()
-            map_widget.draw(self.screen)
-            pygame.display.flip()
+            self.draw_round(map_widget)
 
     def run_single_round_hard_mode(self, map_widget) -> None:
-        """Prowadzi jedną rundę gry z limitem 5 sekund na odpowiedź."""
+        """Prowadzi jedną rundę gry z limitem 8 sekund na odpowiedź, liczonym od pokazania zdjęcia."""
         round_running = True
-        start_time = pygame.time.get_ticks()  # czas startu w milisekundach
         time_limit = 8000  # 8000 ms = 8 sekund
 
         while round_running:
             current_time = pygame.time.get_ticks()
-            elapsed_time = current_time - start_time
+            start_time = self.photo_visible_at  # czas startu w milisekundach (None - zdjęcie jeszcze się wczytuje)
+            elapsed_time = 0 if start_time is None else current_time - start_time
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -606,11 +945,14 @@ class Game:
                 if klikniete:
                     poprawne_woj = self.images[self.current_image]
                     poprawna = self.sprawdz_odpowiedz(self.current_image, klikniete)
+                    self.record_round(self.current_image, klikniete)
 
                     self.current_image_surface = None  
 
                     if poprawna:
                         self.pokaz_feedback('dobrze', poprawne_woj)
+                    elif self.last_points:
+                        self.pokaz_feedback('blisko', poprawne_woj)
                     else:
                         self.pokaz_feedback('zle', poprawne_woj)
 
@@ -620,6 +962,7 @@ class Game:
             if elapsed_time > time_limit and round_running:
                 poprawne_woj = self.images[self.current_image]
                 self.sprawdz_odpowiedz(self.current_image, None)
+                self.record_round(self.current_image, None)
 
                 self.current_image_surface = None
                 self.pokaz_feedback('czas', poprawne_woj)
@@ -627,40 +970,54 @@ class Game:
                 round_running = False
 
 
-            self.screen.fill((240, 240, 240))
-            self.draw_header()
-
-            if self.current_image_surface:
-                self.draw_scaled_image_right(self.current_image_surface)
-
-            map_widget.update()
-            map_widget.draw(self.screen)
-
             """Rysuje pasek czasu, licznik"""
-        
             remaining_time_sec = max(0, (time_limit - elapsed_time) // 1000)
-            timer_text = FONT.render(f"Czas: {remaining_time_sec}s", True, (0, 100, 0))
-            self.screen.blit(timer_text, (20, 70))
+            timer_text = render_text(FONT, f"Czas: {remaining_time_sec}s", (0, 100, 0))
+            self.draw_round(map_widget, (timer_text, (20, 70)))
 
-            pygame.display.flip()
+    def run_single_round_exact(self, map_widget) -> None:
+        """Prowadzi jedną rundę trybu dokładnego: gracz klika miejsce ze zdjęcia."""
+        round_running = True
+        while round_running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.running = False
+                    self.change_state(GameState.END)
+                    return
+                if (event.type == pygame.MOUSEBUTTONDOWN and event.button == 1
+                        and map_widget.rect.collidepoint(event.pos)):
+                    poprawne_woj = self.images[self.current_image]
+                    self.sprawdz_lokalizacje(self.current_image, map_widget._screen_to_geo(event.pos))
+                    self.record_round(self.current_image, f"{self.last_distance_km:.0f} km")
+                    self.current_image_surface = None
+                    self.pokaz_feedback('odleglosc', poprawne_woj)
+                    round_running = False
+
+            self.draw_round(map_widget)
 
     def sprawdz_odpowiedz(self, zdjecie: str, klikniete_wojewodztwo: str) -> bool:
         """
         Sprawdza, czy kliknięte województwo odpowiada zdjęciu.
+        W trybie 'partial' za sąsiednie lub bliskie województwo dolicza punkty częściowe
+        (odczyt z tablicy RegionMatrix).
         """
         poprawne_wojewodztwo = self.images[zdjecie]
-        if klikniete_wojewodztwo is None:
-            return False
-        if klikniete_wojewodztwo.lower() == poprawne_wojewodztwo:
-            self.score += 1
-            return True
-        return False
-
-    def handle_resultpage(self)-> None:
-        """Wyświetla wynik końcowy i wraca do strony startowej."""
-        self.screen.fill((240, 250, 240))
-        result_text = FONT.render(f"Wynik końcowy: {self.score}/{self.total_rounds}", True, (50, 100, 50))
-        self.screen.blit(result_text, (SCREEN_WIDTH//2 - result_text.get_width()//2, SCREEN_HEIGHT//2 - 50))
+        self.last_points = 0
+        poprawna = klikniete_wojewodztwo is not None and klikniete_wojewodztwo.lower() == poprawne_wojewodztwo
+        if poprawna:
+            self.last_points = 1
+        elif (klikniete_wojewodztwo is not None and self.scoring_mode == "partial"
+              and self.region_matrix is not None):
+            self.last_points = self.region_matrix.points(poprawne_wojewodztwo, klikniete_wojewodztwo)
+        self.score += self.last_points
+        return poprawna
+
+    def render_resultpage(self, surface: pygame.Surface) -> None:
+        """Renderuje warstwę ekranu z wynikiem końcowym."""
+        surface.fill((240, 250, 240))
+        result_y = 30 if self.round_log else SCREEN_HEIGHT//2 - 50
+        result_text = FONT.render(f"Wynik końcowy: {self.score:g}/{self.total_rounds}", True, (50, 100, 50))
+        surface.blit(result_text, (SCREEN_WIDTH//2 - result_text.get_width()//2, result_y))
 
         """ Komentarze do wyniku""" 
         if self.score == self.total_rounds:
@@ -671,10 +1028,72 @@ class Game:
             comment = f"Spróbuj jeszcze raz, {self.player_name}!"
 
         comment_text = SMALL_FONT.render(comment, True, (100, 150, 100))
-        self.screen.blit(comment_text, (SCREEN_WIDTH//2 - comment_text.get_width()//2, SCREEN_HEIGHT//2 + 20))
-        pygame.display.flip()
-        pygame.time.wait(3000)
-        self.change_state(GameState.HOMEPAGE)
+        surface.blit(comment_text, (SCREEN_WIDTH//2 - comment_text.get_width()//2, result_y + 70))
+
+    def review_card_rect(self, index: int) -> pygame.Rect:
+        """Zwraca prostokąt karty rundy w galerii (z uwzględnieniem przewinięcia)."""
+        margin_x = (SCREEN_WIDTH - REVIEW_COLUMNS * REVIEW_CARD_W) // 2
+        row, col = divmod(index, REVIEW_COLUMNS)
+        return pygame.Rect(margin_x + col * REVIEW_CARD_W + 5, REVIEW_TOP + row * REVIEW_CARD_H - self.review_scroll,
+                           REVIEW_CARD_W - 10, REVIEW_CARD_H - 10)
+
+    def max_review_scroll(self) -> int:
+        """Zwraca największe możliwe przewinięcie galerii."""
+        rows = (len(self.round_log) + REVIEW_COLUMNS - 1) // REVIEW_COLUMNS
+        return max(0, rows * REVIEW_CARD_H - (REVIEW_BOTTOM - REVIEW_TOP))
+
+    def draw_review_gallery(self) -> None:
+        """Rysuje widoczne karty rund: miniaturę z atlasu, poprawne województwo i odpowiedź gracza."""
+        self.screen.set_clip(pygame.Rect(0, REVIEW_TOP, SCREEN_WIDTH, REVIEW_BOTTOM - REVIEW_TOP))
+        first = max(0, self.review_scroll // REVIEW_CARD_H) * REVIEW_COLUMNS
+        last = min(len(self.round_log), (self.review_scroll + REVIEW_BOTTOM - REVIEW_TOP) // REVIEW_CARD_H * REVIEW_COLUMNS
+                   + REVIEW_COLUMNS)
+        for i in range(first, last):
+            zdjecie, poprawne, odpowiedz, punkty, indeks = self.round_log[i]
+            card = self.review_card_rect(i)
+            color = (0, 140, 0) if punkty == 1 else ORANGE if punkty else RED
+            pygame.draw.rect(self.screen, WHITE, card, border_radius=8)
+            pygame.draw.rect(self.screen, color, card, 2, border_radius=8)
+            if indeks >= 0:
+                self.review_atlas.draw(self.screen, indeks, (card.centerx - REVIEW_THUMB_SIZE[0] // 2, card.y + 6))
+            self.screen.blit(render_text(REVIEW_FONT, f"{i + 1}. {poprawne}", (50, 100, 50)),
+                             (card.x + 8, card.y + REVIEW_THUMB_SIZE[1] + 10))
+            self.screen.blit(render_text(REVIEW_FONT, f"Odp.: {odpowiedz}", color),
+                             (card.x + 8, card.y + REVIEW_THUMB_SIZE[1] + 32))
+        self.screen.set_clip(None)
+
+    def handle_resultpage(self)-> None:
+        """Wyświetla wynik końcowy z galerią rund i wraca do strony startowej."""
+        scene = self.enter_scene(GameState.RESULTPAGE)
+        scene.invalidate()
+        if not self.round_log:
+            scene.draw(self.screen, pygame.time.get_ticks())
+            self.backend.flip()
+            pygame.time.wait(3000)
+            self.change_state(GameState.HOMEPAGE)
+            return
+
+        menu_btn = pygame.Rect(SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT - 85, 300, 70)
+        while self.state == GameState.RESULTPAGE:
+            scene.draw(self.screen, pygame.time.get_ticks())
+            self.draw_review_gallery()
+            self.draw_button("Menu", menu_btn, GREEN, DARK_GREEN, pygame.mouse.get_pos())
+
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.change_state(GameState.END)
+                    return
+                elif event.type == pygame.MOUSEWHEEL:
+                    self.review_scroll -= event.y * REVIEW_CARD_H // 3
+                elif event.type == pygame.KEYDOWN and event.key in (pygame.K_UP, pygame.K_DOWN):
+                    self.review_scroll += REVIEW_CARD_H if event.key == pygame.K_DOWN else -REVIEW_CARD_H
+                elif ((event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE)
+                      or (event.type == pygame.MOUSEBUTTONDOWN and menu_btn.collidepoint(event.pos))):
+                    self.change_state(GameState.HOMEPAGE)
+                    return
+                self.review_scroll = min(max(0, self.review_scroll), self.max_review_scroll())
+
+            self.backend.flip()
 
     def change_state(self, new_state: GameState) -> None:
         """Zmienia stan gry na nowy."""
@@ -0,0 +1,126 @@
+"""
+Zdjęcia z jednego spakowanego pliku (nieskompresowany zip) odczytywane przez mmap.
+
+Budowanie paczki z folderu zdjęć:
+    python src/asset_pack.py assets/photo_assets assets/photo_assets.zip
+"""
+
+import io
+import mmap
+import os
+import struct
+import sys
+import unicodedata
+import zipfile
+from typing import Dict, List, Tuple
+
+import pygame
+
+_LOCAL_HEADER = struct.Struct("<4s5H3I2H")
+_LOCAL_SIGNATURE = b"PK\x03\x04"
+
+
+class BufferReader(io.RawIOBase):
+    """Plikopodobny obiekt tylko do odczytu nad `memoryview`, bez kopiowania całego bufora."""
+
+    def __init__(self, view: memoryview) -> None:
+        """Przyjmuje widok na dane pliku."""
+        super().__init__()
+        self.view = view
+        self.pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        """Kopiuje do `buffer` tylko tyle bajtów, ile zażądał dekoder."""
+        n = max(0, min(len(buffer), len(self.view) - self.pos))
+        buffer[:n] = self.view[self.pos:self.pos + n]
+        self.pos += n
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self.pos, io.SEEK_END: len(self.view)}[whence]
+        self.pos = max(0, base + offset)
+        return self.pos
+
+    def tell(self) -> int:
+        return self.pos
+
+
+class PhotoPack:
+    """
+    Paczka zdjęć: jeden plik zip (ZIP_STORED) zmapowany w pamięci.
+
+    Indeks (nazwa -> przesunięcie i rozmiar danych) budowany jest raz z katalogu
+    centralnego archiwum; zdjęcia podawane są do `pygame.image.load` jako widoki
+    na zmapowany plik, bez rozpakowywania na dysk. Nazwy są normalizowane do NFC,
+    więc polskie znaki nie zależą od systemu plików.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Otwiera i mapuje paczkę oraz czyta jej indeks."""
+        self.path = path
+        self.file = open(path, "rb")
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.entries: Dict[str, Tuple[int, int]] = {}
+        with zipfile.ZipFile(self.file) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                if info.compress_type != zipfile.ZIP_STORED:
+                    raise ValueError(f"Plik {info.filename} w paczce jest skompresowany")
+                header = _LOCAL_HEADER.unpack_from(self.mm, info.header_offset)
+                if header[0] != _LOCAL_SIGNATURE:
+                    raise ValueError(f"Uszkodzony nagłówek pliku {info.filename}")
+                start = info.header_offset + _LOCAL_HEADER.size + header[9] + header[10]
+                name = unicodedata.normalize("NFC", os.path.basename(info.filename))
+                self.entries[name] = (start, info.file_size)
+
+    def __contains__(self, name: str) -> bool:
+        return unicodedata.normalize("NFC", name) in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def names(self) -> List[str]:
+        """Zwraca nazwy zdjęć w paczce."""
+        return list(self.entries)
+
+    def view(self, name: str) -> memoryview:
+        """Zwraca widok (bez kopii) na bajty zdjęcia w zmapowanym pliku."""
+        start, size = self.entries[unicodedata.normalize("NFC", name)]
+        return memoryview(self.mm)[start:start + size]
+
+    def open(self, name: str) -> BufferReader:
+        """Zwraca plikopodobny obiekt do odczytu zdjęcia."""
+        return BufferReader(self.view(name))
+
+    def load(self, name: str) -> pygame.Surface:
+        """Dekoduje zdjęcie z paczki przez `pygame.image.load`."""
+        return pygame.image.load(self.open(name), name)
+
+    def close(self) -> None:
+        """Zamyka mapowanie i plik (widoki muszą być wcześniej zwolnione)."""
+        self.mm.close()
+        self.file.close()
+
+
+def build_pack(folder: str, out_path: str) -> int:
+    """Pakuje zdjęcia z folderu do nieskompresowanego zipa; zwraca liczbę plików."""
+    names = sorted(n for n in os.listdir(folder) if os.path.isfile(os.path.join(folder, n)))
+    with zipfile.ZipFile(out_path, "w", compression=zipfile.ZIP_STORED) as archive:
+        for name in names:
+            archive.write(os.path.join(folder, name), unicodedata.normalize("NFC", name))
+    return len(names)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print(__doc__)
+        sys.exit(1)
+    count = build_pack(sys.argv[1], sys.argv[2])
+    print(f"Spakowano {count} zdjęć do {sys.argv[2]}")
@@ -0,0 +1,278 @@
+"""
+Wspólny magazyn zasobów tylko do odczytu dla wielu procesów gry na jednej maszynie.
+
+Magazyn to katalog plików .npy (otwieranych przez np.load z mmap_mode='r')
+i manifest.json. Zawiera skompilowaną mapę (łuki, pierścienie, macierze
+regionów, raster trafień, bazową mapę w pikselach) oraz indeks i piksele
+przeskalowanych zdjęć. Pierwszy proces buduje magazyn pod blokadą pliku,
+kolejne tylko mapują pliki, więc strony pamięci dzieli cache systemu plików.
+
+Włączenie: zmienna środowiskowa ZW_ASSET_STORE=<katalog>. Klucz magazynu
+zależy od plików źródłowych i rozmiarów, więc zmiana zasobów tworzy nowy
+podkatalog store_<klucz>; stare można usunąć ręcznie.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pygame
+
+from image_cache import fit_size
+from regions import RegionMatrix
+from topology import Topology
+
+STORE_ENV = "ZW_ASSET_STORE"
+FORMAT_VERSION = 1
+PHOTO_FORMAT = "RGBX"
+LOCK_TIMEOUT = 600.0
+LOCK_POLL = 0.1
+
+try:
+    import fcntl
+
+    def _try_lock(f) -> bool:
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            return False
+
+    def _unlock(f) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+except ImportError:
+    import msvcrt
+
+    def _try_lock(f) -> bool:
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    def _unlock(f) -> None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class FileLock:
+    """
+    Blokada międzyprocesowa na pliku (flock w systemach Unix, msvcrt w Windows).
+
+    Zajęta blokada jest sprawdzana co LOCK_POLL s; po `timeout` sekundach
+    (np. gdy proces budujący magazyn się zawiesił) zgłaszany jest TimeoutError.
+    """
+
+    def __init__(self, path: str, timeout: float = LOCK_TIMEOUT) -> None:
+        self.path = path
+        self.timeout = timeout
+        self.file = None
+
+    def __enter__(self) -> "FileLock":
+        self.file = open(self.path, "a+b")
+        self.file.seek(0)
+        deadline = time.monotonic() + self.timeout
+        while not _try_lock(self.file):
+            if time.monotonic() >= deadline:
+                self.file.close()
+                self.file = None
+                raise TimeoutError(f"Nie udało się zablokować {self.path} w ciągu {self.timeout:g} s")
+            time.sleep(LOCK_POLL)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        _unlock(self.file)
+        self.file.close()
+        self.file = None
+
+
+def _flatten(lines: Sequence[Sequence[Tuple[float, float]]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Zapisuje listę łamanych jako tablicę punktów (n, 2) i przesunięcia (len + 1)."""
+    offsets = np.zeros(len(lines) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(line) for line in lines])
+    points = np.array([p for line in lines for p in line], dtype=np.float64).reshape(-1, 2)
+    return points, offsets
+
+
+def store_key(*parts: object) -> str:
+    """Zwraca krótki skrót opisu źródeł magazynu (ścieżki, czasy modyfikacji, rozmiary)."""
+    text = json.dumps([FORMAT_VERSION, *parts], sort_keys=True, default=str)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def source_signature(path: str) -> List[object]:
+    """Zwraca opis pliku lub katalogu (nazwy, rozmiary, czasy) do klucza magazynu."""
+    if not os.path.exists(path):
+        return [path, None]
+    if os.path.isfile(path):
+        st = os.stat(path)
+        return [os.path.abspath(path), st.st_size, st.st_mtime_ns]
+    entries = []
+    with os.scandir(path) as it:
+        for entry in it:
+            st = entry.stat()
+            entries.append((entry.name, st.st_size, st.st_mtime_ns))
+    return [os.path.abspath(path), sorted(entries)]
+
+
+class AssetStore:
+    """Magazyn zasobów zmapowany w pamięci (tylko do odczytu)."""
+
+    def __init__(self, folder: str) -> None:
+        """Mapuje pliki .npy magazynu i czyta manifest."""
+        self.folder = folder
+        with open(os.path.join(folder, "manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+        self.names: List[str] = manifest["names"]
+        self.region_colors: List[Tuple[int, ...]] = [tuple(c) for c in manifest["region_colors"]]
+        self.colors: List[Tuple[int, ...]] = [tuple(c) for c in manifest["colors"]]
+        self.bbox: Tuple[float, float, float, float] = tuple(manifest["bbox"])
+        self.map_size: Tuple[int, int] = tuple(manifest["map_size"])
+        self.photo_size: Tuple[int, int] = tuple(manifest["photo_size"])
+        self.photo_index: Dict[str, int] = {name: i for i, name in enumerate(manifest["photo_names"])}
+        self.photo_regions: Dict[str, str] = dict(zip(manifest["photo_names"], manifest["photo_regions"]))
+        self.arrays: Dict[str, np.ndarray] = {
+            name[:-4]: np.load(os.path.join(folder, name), mmap_mode="r")
+            for name in os.listdir(folder) if name.endswith(".npy")
+        }
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.photo_index
+
+    @property
+    def hit_raster(self) -> np.ndarray:
+        """Raster trafień (wysokość, szerokość) z numerami województw."""
+        return self.arrays["hit_raster"]
+
+    def topology(self) -> Topology:
+        """Zwraca topologię, której łuki są widokami na zmapowaną tablicę punktów."""
+        points, offsets = self.arrays["arc_points"], self.arrays["arc_offsets"]
+        arcs = [points[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+        refs, ring_offsets, region_offsets = (self.arrays["ring_refs"], self.arrays["ring_offsets"],
+                                              self.arrays["region_offsets"])
+        rings = [
+            [refs[ring_offsets[r]:ring_offsets[r + 1]].tolist()
+             for r in range(region_offsets[k], region_offsets[k + 1])]
+            for k in range(len(region_offsets) - 1)
+        ]
+        return Topology(arcs, rings)
+
+    def screen_arcs(self) -> List[List[Tuple[float, float]]]:
+        """Zwraca łuki uproszczone i przeliczone na piksele widgetu."""
+        points, offsets = self.arrays["screen_points"], self.arrays["screen_offsets"]
+        return [[(float(x), float(y)) for x, y in points[offsets[i]:offsets[i + 1]]]
+                for i in range(len(offsets) - 1)]
+
+    def region_matrix(self) -> RegionMatrix:
+        """Zwraca macierze regionów oparte na zmapowanych tablicach."""
+        return RegionMatrix(self.names, self.arrays["adjacency"], self.arrays["centroid_km"],
+                            self.arrays["border_km"])
+
+    def base_map(self) -> Optional[pygame.Surface]:
+        """Zwraca bazową mapę jako powierzchnię korzystającą bezpośrednio z pikseli magazynu."""
+        pixels = self.arrays.get("base_map")
+        if pixels is None:
+            return None
+        return pygame.image.frombuffer(pixels, self.map_size, "RGBA")
+
+    def photo(self, name: str) -> pygame.Surface:
+        """Zwraca przeskalowane zdjęcie jako powierzchnię na pikselach magazynu (bez kopii)."""
+        i = self.photo_index[name]
+        offsets, sizes = self.arrays["photo_offsets"], self.arrays["photo_sizes"]
+        pixels = self.arrays["photo_pixels"][offsets[i]:offsets[i + 1]]
+        return pygame.image.frombuffer(pixels, (int(sizes[i][0]), int(sizes[i][1])), PHOTO_FORMAT)
+
+
+def build_store(folder: str, widget, photos: Iterable[Tuple[str, str]],
+                opener: Callable[[str], pygame.Surface], photo_size: Tuple[int, int]) -> None:
+    """
+    Zapisuje magazyn do `folder`: mapę z wczytanego widgetu i zdjęcia (nazwa, województwo).
+
+    Zdjęcia dekodowane są przez `opener` i skalowane do `photo_size`; pliki,
+    których nie da się odczytać, są pomijane.
+    """
+    def save(name: str, array: np.ndarray) -> None:
+        np.save(os.path.join(folder, f"{name}.npy"), array)
+
+    arc_points, arc_offsets = _flatten(widget.topology.arcs)
+    save("arc_points", arc_points)
+    save("arc_offsets", arc_offsets)
+    screen_points, screen_offsets = _flatten(widget._get_screen_arcs())
+    save("screen_points", screen_points)
+    save("screen_offsets", screen_offsets)
+
+    rings = [refs for region in widget.topology.rings for refs in region]
+    save("ring_refs", np.array([ref for refs in rings for ref in refs], dtype=np.int64))
+    save("ring_offsets", np.cumsum([0] + [len(refs) for refs in rings]).astype(np.int64))
+    save("region_offsets", np.cumsum([0] + [len(region) for region in widget.topology.rings]).astype(np.int64))
+
+    matrix = widget.region_matrix
+    save("adjacency", matrix.adjacency)
+    save("centroid_km", matrix.centroid_km)
+    save("border_km", matrix.border_km)
+    save("hit_raster", widget.build_hit_raster())
+    base_map = widget.load_baked_map() or widget.rasterize_base_map(widget.supersample)
+    save("base_map", np.frombuffer(pygame.image.tobytes(base_map, "RGBA"), dtype=np.uint8))
+
+    photo_names, photo_regions, sizes, chunks, offsets = [], [], [], [], [0]
+    for name, region in photos:
+        try:
+            image = opener(name)
+        except (pygame.error, OSError) as e:
+            print(f"Ostrzeżenie: pomijam zdjęcie {name} w magazynie: {e}")
+            continue
+        if image.get_bitsize() not in (24, 32):
+            image = image.convert(24)
+        scaled = pygame.transform.smoothscale(image, fit_size(image.get_size(), photo_size))
+        data = pygame.image.tobytes(scaled, PHOTO_FORMAT)
+        photo_names.append(name)
+        photo_regions.append(region)
+        sizes.append(scaled.get_size())
+        chunks.append(np.frombuffer(data, dtype=np.uint8))
+        offsets.append(offsets[-1] + len(data))
+    save("photo_pixels", np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.uint8))
+    save("photo_offsets", np.array(offsets, dtype=np.int64))
+    save("photo_sizes", np.array(sizes, dtype=np.int32).reshape(-1, 2))
+
+    manifest = {
+        "version": FORMAT_VERSION,
+        "names": [v['name'] for v in widget.voivodeships],
+        "region_colors": [list(v['color']) for v in widget.voivodeships],
+        "colors": [list(c) for c in widget.colors],
+        "bbox": [widget.min_x, widget.min_y, widget.max_x, widget.max_y],
+        "map_size": list(widget.rect.size),
+        "photo_size": list(photo_size),
+        "photo_names": photo_names,
+        "photo_regions": photo_regions,
+    }
+    with open(os.path.join(folder, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+
+
+def open_store(root: str, key: str, build: Callable[[str], None]) -> AssetStore:
+    """
+    Mapuje magazyn `root/store_<key>`, budując go wcześniej, jeśli jeszcze nie istnieje.
+
+    Budowa odbywa się pod blokadą pliku w katalogu tymczasowym, który na końcu
+    jest przemianowany, więc inne procesy widzą magazyn dopiero kompletny.
+    """
+    folder = os.path.join(root, f"store_{key}")
+    manifest = os.path.join(folder, "manifest.json")
+    if not os.path.exists(manifest):
+        os.makedirs(root, exist_ok=True)
+        with FileLock(folder + ".lock"):
+            if not os.path.exists(manifest):
+                tmp = f"{folder}.tmp{os.getpid()}"
+                shutil.rmtree(tmp, ignore_errors=True)
+                os.makedirs(tmp)
+                try:
+                    build(tmp)
+                    os.replace(tmp, folder)
+                except BaseException:
+                    shutil.rmtree(tmp, ignore_errors=True)
+                    raise
+    return AssetStore(folder)
@@ -0,0 +1,70 @@
+"""Atlas miniatur: wiele małych obrazów w jednej powierzchni, rysowanych jako wycinki."""
+
+from typing import List, Optional, Tuple
+
+import pygame
+
+from image_cache import fit_size
+
+
+class ThumbnailAtlas:
+    """
+    Jedna powierzchnia podzielona na komórki `cell_size` w `columns` kolumnach.
+
+    Każdy dodany obraz jest zmniejszany do komórki i kopiowany do atlasu, a
+    zwracany prostokąt służy potem jako `area` w `blit`. Gdy miejsce się
+    skończy, liczba wierszy jest podwajana (stare miniatury kopiowane są raz).
+    """
+
+    def __init__(self, cell_size: Tuple[int, int], columns: int = 8, rows: int = 2) -> None:
+        """Tworzy pusty atlas o `columns` x `rows` komórkach."""
+        self.cell_size = cell_size
+        self.columns = columns
+        self.rows = rows
+        self.surface: pygame.Surface = self._new_surface(rows)
+        self.rects: List[pygame.Rect] = []
+
+    def _new_surface(self, rows: int) -> pygame.Surface:
+        """Zwraca przezroczystą powierzchnię na `rows` wierszy komórek."""
+        surface = pygame.Surface((self.columns * self.cell_size[0], rows * self.cell_size[1]), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+        return surface
+
+    def __len__(self) -> int:
+        return len(self.rects)
+
+    def add(self, image: pygame.Surface) -> pygame.Rect:
+        """Kopiuje zmniejszony obraz do kolejnej komórki; zwraca jego prostokąt w atlasie."""
+        index = len(self.rects)
+        if index >= self.columns * self.rows:
+            grown = self._new_surface(self.rows * 2)
+            grown.blit(self.surface, (0, 0))
+            self.surface = grown
+            self.rows *= 2
+        cell_w, cell_h = self.cell_size
+        size = fit_size(image.get_size(), self.cell_size)
+        if image.get_bitsize() not in (24, 32):
+            image = image.convert(24)
+        thumb = pygame.transform.smoothscale(image, size)
+        x = (index % self.columns) * cell_w + (cell_w - size[0]) // 2
+        y = (index // self.columns) * cell_h + (cell_h - size[1]) // 2
+        rect = pygame.Rect((x, y), size)
+        self.surface.blit(thumb, rect)
+        self.rects.append(rect)
+        return rect
+
+    def get(self, index: int) -> Optional[pygame.Rect]:
+        """Zwraca prostokąt miniatury o podanym numerze (lub None)."""
+        return self.rects[index] if 0 <= index < len(self.rects) else None
+
+    def draw(self, target: pygame.Surface, index: int, pos: Tuple[int, int]) -> None:
+        """Rysuje miniaturę z atlasu na `target` (lewy górny róg komórki w `pos`)."""
+        rect = self.rects[index]
+        cell_x = rect.x - rect.x % self.cell_size[0]
+        cell_y = rect.y - rect.y % self.cell_size[1]
+        target.blit(self.surface, (pos[0] + rect.x - cell_x, pos[1] + rect.y - cell_y), area=rect)
+
+    def clear(self) -> None:
+        """Usuwa miniatury, zachowując przydzieloną powierzchnię do ponownego użycia."""
+        self.surface.fill((0, 0, 0, 0))
+        self.rects = []
@@ -14,3 +14,4 @@ class GameState(Enum):
     DIFFICULTY_SELECT = auto()
     HARDMODE_INSTRUCTION = auto()
     GAMEPAGE_HARD_MODE = auto()
+    GAMEPAGE_EXACT = auto()
@@ -0,0 +1,85 @@
+"""Przeliczenia współrzędnych: układ PUWG 1992 (EPSG:2180) <-> WGS84 oraz odległości."""
+
+import numpy as np
+
+"""Parametry układu ETRS89 / Poland CS92 (z pliku wojewodztwa.prj)"""
+A = 6378137.0
+F = 1 / 298.257222101
+K0 = 0.9993
+LON0 = np.radians(19.0)
+FALSE_EASTING = 500000.0
+FALSE_NORTHING = -5300000.0
+EARTH_RADIUS_KM = 6371.0088
+
+E2 = F * (2 - F)
+EP2 = E2 / (1 - E2)
+
+
+def _meridian_arc(phi: np.ndarray) -> np.ndarray:
+    """Długość łuku południka od równika do szerokości `phi` (w metrach)."""
+    return A * (
+        (1 - E2 / 4 - 3 * E2**2 / 64 - 5 * E2**3 / 256) * phi
+        - (3 * E2 / 8 + 3 * E2**2 / 32 + 45 * E2**3 / 1024) * np.sin(2 * phi)
+        + (15 * E2**2 / 256 + 45 * E2**3 / 1024) * np.sin(4 * phi)
+        - (35 * E2**3 / 3072) * np.sin(6 * phi)
+    )
+
+
+def wgs84_to_puwg1992(lat, lon):
+    """Przelicza szerokość i długość geograficzną (stopnie) na x, y w PUWG 1992 (metry)."""
+    phi = np.radians(np.asarray(lat, dtype=np.float64))
+    lam = np.radians(np.asarray(lon, dtype=np.float64))
+    n = A / np.sqrt(1 - E2 * np.sin(phi)**2)
+    t = np.tan(phi)**2
+    c = EP2 * np.cos(phi)**2
+    a = (lam - LON0) * np.cos(phi)
+    x = FALSE_EASTING + K0 * n * (
+        a + (1 - t + c) * a**3 / 6 + (5 - 18 * t + t**2 + 72 * c - 58 * EP2) * a**5 / 120
+    )
+    y = FALSE_NORTHING + K0 * (
+        _meridian_arc(phi) + n * np.tan(phi) * (
+            a**2 / 2 + (5 - t + 9 * c + 4 * c**2) * a**4 / 24
+            + (61 - 58 * t + t**2 + 600 * c - 330 * EP2) * a**6 / 720
+        )
+    )
+    return x, y
+
+
+def puwg1992_to_wgs84(x, y):
+    """Przelicza współrzędne PUWG 1992 (metry) na szerokość i długość geograficzną (stopnie)."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    m = (y - FALSE_NORTHING) / K0
+    mu = m / (A * (1 - E2 / 4 - 3 * E2**2 / 64 - 5 * E2**3 / 256))
+    e1 = (1 - np.sqrt(1 - E2)) / (1 + np.sqrt(1 - E2))
+    phi1 = (
+        mu + (3 * e1 / 2 - 27 * e1**3 / 32) * np.sin(2 * mu)
+        + (21 * e1**2 / 16 - 55 * e1**4 / 32) * np.sin(4 * mu)
+        + (151 * e1**3 / 96) * np.sin(6 * mu)
+        + (1097 * e1**4 / 512) * np.sin(8 * mu)
+    )
+    sin1 = np.sin(phi1)
+    n1 = A / np.sqrt(1 - E2 * sin1**2)
+    r1 = A * (1 - E2) / (1 - E2 * sin1**2)**1.5
+    t1 = np.tan(phi1)**2
+    c1 = EP2 * np.cos(phi1)**2
+    d = (x - FALSE_EASTING) / (n1 * K0)
+    lat = phi1 - (n1 * np.tan(phi1) / r1) * (
+        d**2 / 2 - (5 + 3 * t1 + 10 * c1 - 4 * c1**2 - 9 * EP2) * d**4 / 24
+        + (61 + 90 * t1 + 298 * c1 + 45 * t1**2 - 252 * EP2 - 3 * c1**2) * d**6 / 720
+    )
+    lon = LON0 + (
+        d - (1 + 2 * t1 + c1) * d**3 / 6
+        + (5 - 2 * c1 + 28 * t1 - 3 * c1**2 + 8 * EP2 + 24 * t1**2) * d**5 / 120
+    ) / np.cos(phi1)
+    return np.degrees(lat), np.degrees(lon)
+
+
+def haversine_km(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Odległość po kole wielkim (km) między punktami; działa na tablicach numpy."""
+    phi1 = np.radians(lat1)
+    phi2 = np.radians(lat2)
+    dphi = phi2 - phi1
+    dlam = np.radians(np.asarray(lon2, dtype=np.float64) - lon1)
+    h = np.sin(dphi / 2)**2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlam / 2)**2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(h))
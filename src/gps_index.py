@@ -0,0 +1,216 @@
+"""Indeks współrzędnych GPS zdjęć (z EXIF lub pliku z współrzędnymi) i ocena odległości."""
+
+import csv
+import os
+import struct
+import unicodedata
+from typing import BinaryIO, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from geo import haversine_km
+
+"""Punktacja trybu dokładnego: 1 pkt za trafienie, 0 pkt od EXACT_MAX_KM wzwyż"""
+EXACT_MAX_KM = 300.0
+
+_GPS_IFD_TAG = 0x8825
+_TYPE_SIZES = {1: 1, 2: 1, 3: 2, 4: 4, 5: 8, 7: 1, 9: 4, 10: 8}
+
+
+def _read_ifd(tiff: bytes, offset: int, endian: str) -> Dict[int, Tuple[int, int, int]]:
+    """Czyta katalog IFD: tag -> (typ, liczba, przesunięcie wartości względem TIFF)."""
+    (count,) = struct.unpack_from(endian + "H", tiff, offset)
+    entries = {}
+    for k in range(count):
+        pos = offset + 2 + 12 * k
+        tag, typ, n = struct.unpack_from(endian + "HHI", tiff, pos)
+        size = _TYPE_SIZES.get(typ, 1) * n
+        value_pos = pos + 8
+        if size > 4:
+            (value_pos,) = struct.unpack_from(endian + "I", tiff, pos + 8)
+        entries[tag] = (typ, n, value_pos)
+    return entries
+
+
+def _read_rationals(tiff: bytes, entry: Tuple[int, int, int], endian: str) -> List[float]:
+    """Odczytuje wartości typu RATIONAL (licznik/mianownik)."""
+    _, n, pos = entry
+    values = struct.unpack_from(endian + "I" * (2 * n), tiff, pos)
+    return [num / den if den else 0.0 for num, den in zip(values[::2], values[1::2])]
+
+
+def _parse_exif_gps(tiff: bytes) -> Optional[Tuple[float, float]]:
+    """Wyciąga szerokość i długość geograficzną z bloku TIFF/EXIF."""
+    endian = {b"II": "<", b"MM": ">"}.get(tiff[:2])
+    if endian is None:
+        return None
+    (ifd0,) = struct.unpack_from(endian + "I", tiff, 4)
+    ifd = _read_ifd(tiff, ifd0, endian)
+    if _GPS_IFD_TAG not in ifd:
+        return None
+    (gps_offset,) = struct.unpack_from(endian + "I", tiff, ifd[_GPS_IFD_TAG][2])
+    gps = _read_ifd(tiff, gps_offset, endian)
+    if not all(tag in gps for tag in (1, 2, 3, 4)):
+        return None
+    coords = []
+    for ref_tag, value_tag, negative in ((1, 2, b"S"), (3, 4, b"W")):
+        d, m, s = _read_rationals(tiff, gps[value_tag], endian)
+        value = d + m / 60 + s / 3600
+        if tiff[gps[ref_tag][2]:gps[ref_tag][2] + 1] == negative:
+            value = -value
+        coords.append(value)
+    return coords[0], coords[1]
+
+
+def _read_jpeg_gps(f: BinaryIO) -> Optional[Tuple[float, float]]:
+    """Przegląda segmenty JPEG do pierwszego bloku EXIF i czyta z niego GPS."""
+    if f.read(2) != b"\xff\xd8":
+        return None
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF or marker[1] in (0xD9, 0xDA):
+            return None
+        (length,) = struct.unpack(">H", f.read(2))
+        if marker[1] == 0xE1:
+            segment = f.read(length - 2)
+            if segment.startswith(b"Exif\x00\x00"):
+                return _parse_exif_gps(segment[6:])
+        else:
+            f.seek(length - 2, os.SEEK_CUR)
+
+
+def read_exif_gps(source: "str | BinaryIO") -> Optional[Tuple[float, float]]:
+    """Zwraca (szerokość, długość) z EXIF pliku JPEG (ścieżka lub plik) lub None."""
+    try:
+        if isinstance(source, str):
+            with open(source, "rb") as f:
+                return _read_jpeg_gps(f)
+        return _read_jpeg_gps(source)
+    except (OSError, struct.error, ValueError):
+        return None
+
+
+def exact_points(distance_km) -> np.ndarray:
+    """Przelicza odległość (km) na punkty: liniowo od 1 do 0 na EXACT_MAX_KM."""
+    return np.clip(1.0 - np.asarray(distance_km) / EXACT_MAX_KM, 0.0, 1.0)
+
+
+class GpsIndex:
+    """Zwarty indeks: nazwy zdjęć i tablica (n, 2) float64 ze współrzędnymi w stopniach."""
+
+    def __init__(self, names: Sequence[str], coords: np.ndarray) -> None:
+        """Przyjmuje nazwy plików i odpowiadające im współrzędne (szerokość, długość)."""
+        self.names: List[str] = list(names)
+        self.coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        self.positions: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.positions
+
+    def get(self, name: str) -> Optional[Tuple[float, float]]:
+        """Zwraca współrzędne zdjęcia albo None."""
+        i = self.positions.get(name)
+        if i is None:
+            return None
+        return float(self.coords[i, 0]), float(self.coords[i, 1])
+
+    @classmethod
+    def build(cls, folder: str, sidecar: Optional[str] = None) -> "GpsIndex":
+        """
+        Buduje indeks dla zdjęć z folderu.
+
+        Współrzędne z pliku CSV (nazwa, szerokość, długość) mają pierwszeństwo;
+        dla pozostałych plików odczytywany jest EXIF.
+        """
+        return cls.build_from(sorted(os.listdir(folder)),
+                              lambda name: open(os.path.join(folder, name), "rb"), sidecar)
+
+    @classmethod
+    def build_from(cls, names: Iterable[str], opener: Callable[[str], BinaryIO],
+                   sidecar: Optional[str] = None) -> "GpsIndex":
+        """Buduje indeks dla podanych nazw, otwierając pliki funkcją `opener` (np. z paczki)."""
+        known = read_sidecar(sidecar) if sidecar and os.path.exists(sidecar) else {}
+        indexed, coords = [], []
+        for name in names:
+            position = known.get(unicodedata.normalize("NFC", name))
+            if position is None:
+                try:
+                    with opener(name) as f:
+                        position = read_exif_gps(f)
+                except OSError:
+                    position = None
+            if position is not None:
+                indexed.append(name)
+                coords.append(position)
+        return cls(indexed, np.array(coords, dtype=np.float64))
+
+    def updated(self, added: "GpsIndex", removed: Iterable[str]) -> "GpsIndex":
+        """Zwraca nowy indeks bez usuniętych nazw, uzupełniony o indeks dodanych zdjęć."""
+        dropped = set(removed) | set(added.names)
+        keep = [i for i, name in enumerate(self.names) if name not in dropped]
+        return GpsIndex([self.names[i] for i in keep] + added.names,
+                        np.concatenate([self.coords[keep], added.coords]))
+
+    def save(self, path: str) -> None:
+        """Zapisuje indeks do pliku .npz."""
+        np.savez(path, names=np.array(self.names), coords=self.coords)
+
+    @classmethod
+    def load(cls, path: str) -> "GpsIndex":
+        """Wczytuje indeks zapisany przez `save`."""
+        with np.load(path) as data:
+            return cls([str(name) for name in data["names"]], data["coords"])
+
+    def distances_km(self, names: Sequence[str], lats, lons) -> np.ndarray:
+        """Zwraca odległości (km) kliknięć od miejsc zdjęć; zdjęcia spoza indeksu dają NaN."""
+        rows = np.array([self.positions.get(name, -1) for name in names], dtype=np.intp)
+        distances = np.full(len(rows), np.nan)
+        valid = rows >= 0
+        if valid.any():
+            target = self.coords[rows[valid]]
+            lats = np.asarray(lats, dtype=np.float64)[valid]
+            lons = np.asarray(lons, dtype=np.float64)[valid]
+            distances[valid] = haversine_km(target[:, 0], target[:, 1], lats, lons)
+        return distances
+
+    def score(self, names: Sequence[str], lats, lons) -> np.ndarray:
+        """Zwraca punkty za kliknięcia (wektorowo); zdjęcia spoza indeksu dają 0."""
+        return np.nan_to_num(exact_points(self.distances_km(names, lats, lons)), nan=0.0)
+
+    def score_log(self, path: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Ocenia cały zapis gry (CSV: zdjęcie, szerokość, długość) bez uruchamiania GUI."""
+        names, lats, lons = [], [], []
+        for row in _read_rows(path):
+            names.append(row[0])
+            lats.append(float(row[1]))
+            lons.append(float(row[2]))
+        distances = self.distances_km(names, lats, lons)
+        return distances, np.nan_to_num(exact_points(distances), nan=0.0)
+
+
+def _read_rows(path: str) -> Iterable[List[str]]:
+    """Czyta wiersze CSV, pomijając nagłówek i puste linie."""
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            if len(row) < 3 or row[0] == "zdjecie":
+                continue
+            yield row
+
+
+def read_sidecar(path: str) -> Dict[str, Tuple[float, float]]:
+    """Czyta plik CSV ze współrzędnymi zdjęć (zdjecie, szerokosc, dlugosc)."""
+    return {
+        unicodedata.normalize("NFC", row[0]): (float(row[1]), float(row[2]))
+        for row in _read_rows(path)
+    }
+
+
+def write_log(path: str, rows: Iterable[Tuple[str, float, float]]) -> None:
+    """Zapisuje zapis gry trybu dokładnego w formacie czytanym przez `score_log`."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["zdjecie", "szerokosc", "dlugosc"])
+        writer.writerows(rows)
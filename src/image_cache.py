@@ -0,0 +1,103 @@
+"""Pamięć podręczna zdekodowanych i przeskalowanych zdjęć z limitem bajtów (LRU)."""
+
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+import pygame
+
+CacheKey = Tuple[str, Tuple[int, int]]
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Zwraca rozmiar pikseli powierzchni w bajtach."""
+    return surface.get_pitch() * surface.get_height()
+
+
+def fit_size(size: Tuple[int, int], max_size: Tuple[int, int]) -> Tuple[int, int]:
+    """Zwraca rozmiar proporcjonalnie dopasowany do prostokąta `max_size`."""
+    w, h = size
+    scale = min(max_size[0] / w, max_size[1] / h)
+    return int(w * scale), int(h * scale)
+
+
+class ImageCache:
+    """
+    Pamięć podręczna przed `pygame.image.load`.
+
+    Kluczem jest ścieżka i docelowy prostokąt, wartością gotowa, przeskalowana
+    powierzchnia. Po przekroczeniu budżetu usuwane są najdawniej używane wpisy.
+    """
+
+    def __init__(self, budget_bytes: int,
+                 loader: Optional[Callable[[str], pygame.Surface]] = None) -> None:
+        """Tworzy pustą pamięć z budżetem w bajtach i opcjonalną funkcją wczytującą."""
+        self.budget_bytes = budget_bytes
+        self.loader = loader
+        self.entries: "OrderedDict[CacheKey, pygame.Surface]" = OrderedDict()
+        self.resident_bytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Udział trafień we wszystkich zapytaniach (0.0, gdy brak zapytań)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        return key in self.entries
+
+    def load(self, path: str) -> pygame.Surface:
+        """Dekoduje plik funkcją `loader` albo `pygame.image.load`."""
+        if self.loader is not None:
+            return self.loader(path)
+        return pygame.image.load(path)
+
+    def get(self, path: str, max_size: Tuple[int, int]) -> pygame.Surface:
+        """Zwraca zdjęcie dopasowane do `max_size`, dekodując je tylko przy chybieniu."""
+        key = (path, max_size)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.decode(path, max_size)
+        self.put(key, surface)
+        return surface
+
+    def decode(self, path: str, max_size: Tuple[int, int]) -> pygame.Surface:
+        """Dekoduje i skaluje zdjęcie bez zmiany stanu pamięci (można wołać z innego wątku)."""
+        decoded = self.load(path)
+        if pygame.display.get_surface() is not None:
+            decoded = decoded.convert_alpha()
+        surface = pygame.transform.smoothscale(decoded, fit_size(decoded.get_size(), max_size))
+        del decoded
+        return surface
+
+    def put(self, key: CacheKey, surface: pygame.Surface) -> None:
+        """Dodaje powierzchnię i usuwa najstarsze wpisy ponad budżet."""
+        size = surface_bytes(surface)
+        if size > self.budget_bytes:
+            return
+        if key in self.entries:
+            self.resident_bytes -= surface_bytes(self.entries.pop(key))
+        self.entries[key] = surface
+        self.resident_bytes += size
+        while self.resident_bytes > self.budget_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.resident_bytes -= surface_bytes(evicted)
+
+    def discard(self, path: str) -> None:
+        """Usuwa wszystkie wpisy dla danej ścieżki (np. gdy plik zniknął)."""
+        for key in [k for k in self.entries if k[0] == path]:
+            self.resident_bytes -= surface_bytes(self.entries.pop(key))
+
+    def clear(self) -> None:
+        """Opróżnia pamięć podręczną (statystyki trafień pozostają)."""
+        self.entries.clear()
+        self.resident_bytes = 0
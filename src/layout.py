@@ -0,0 +1,11 @@
+"""Układ ekranu gry: rozmiar okna i położenie mapy (bez zależności od pygame)."""
+
+SCREEN_WIDTH, SCREEN_HEIGHT = 1280, 720
+HEADER_HEIGHT = 60
+MAP_MARGIN = 50
+
+
+def map_rect(screen_width: int, screen_height: int) -> tuple[int, int, int, int]:
+    """Zwraca położenie i rozmiar mapy (x, y, szerokość, wysokość) dla rozmiaru ekranu."""
+    return (MAP_MARGIN, HEADER_HEIGHT + MAP_MARGIN,
+            screen_width // 2 - 2*MAP_MARGIN, screen_height - HEADER_HEIGHT - 2*MAP_MARGIN)
@@ -1,15 +1,40 @@
+import os
+import numpy as np
 import pygame
 import shapefile
-from shapely.geometry import Polygon, Point
+from shapely.geometry import Polygon
 from shapely.prepared import prep
 from typing import List, Optional, Tuple, Dict, Any
+from topology import Topology
+from regions import RegionMatrix
+from asset_store import AssetStore
+
+SUPERSAMPLE = 4
+
+
+def baked_map_path(folder: str, size: Tuple[int, int]) -> str:
+    """Zwraca ścieżkę wypalonego obrazu bazowej mapy dla rozmiaru widgetu."""
+    return os.path.join(folder, f"mapa_{size[0]}x{size[1]}.png")
 
 class PolandMapWidget:
     """Widget wyświetlający interaktywną mapę Polski na podstawie pliku .shp."""
 
-    def __init__(self, x: int, y: int, width: int, height: int, shapefile_path: str) -> None:
-        """Inicjalizuje widget mapy Polski i ładuje dane z `.shp`."""
+    def __init__(self, x: int, y: int, width: int, height: int, shapefile_path: str,
+                 supersample: int = SUPERSAMPLE, baked_folder: Optional[str] = None,
+                 store: Optional[AssetStore] = None) -> None:
+        """
+        Inicjalizuje widget mapy Polski i ładuje dane z `.shp`.
+
+        Bazowa mapa jest rysowana w `supersample`-krotnej rozdzielczości i zmniejszana
+        (wygładzone granice); jeśli w `baked_folder` jest aktualny obraz dla tego
+        rozmiaru (zob. map_bake.py), zostaje on wczytany zamiast rysowania.
+        Z podanym `store` (asset_store.AssetStore) geometria, raster trafień i
+        bazowa mapa są mapowane ze wspólnego magazynu, a `.shp` nie jest czytany.
+        """
         self.rect = pygame.Rect(x, y, width, height)
+        self.shapefile_path = shapefile_path
+        self.supersample = supersample
+        self.baked_folder = baked_folder
         self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
         self.visible: bool = True
         self.active: bool = True
@@ -19,12 +44,41 @@ class PolandMapWidget:
         self.last_mouse_pos: Optional[Tuple[int, int]] = None
         self.cache_surface: Optional[pygame.Surface] = None
         self.needs_redraw: bool = True
+        self.version: int = 0
+        self.tooltip_font: Optional[pygame.font.Font] = None
+        self.tooltip_labels: Dict[str, pygame.Surface] = {}
 
         self.voivodeships: List[Dict[str, Any]] = []
+        self.topology: Topology = Topology([], [])
+        self.screen_arcs: Optional[List[List[Tuple[float, float]]]] = None
+        self.region_matrix: Optional[RegionMatrix] = None
+        self.hit_raster: Optional[np.ndarray] = None
         self.colors: List[Tuple[int, int, int, int]] = []
         self.min_x = self.max_x = self.min_y = self.max_y = 0.0
 
-        self.load_shapefile(shapefile_path)
+        if store is not None:
+            self.load_store(store)
+        else:
+            self.load_shapefile(shapefile_path)
+
+    def load_store(self, store: AssetStore) -> None:
+        """Przejmuje skompilowaną mapę z magazynu zasobów (bez kopiowania tablic)."""
+        self.min_x, self.min_y, self.max_x, self.max_y = store.bbox
+        self.colors = store.colors
+        self.topology = store.topology()
+        self.screen_arcs = store.screen_arcs()
+        self.region_matrix = store.region_matrix()
+        self.hit_raster = store.hit_raster
+        self.cache_surface = store.base_map()
+        for name, color, arc_rings in zip(store.names, store.region_colors, self.topology.rings):
+            self.voivodeships.append({
+                'name': name,
+                'polygons': [],
+                'prepared_polygons': [],
+                'color': color,
+                'hover_color': tuple(min(255, c + 50) if idx < 3 else c for idx, c in enumerate(color)),
+                'arc_rings': arc_rings,
+            })
 
     def load_shapefile(self, path: str) -> None:
         """Ładuje dane mapy z pliku shapefile."""
@@ -52,13 +106,16 @@ class PolandMapWidget:
             (153, 153, 255, 150), (153, 51, 102, 150),
         ]
 
+        regions_rings = []
         for i, (shape, record) in enumerate(zip(shapes, records)):
             name = record[4] if len(record) > 4 else f"Województwo {i+1}"
             polygons = []
             prepared_polygons = []
+            rings = []
             parts = list(shape.parts) + [len(shape.points)]
             for j in range(len(parts) - 1):
                 pts = shape.points[parts[j]:parts[j+1]]
+                rings.append(pts)
                 poly = Polygon(pts)
                 polygons.append(poly)
                 prepared_polygons.append(prep(poly))
@@ -73,6 +130,20 @@ class PolandMapWidget:
                 'color': color,
                 'hover_color': hover_color,
             })
+            regions_rings.append(rings)
+
+        """Wspólne granice sąsiednich województw zapisywane są raz, jako łuki"""
+        self.topology = Topology.build(regions_rings)
+        for v, arc_rings in zip(self.voivodeships, self.topology.rings):
+            v['arc_rings'] = arc_rings
+        self.screen_arcs = None
+
+        """Sąsiedztwo i odległości liczone raz, przy wczytaniu mapy"""
+        self.region_matrix = RegionMatrix.build(
+            [v['name'] for v in self.voivodeships],
+            [v['polygons'] for v in self.voivodeships],
+            self.topology,
+        )
 
     def update(self) -> None:
         """Aktualizuje stan mapy (obsługa efektu najechania myszą)."""
@@ -91,57 +162,61 @@ class PolandMapWidget:
                 self.needs_redraw = True
             return
 
-        geo_x, geo_y = self._screen_to_geo(mouse)
-        pt = Point(geo_x, geo_y)
-
-        hovered = next(
-            (v for v in self.voivodeships
-             if any(pp.contains(pt) for pp in v['prepared_polygons'])),
-            None
-        )
+        hovered = self._region_at(mouse)
         if hovered != self.hovered_voivodeship:
             self.hovered_voivodeship = hovered
             self.needs_redraw = True
 
-    def draw(self, screen: pygame.Surface) -> None:
-        """Rysuje mapę na podanym ekranie."""
-        if not self.visible:
-            return
+    def reset(self) -> None:
+        """Czyści podświetlenie i zaznaczenie (między rundami i grami); bazowa mapa zostaje."""
+        if self.hovered_voivodeship or self.selected_voivodeship:
+            self.needs_redraw = True
+        self.hovered_voivodeship = None
+        self.selected_voivodeship = None
+        self.last_mouse_pos = None
 
+    def render(self) -> pygame.Surface:
+        """Odświeża powierzchnię mapy, jeśli coś się zmieniło; zwiększa wtedy `version`."""
         if self.needs_redraw or self.cache_surface is None:
             if self.cache_surface is None:
-                self.cache_surface = pygame.Surface(
-                    (self.rect.width, self.rect.height), pygame.SRCALPHA
-                )
-                self._draw_base_map()
+                self.cache_surface = self.load_baked_map() or self.rasterize_base_map(self.supersample)
             self.surface.blit(self.cache_surface, (0, 0))
             self._draw_overlays()
             self.needs_redraw = False
+            self.version += 1
+        return self.surface
 
-        screen.blit(self.surface, self.rect)
+    def tooltip(self) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Zwraca etykietę z nazwą województwa pod kursorem i jej pozycję (lub None)."""
+        if not self.hovered_voivodeship:
+            return None
+        name = self.hovered_voivodeship['name']
+        label = self.tooltip_labels.get(name)
+        padding = 4
+        if label is None:
+            if self.tooltip_font is None:
+                self.tooltip_font = pygame.font.SysFont("Arial", 18, bold=False)
+            text = self.tooltip_font.render(name, True, (0, 0, 0))
+            label = pygame.Surface((text.get_width() + 2 * padding, text.get_height() + 2 * padding))
+            label.fill((255, 255, 255))
+            label.blit(text, (padding, padding))
+            self.tooltip_labels[name] = label
 
-        if self.hovered_voivodeship:
-            font = pygame.font.SysFont("Arial", 18, bold=False)
-            label = font.render(self.hovered_voivodeship['name'], True, (0, 0, 0))
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            padding = 4
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        background_x = max(0, mouse_x + 15 - padding)
+        background_y = max(0, mouse_y + 10 - padding)
+        return label, (background_x, background_y)
 
-            background_x = mouse_x + 15 - padding
-            background_y = mouse_y + 10 - padding
+    def draw(self, screen: pygame.Surface) -> None:
+        """Rysuje mapę na podanym ekranie."""
+        if not self.visible:
+            return
 
-            if background_x < 0:
-                background_x = 0
-            if background_y < 0:
-                background_y = 0
+        screen.blit(self.render(), self.rect)
 
-            background_rect = pygame.Rect(
-                background_x,
-                background_y,
-                label.get_width() + 2 * padding,
-                label.get_height() + 2 * padding
-            )
-            pygame.draw.rect(screen, (255, 255, 255), background_rect)
-            screen.blit(label, (mouse_x + 15, mouse_y + 10))
+        tooltip = self.tooltip()
+        if tooltip:
+            screen.blit(*tooltip)
 
     def handle_event(self, event: pygame.event.Event) -> Optional[str]:
         """Obsługuje zdarzenia Pygame (kliknięcia)."""
@@ -155,20 +230,37 @@ class PolandMapWidget:
 
     def handle_click(self, pos: Tuple[int, int]) -> Optional[str]:
         """Obsługuje kliknięcie na mapie, zwraca nazwę województwa lub None."""
-        geo_x, geo_y = self._screen_to_geo((pos[0] + self.rect.x, pos[1] + self.rect.y))
-        pt = Point(geo_x, geo_y)
-
-        for v in self.voivodeships:
-            if any(pp.contains(pt) for pp in v['prepared_polygons']):
-                self.selected_voivodeship = v
-                print(f"Kliknięto: {v['name']}")
-                self.needs_redraw = True
-                return v['name']
+        # Ten sam raster trafień co przy najechaniu, więc punktowane jest podświetlone województwo
+        clicked = self._region_at((pos[0] + self.rect.x, pos[1] + self.rect.y))
+        if clicked is not None:
+            self.selected_voivodeship = clicked
+            print(f"Kliknięto: {clicked['name']}")
+            self.needs_redraw = True
+            return clicked['name']
 
         self.selected_voivodeship = None
         self.needs_redraw = True
         return None
 
+    def build_hit_raster(self) -> np.ndarray:
+        """Zwraca tablicę (wysokość, szerokość) z numerem województwa w każdym pikselu (255 - poza mapą)."""
+        surface = pygame.Surface(self.rect.size)
+        surface.fill((255, 0, 0))
+        for i, v in enumerate(self.voivodeships[:255]):
+            for pts in self._region_rings(v):
+                pygame.draw.polygon(surface, (i, 0, 0), pts)
+        return np.ascontiguousarray(pygame.surfarray.array_red(surface).T)
+
+    def _region_at(self, pos: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        """Zwraca województwo pod punktem ekranu, odczytane z rastra trafień."""
+        if self.hit_raster is None:
+            self.hit_raster = self.build_hit_raster()
+        lx, ly = pos[0] - self.rect.x, pos[1] - self.rect.y
+        if not (0 <= lx < self.rect.width and 0 <= ly < self.rect.height):
+            return None
+        index = int(self.hit_raster[ly, lx])
+        return self.voivodeships[index] if index < len(self.voivodeships) else None
+
     def _screen_to_geo(self, pos: Tuple[int, int]) -> Tuple[float, float]:
         """Konwertuje współrzędne ekranu na geograficzne (bazując na rect i mapie)."""
         lx = pos[0] - self.rect.x
@@ -180,32 +272,74 @@ class PolandMapWidget:
             self.max_y - ly / sy,
         )
 
-    def _draw_base_map(self) -> None:
-        """Rysuje statyczną część mapy na cache_surface."""
-        sx = self.rect.width / (self.max_x - self.min_x)
-        sy = self.rect.height / (self.max_y - self.min_y)
+    def _get_screen_arcs(self) -> List[List[Tuple[float, float]]]:
+        """Zwraca łuki topologii uproszczone do pół piksela i przeliczone na ekran."""
+        if self.screen_arcs is None:
+            self.screen_arcs = self._scaled_arcs(1)
+        return self.screen_arcs
+
+    def _scaled_arcs(self, scale: int) -> List[List[Tuple[float, float]]]:
+        """Zwraca łuki w pikselach powierzchni `scale` razy większej od widgetu."""
+        sx = scale * self.rect.width / (self.max_x - self.min_x)
+        sy = scale * self.rect.height / (self.max_y - self.min_y)
+        simple = self.topology.simplified(0.5 / max(sx, sy))
+        return [
+            [((x - self.min_x) * sx, (self.max_y - y) * sy) for x, y in arc]
+            for arc in simple.arcs
+        ]
+
+    def _region_rings(self, v: Dict[str, Any],
+                      arcs: Optional[List[List[Tuple[float, float]]]] = None) -> List[List[Tuple[float, float]]]:
+        """Zwraca pierścienie województwa w pikselach, złożone ze wspólnych łuków."""
+        arcs = arcs if arcs is not None else self._get_screen_arcs()
+        rings = [self.topology.ring_points(refs, arcs) for refs in v['arc_rings']]
+        return [pts for pts in rings if len(pts) >= 3]
+
+    def _draw_base_map(self, surface: pygame.Surface, scale: int = 1) -> None:
+        """Rysuje statyczną część mapy w skali `scale` (każdą granicę raz)."""
+        arcs = self._get_screen_arcs() if scale == 1 else self._scaled_arcs(scale)
         for v in self.voivodeships:
-            for poly in v['polygons']:
-                pts = [((x - self.min_x) * sx, (self.max_y - y) * sy)
-                       for x, y in poly.exterior.coords]
-                pygame.draw.polygon(self.cache_surface, v['color'], pts)
-                pygame.draw.polygon(self.cache_surface, (0, 0, 0, 255), pts, 1)
-        pygame.draw.rect(self.cache_surface, (0, 0, 0, 255),
-                         pygame.Rect(0, 0, self.rect.width, self.rect.height), 2)
+            for pts in self._region_rings(v, arcs):
+                pygame.draw.polygon(surface, v['color'], pts)
+        for arc in arcs:
+            pygame.draw.lines(surface, (0, 0, 0, 255), False, arc, scale)
+        pygame.draw.rect(surface, (0, 0, 0, 255), surface.get_rect(), 2 * scale)
+
+    def rasterize_base_map(self, scale: int = SUPERSAMPLE) -> pygame.Surface:
+        """Rysuje bazową mapę w `scale`-krotnej rozdzielczości i zmniejsza ją do rozmiaru widgetu."""
+        size = (self.rect.width * scale, self.rect.height * scale)
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        self._draw_base_map(surface, scale)
+        if scale == 1:
+            return surface
+        return pygame.transform.smoothscale(surface, self.rect.size)
+
+    def load_baked_map(self) -> Optional[pygame.Surface]:
+        """Wczytuje wypalony obraz mapy, jeśli istnieje, pasuje rozmiarem i jest nowszy od .shp."""
+        if self.baked_folder is None:
+            return None
+        path = baked_map_path(self.baked_folder, self.rect.size)
+        if not os.path.exists(path):
+            return None
+        if os.path.exists(self.shapefile_path) and os.path.getmtime(path) < os.path.getmtime(self.shapefile_path):
+            return None
+        try:
+            surface = pygame.image.load(path)
+        except pygame.error as e:
+            print(f"Błąd wczytywania mapy {path}: {e}")
+            return None
+        if surface.get_size() != self.rect.size:
+            return None
+        return surface.convert_alpha() if pygame.display.get_surface() else surface
 
     def _draw_overlays(self) -> None:
         """Rysuje elementy hover i zaznaczenia na aktualnej powierzchni."""
-        sx = self.rect.width / (self.max_x - self.min_x)
-        sy = self.rect.height / (self.max_y - self.min_y)
-
         for state, key_color, border in [
             (self.hovered_voivodeship, 'hover_color', 1),
             (self.selected_voivodeship, 'color', 2),
         ]:
             if not state:
                 continue
-            for poly in state['polygons']:
-                pts = [((x - self.min_x) * sx, (self.max_y - y) * sy)
-                       for x, y in poly.exterior.coords]
+            for pts in self._region_rings(state):
                 pygame.draw.polygon(self.surface, state[key_color], pts)
                 pygame.draw.polygon(self.surface, (0, 0, 0, 255), pts, border)
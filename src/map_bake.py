@@ -0,0 +1,39 @@
+"""
+Wypalanie bazowej mapy do obrazów PNG, wczytywanych przez grę zamiast rysowania.
+
+Dla każdego rozmiaru ekranu liczony jest rozmiar mapy z układu gry i zapisywany
+obraz mapa_<szerokość>x<wysokość>.png (nadpróbkowany, z wygładzonymi granicami):
+    python src/map_bake.py assets/map_assets/wojewodztwa.shp assets/map_assets/baked 1280x720 1920x1080
+Bez podanych rozmiarów używany jest rozmiar okna gry.
+"""
+
+import os
+import sys
+from typing import List, Tuple
+
+import pygame
+
+from layout import SCREEN_HEIGHT, SCREEN_WIDTH, map_rect
+from map import SUPERSAMPLE, PolandMapWidget, baked_map_path
+
+
+def bake_maps(shapefile_path: str, folder: str, screen_sizes: List[Tuple[int, int]],
+              supersample: int = SUPERSAMPLE) -> List[str]:
+    """Zapisuje obraz bazowej mapy dla każdego rozmiaru ekranu; zwraca ścieżki plików."""
+    os.makedirs(folder, exist_ok=True)
+    written = []
+    for width, height in screen_sizes:
+        widget = PolandMapWidget(*map_rect(width, height), shapefile_path, supersample=supersample)
+        path = baked_map_path(folder, widget.rect.size)
+        pygame.image.save(widget.rasterize_base_map(supersample), path)
+        written.append(path)
+    return written
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(1)
+    sizes = [tuple(int(v) for v in arg.split("x")) for arg in sys.argv[3:]] or [(SCREEN_WIDTH, SCREEN_HEIGHT)]
+    for path in bake_maps(sys.argv[1], sys.argv[2], sizes):
+        print(f"Zapisano {path}")
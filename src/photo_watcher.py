@@ -0,0 +1,105 @@
+"""
+Obserwowanie folderu zdjęć w tle: nowe i usunięte pliki bez restartu gry.
+
+Wątek co `interval` sekund sprawdza tylko czas modyfikacji katalogu (jedno
+wywołanie stat). Lista plików jest czytana ponownie dopiero po zmianie tego
+czasu, a do gry trafia sama różnica (dodane, usunięte), odbierana przez
+`poll()` między rundami, bez czekania na wątek.
+"""
+
+import os
+import queue
+import threading
+import time
+from typing import Iterable, Optional, Set, Tuple
+
+"""Zmiana w tym samym takcie zegara systemu plików co skanowanie nie zmienia mtime katalogu"""
+RACY_NS = 2_000_000_000
+
+
+class PhotoWatcher:
+    """Wątek wykrywający dodane i usunięte pliki w jednym folderze."""
+
+    def __init__(self, folder: str, known: Iterable[str], interval: float = 1.0) -> None:
+        """
+        Przyjmuje folder, znane już nazwy plików i odstęp między sprawdzeniami (s).
+
+        Folder jest od razu skanowany raz: pliki dodane lub usunięte od czasu
+        zebrania `known` trafiają do kolejki jak każda inna zmiana.
+        """
+        self.folder = folder
+        self.known: Set[str] = set(known)
+        self.interval = interval
+        self.changes: "queue.Queue[Tuple[Set[str], Set[str]]]" = queue.Queue()
+        self.mtime_ns: Optional[int] = None
+        self.scanned_at_ns: int = 0
+        self.scans: int = 0
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        self.rescan()
+
+    def _mtime(self) -> Optional[int]:
+        """Zwraca czas modyfikacji katalogu (None, gdy go nie ma)."""
+        try:
+            return os.stat(self.folder).st_mtime_ns
+        except OSError:
+            return None
+
+    def scan(self) -> Set[str]:
+        """Zwraca nazwy plików w folderze."""
+        try:
+            with os.scandir(self.folder) as it:
+                return {entry.name for entry in it if entry.is_file()}
+        except OSError:
+            return set()
+
+    def check(self) -> bool:
+        """Jedno sprawdzenie: przy zmianie mtime skanuje folder i kolejkuje różnicę; zwraca, czy skanował."""
+        mtime_ns = self._mtime()
+        racy = mtime_ns is not None and self.scanned_at_ns - mtime_ns < RACY_NS
+        if mtime_ns == self.mtime_ns and not racy:
+            return False
+        self.rescan(mtime_ns)
+        return True
+
+    def rescan(self, mtime_ns: Optional[int] = None) -> None:
+        """Skanuje folder i kolejkuje różnicę względem znanych nazw (mtime odczytany przed skanem)."""
+        self.scanned_at_ns = time.time_ns()
+        self.mtime_ns = self._mtime() if mtime_ns is None else mtime_ns
+        names = self.scan()
+        self.scans += 1
+        added, removed = names - self.known, self.known - names
+        if added or removed:
+            self.known = names
+            self.changes.put((added, removed))
+
+    def poll(self) -> Tuple[Set[str], Set[str]]:
+        """Zwraca (bez blokowania) łączną różnicę zgłoszoną od poprzedniego wywołania."""
+        added: Set[str] = set()
+        removed: Set[str] = set()
+        while True:
+            try:
+                new, gone = self.changes.get_nowait()
+            except queue.Empty:
+                return added, removed
+            added = (added - gone) | new
+            removed = (removed - new) | gone
+
+    def run(self) -> None:
+        """Pętla wątku: sprawdza folder co `interval` sekund aż do `stop()`."""
+        while not self.stop_event.wait(self.interval):
+            self.check()
+
+    def start(self) -> "PhotoWatcher":
+        """Uruchamia wątek w tle (demon, nie blokuje zamknięcia gry)."""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name="photo-watcher", daemon=True)
+            self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Zatrzymuje wątek."""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
@@ -0,0 +1,82 @@
+"""
+Opcjonalne profilowanie stanów gry i rund (cProfile -> pliki .pstats).
+
+Włączenie: zmienna środowiskowa ZW_PROFILE=1 (pliki w katalogu profiles/)
+albo ZW_PROFILE=<katalog>. Podgląd wyników, np.:
+    python -m pstats profiles/GAMEPAGE_001.pstats
+Gdy profilowanie jest wyłączone, metody Game nie są w ogóle opakowywane.
+"""
+
+import cProfile
+import functools
+import os
+from typing import Any, Callable, Dict, List
+
+PROFILE_ENV = "ZW_PROFILE"
+
+
+class StateProfiler:
+    """
+    Profiler zapisujący osobny plik .pstats dla każdego wejścia w stan i każdej rundy.
+
+    cProfile nie pozwala na dwa aktywne profilery naraz, dlatego profil stanu
+    jest wstrzymywany na czas rundy; czas rundy trafia tylko do pliku rundy.
+    """
+
+    def __init__(self, folder: str) -> None:
+        """Tworzy profiler zapisujący pliki do `folder`."""
+        self.folder = folder
+        self.stack: List[cProfile.Profile] = []
+        self.counters: Dict[str, int] = {}
+        self.written: List[str] = []
+        os.makedirs(folder, exist_ok=True)
+
+    def run(self, label: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Wywołuje `func` pod osobnym profilerem i zapisuje wynik jako `<label>_<n>.pstats`."""
+        profile = cProfile.Profile()
+        if self.stack:
+            self.stack[-1].disable()
+        self.stack.append(profile)
+        profile.enable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.disable()
+            self.stack.pop()
+            self.dump(label, profile)
+            if self.stack:
+                self.stack[-1].enable()
+
+    def dump(self, label: str, profile: cProfile.Profile) -> str:
+        """Zapisuje statystyki profilu do kolejnego pliku dla etykiety."""
+        self.counters[label] = self.counters.get(label, 0) + 1
+        path = os.path.join(self.folder, f"{label}_{self.counters[label]:03d}.pstats")
+        profile.dump_stats(path)
+        self.written.append(path)
+        return path
+
+    def install(self, game: Any) -> None:
+        """Opakowuje metody `handle_*` i `run_single_round*` obiektu gry."""
+        for name in dir(type(game)):
+            if name.startswith("handle_"):
+                label = lambda g=game: g.state.name
+            elif name.startswith("run_single_round"):
+                label = lambda g=game, n=name: f"{n}_runda{g.current_round + 1:02d}"
+            else:
+                continue
+            setattr(game, name, self._wrap(getattr(game, name), label))
+
+    def _wrap(self, method: Callable[..., Any], label: Callable[[], str]) -> Callable[..., Any]:
+        """Zwraca metodę wywołującą oryginał pod profilerem."""
+        @functools.wraps(method)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return self.run(label(), method, *args, **kwargs)
+        return wrapper
+
+
+def profiler_from_env(default_folder: str) -> "StateProfiler | None":
+    """Zwraca profiler, gdy ustawiono ZW_PROFILE, w przeciwnym razie None."""
+    value = os.environ.get(PROFILE_ENV, "")
+    if value in ("", "0"):
+        return None
+    return StateProfiler(default_folder if value == "1" else value)
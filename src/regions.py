@@ -0,0 +1,117 @@
+"""Wstępnie obliczone sąsiedztwo i odległości między regionami mapy."""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import shapely
+from shapely.geometry import MultiPolygon, Polygon
+
+from topology import Topology
+
+"""Punktacja częściowa"""
+POINTS_CORRECT = 1.0
+POINTS_ADJACENT = 0.5
+POINTS_NEARBY = 0.25
+NEARBY_KM = 50.0
+
+
+class RegionMatrix:
+    """
+    Macierz sąsiedztwa, odległości i punktów dla wszystkich par regionów.
+
+    Odległości przechowywane są w kilometrach jako float32, sąsiedztwo jako
+    macierz bool, a punktacja jest gotową tablicą, więc ocena odpowiedzi to
+    jedno odwołanie do tablicy.
+    """
+
+    def __init__(self, names: Sequence[str], adjacency: np.ndarray,
+                 centroid_km: np.ndarray, border_km: np.ndarray) -> None:
+        """Przyjmuje nazwy regionów i macierze n x n w kolejności tych nazw."""
+        self.names: List[str] = list(names)
+        self.index: Dict[str, int] = {name.lower(): i for i, name in enumerate(self.names)}
+        self.adjacency = np.asarray(adjacency, dtype=bool)
+        self.centroid_km = np.asarray(centroid_km, dtype=np.float32)
+        self.border_km = np.asarray(border_km, dtype=np.float32)
+        self.points_table = self._score_table()
+
+    @classmethod
+    def build(cls, names: Sequence[str], polygons: Sequence[Sequence[Polygon]],
+              topology: Optional[Topology] = None, units_per_km: float = 1000.0,
+              nearby_km: float = NEARBY_KM) -> "RegionMatrix":
+        """
+        Oblicza macierze z geometrii regionów.
+
+        Sąsiedztwo wynika ze wspólnych łuków topologii (bez wywołań `touches`),
+        a odległość między granicami liczona jest tylko dla par, które drzewo
+        STRtree wskaże jako bliższe niż `nearby_km`; pozostałe pary mają +inf.
+        """
+        n = len(names)
+        geoms = np.array([MultiPolygon(list(polys)) for polys in polygons], dtype=object)
+
+        adjacency = np.zeros((n, n), dtype=bool)
+        if topology is not None:
+            arc_regions: Dict[int, set] = {}
+            for region, rings in enumerate(topology.rings):
+                for refs in rings:
+                    for ref in refs:
+                        arc_regions.setdefault(ref if ref >= 0 else ~ref, set()).add(region)
+            for regions in arc_regions.values():
+                for i in regions:
+                    for j in regions:
+                        adjacency[i, j] = i != j
+        else:
+            left, right = shapely.STRtree(geoms).query(geoms, predicate="touches")
+            adjacency[left, right] = True
+
+        centroids = shapely.get_coordinates(shapely.centroid(geoms))
+        delta = centroids[:, None, :] - centroids[None, :, :]
+        centroid_km = np.hypot(delta[..., 0], delta[..., 1]) / units_per_km
+
+        border_km = np.full((n, n), np.inf, dtype=np.float32)
+        left, right = shapely.STRtree(geoms).query(
+            geoms, predicate="dwithin", distance=nearby_km * units_per_km
+        )
+        border_km[left, right] = shapely.distance(geoms[left], geoms[right]) / units_per_km
+        border_km[adjacency] = 0.0
+        np.fill_diagonal(border_km, 0.0)
+
+        return cls(names, adjacency, centroid_km, border_km)
+
+    def _score_table(self) -> np.ndarray:
+        """Buduje tablicę punktów: [poprawny, kliknięty] -> liczba punktów."""
+        table = np.where(self.border_km <= NEARBY_KM, POINTS_NEARBY, 0.0).astype(np.float32)
+        table[self.adjacency] = POINTS_ADJACENT
+        np.fill_diagonal(table, POINTS_CORRECT)
+        return table
+
+    def points(self, correct: str, clicked: str) -> float:
+        """Zwraca liczbę punktów za kliknięcie regionu `clicked`, gdy poprawny jest `correct`."""
+        i = self.index.get(correct.lower())
+        j = self.index.get(clicked.lower())
+        if i is None or j is None:
+            return 0.0
+        return float(self.points_table[i, j])
+
+    def neighbours(self, name: str) -> List[str]:
+        """Zwraca nazwy regionów sąsiadujących z podanym."""
+        i = self.index[name.lower()]
+        return [self.names[j] for j in np.flatnonzero(self.adjacency[i])]
+
+    def save(self, path: str) -> None:
+        """Zapisuje macierze do pliku .npz (sąsiedztwo spakowane bitowo)."""
+        np.savez_compressed(
+            path,
+            names=np.array(self.names),
+            adjacency=np.packbits(self.adjacency, axis=None),
+            centroid_km=self.centroid_km,
+            border_km=self.border_km,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "RegionMatrix":
+        """Wczytuje macierze zapisane przez `save`."""
+        with np.load(path) as data:
+            names = [str(name) for name in data["names"]]
+            n = len(names)
+            adjacency = np.unpackbits(data["adjacency"], count=n * n).reshape(n, n)
+            return cls(names, adjacency, data["centroid_km"], data["border_km"])
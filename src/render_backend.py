@@ -0,0 +1,109 @@
+"""
+Backendy wyświetlania: powierzchnie pygame (domyślny) lub Renderer/Texture z SDL2.
+
+Wybór przez zmienną środowiskową ZW_RENDERER:
+    surface        - rysowanie na powierzchni ekranu i pygame.display.flip() (domyślnie)
+    sdl2           - pygame._sdl2.video, renderer sprzętowy (jeśli dostępny)
+    sdl2-software  - pygame._sdl2.video z rendererem programowym SDL (działa bez GPU)
+"""
+
+import os
+from typing import Dict, Hashable, Optional, Tuple
+
+import pygame
+
+RENDERER_ENV = "ZW_RENDERER"
+
+
+class SurfaceBackend:
+    """Dotychczasowa ścieżka: wszystko blitowane na powierzchnię ekranu, potem flip()."""
+
+    def __init__(self, size: Tuple[int, int], caption: str) -> None:
+        """Otwiera okno przez `pygame.display.set_mode`."""
+        self.screen: pygame.Surface = pygame.display.set_mode(size)
+        pygame.display.set_caption(caption)
+
+    def flip(self) -> None:
+        """Wyświetla klatkę narysowaną na `screen`."""
+        pygame.display.flip()
+
+    def begin(self, color: Tuple[int, int, int]) -> None:
+        """Rozpoczyna klatkę złożoną z warstw."""
+        self.screen.fill(color)
+
+    def layer(self, key: Hashable, surface: pygame.Surface, pos: Tuple[int, int],
+              version: int = 0) -> None:
+        """Rysuje warstwę klatki (tu: zwykły blit)."""
+        self.screen.blit(surface, pos)
+
+    def end(self) -> None:
+        """Kończy i wyświetla klatkę złożoną z warstw."""
+        pygame.display.flip()
+
+
+class TextureBackend:
+    """
+    Backend oparty na `pygame._sdl2.video` (Renderer/Texture).
+
+    Warstwy klatki (zdjęcie, mapa, teksty) trzymane są jako tekstury i wysyłane
+    do renderera tylko wtedy, gdy zmieni się powierzchnia lub jej wersja.
+    Ekrany rysowane po staremu na `screen` są wysyłane w całości w `flip()`.
+    """
+
+    def __init__(self, size: Tuple[int, int], caption: str, software: bool = False) -> None:
+        """Tworzy okno i renderer (programowy, gdy `software`)."""
+        from pygame._sdl2 import video
+
+        self.video = video
+        self.window = video.Window(caption, size)
+        self.renderer = video.Renderer(self.window, accelerated=0 if software else -1)
+        self.screen: pygame.Surface = pygame.Surface(size)
+        self.screen_texture = video.Texture(self.renderer, size, streaming=True)
+        self.textures: Dict[Hashable, Tuple[int, int, object, pygame.Surface]] = {}
+        self.uploads: int = 0
+
+    def flip(self) -> None:
+        """Wysyła całą powierzchnię `screen` do tekstury i ją wyświetla."""
+        self.screen_texture.update(self.screen)
+        self.uploads += 1
+        self.renderer.clear()
+        self.screen_texture.draw()
+        self.renderer.present()
+
+    def begin(self, color: Tuple[int, int, int]) -> None:
+        """Czyści bufor renderera kolorem tła."""
+        self.renderer.draw_color = (*color, 255)
+        self.renderer.clear()
+
+    def texture(self, key: Hashable, surface: pygame.Surface, version: int = 0):
+        """Zwraca teksturę dla warstwy, wysyłając ją tylko przy zmianie treści."""
+        cached = self.textures.get(key)
+        if cached is None or cached[0] != id(surface) or cached[1] != version:
+            texture = self.video.Texture.from_surface(self.renderer, surface)
+            if surface.get_flags() & pygame.SRCALPHA:
+                texture.blend_mode = pygame.BLENDMODE_BLEND
+            self.uploads += 1
+            """Zachowana referencja do powierzchni chroni przed ponownym użyciem jej id"""
+            cached = (id(surface), version, texture, surface)
+            self.textures[key] = cached
+        return cached[2]
+
+    def layer(self, key: Hashable, surface: pygame.Surface, pos: Tuple[int, int],
+              version: int = 0) -> None:
+        """Rysuje warstwę jako teksturę."""
+        self.texture(key, surface, version).draw(dstrect=pos)
+
+    def end(self) -> None:
+        """Wyświetla klatkę."""
+        self.renderer.present()
+
+
+def create_backend(size: Tuple[int, int], caption: str,
+                   name: Optional[str] = None) -> "SurfaceBackend | TextureBackend":
+    """Tworzy backend wskazany nazwą lub zmienną ZW_RENDERER."""
+    name = name or os.environ.get(RENDERER_ENV, "surface")
+    if name == "sdl2":
+        return TextureBackend(size, caption)
+    if name == "sdl2-software":
+        return TextureBackend(size, caption, software=True)
+    return SurfaceBackend(size, caption)
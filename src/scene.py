@@ -0,0 +1,152 @@
+"""Kompozytor scen złożonych z warstw buforowanych między klatkami."""
+
+import math
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import pygame
+
+BlitSequence = Sequence[Tuple[pygame.Surface, Tuple[int, int]]]
+
+
+@lru_cache(maxsize=256)
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, ...]) -> pygame.Surface:
+    """Renderuje tekst raz i zwraca zapamiętaną powierzchnię przy kolejnych wywołaniach."""
+    return font.render(text, True, color)
+
+
+def render_shadowed_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int],
+                         shadow_color: Tuple[int, int, int], offset: int = 3) -> pygame.Surface:
+    """Renderuje tekst z cieniem na jednej przezroczystej powierzchni."""
+    shadow = render_text(font, text, shadow_color)
+    label = render_text(font, text, color)
+    surface = pygame.Surface(
+        (label.get_width() + offset, label.get_height() + offset), pygame.SRCALPHA
+    )
+    surface.blit(shadow, (offset, offset))
+    surface.blit(label, (0, 0))
+    return surface
+
+
+class Layer(ABC):
+    """Bazowa warstwa sceny."""
+
+    def reset(self, ticks: int) -> None:
+        """Wywoływane przy wejściu do sceny (np. start animacji wejścia)."""
+
+    @abstractmethod
+    def draw(self, target: pygame.Surface, ticks: int) -> None:
+        """Rysuje warstwę na docelowej powierzchni."""
+
+
+class StaticLayer(Layer):
+    """Warstwa renderowana raz i później jedynie blitowana."""
+
+    def __init__(self, render: Callable[[pygame.Surface], None], size: Tuple[int, int],
+                 pos: Tuple[int, int] = (0, 0), transparent: bool = False) -> None:
+        """Zapamiętuje funkcję renderującą; właściwe rysowanie następuje leniwie."""
+        self.render = render
+        self.size = size
+        self.pos = pos
+        self.transparent = transparent
+        self.surface: Optional[pygame.Surface] = None
+
+    def invalidate(self) -> None:
+        """Wymusza ponowne wyrenderowanie warstwy przy następnym rysowaniu."""
+        self.surface = None
+
+    def draw(self, target: pygame.Surface, ticks: int) -> None:
+        """Blituje gotową powierzchnię, w razie potrzeby renderując ją najpierw."""
+        if self.surface is None:
+            flags = pygame.SRCALPHA if self.transparent else 0
+            self.surface = pygame.Surface(self.size, flags)
+            self.render(self.surface)
+        target.blit(self.surface, self.pos)
+
+
+class AnimatedLayer(Layer):
+    """Warstwa animowana odtwarzająca wstępnie przygotowane klatki."""
+
+    def __init__(self, frames: Sequence[BlitSequence], frame_ms: int) -> None:
+        """Przyjmuje listę klatek (sekwencji blitów) i czas trwania jednej klatki."""
+        self.frames = frames
+        self.frame_ms = frame_ms
+
+    def frame_index(self, ticks: int) -> int:
+        """Zwraca indeks klatki odpowiadającej podanemu czasowi."""
+        return (ticks // self.frame_ms) % len(self.frames)
+
+    def draw(self, target: pygame.Surface, ticks: int) -> None:
+        """Rysuje bieżącą klatkę jednym wywołaniem `blits`."""
+        target.blits(self.frames[self.frame_index(ticks)], doreturn=False)
+
+
+class SpriteLayer(Layer):
+    """Raz wyrenderowana powierzchnia, której pozycja zależy od czasu w scenie."""
+
+    def __init__(self, surface: pygame.Surface,
+                 position: Callable[[int], Tuple[int, int]]) -> None:
+        """Przyjmuje powierzchnię i funkcję czasu (ms od wejścia do sceny) -> pozycja."""
+        self.surface = surface
+        self.position = position
+        self.started_at = 0
+
+    def reset(self, ticks: int) -> None:
+        """Zapamiętuje moment wejścia do sceny."""
+        self.started_at = ticks
+
+    def draw(self, target: pygame.Surface, ticks: int) -> None:
+        """Blituje powierzchnię w pozycji wyznaczonej dla bieżącego czasu."""
+        target.blit(self.surface, self.position(ticks - self.started_at))
+
+
+class Scene:
+    """Scena (ekran) złożona z warstw rysowanych w kolejności dodania."""
+
+    def __init__(self, layers: Optional[List[Layer]] = None) -> None:
+        """Tworzy scenę z opcjonalną listą warstw."""
+        self.layers: List[Layer] = list(layers or [])
+
+    def add(self, layer: Layer) -> Layer:
+        """Dodaje warstwę na wierzch sceny i zwraca ją."""
+        self.layers.append(layer)
+        return layer
+
+    def enter(self, ticks: int) -> None:
+        """Resetuje warstwy przy wejściu do sceny."""
+        for layer in self.layers:
+            layer.reset(ticks)
+
+    def invalidate(self) -> None:
+        """Unieważnia wszystkie warstwy statyczne sceny."""
+        for layer in self.layers:
+            if isinstance(layer, StaticLayer):
+                layer.invalidate()
+
+    def draw(self, target: pygame.Surface, ticks: int) -> None:
+        """Rysuje wszystkie warstwy sceny."""
+        for layer in self.layers:
+            layer.draw(target, ticks)
+
+
+def wave_background_frames(width: int, top: int, bottom: int,
+                           color: Tuple[int, int, int], spacing: int = 20,
+                           amplitude: int = 10) -> List[BlitSequence]:
+    """
+    Przygotowuje klatki animowanego tła z falującymi liniami.
+
+    Przesunięcie linii na wysokości y wynosi amplitude * |y * cos(kąt)| / bottom,
+    więc animacja jest okresowa co 180 stopni; klatki generowane są co 1 stopień,
+    a wszystkie dzielą jedną powierzchnię linii.
+    """
+    line = pygame.Surface((width, 2))
+    line.fill(color)
+    frames: List[BlitSequence] = []
+    for angle in range(180):
+        cos = abs(math.cos(math.radians(angle)))
+        frames.append([
+            (line, (0, y + int(amplitude * y * cos / bottom)))
+            for y in range(top, bottom, spacing)
+        ])
+    return frames
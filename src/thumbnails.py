@@ -0,0 +1,163 @@
+"""
+Miniatury zdjęć zapisane w jednym pliku (manifeście) i dekodowanie zdjęć w tle.
+
+Miniatura jest pokazywana od razu po wylosowaniu zdjęcia, a pełne zdjęcie
+podmieniane, gdy wątek w tle skończy dekodowanie. Budowanie manifestu:
+    python src/thumbnails.py assets/photo_assets assets/photo_thumbs.npz
+"""
+
+import os
+import sys
+import unicodedata
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from image_cache import fit_size
+
+THUMB_SIZE = (48, 36)
+
+
+class ThumbnailManifest:
+    """
+    Miniatury RGB wszystkich zdjęć w jednej tablicy pikseli.
+
+    Dla każdej nazwy (NFC) pamiętany jest rozmiar miniatury, rozmiar oryginału
+    i przesunięcie w tablicy `pixels`, więc odczyt miniatury to jedno wycięcie.
+    """
+
+    def __init__(self, names: Iterable[str], sizes: np.ndarray, original_sizes: np.ndarray,
+                 offsets: np.ndarray, pixels: np.ndarray) -> None:
+        """Tworzy manifest z gotowych tablic (zob. `build`, `load`)."""
+        self.index: Dict[str, int] = {unicodedata.normalize("NFC", n): i for i, n in enumerate(names)}
+        self.sizes = np.asarray(sizes, dtype=np.int32).reshape(-1, 2)
+        self.original_sizes = np.asarray(original_sizes, dtype=np.int32).reshape(-1, 2)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.pixels = np.asarray(pixels, dtype=np.uint8)
+
+    def __contains__(self, name: str) -> bool:
+        return unicodedata.normalize("NFC", name) in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @classmethod
+    def build(cls, names: Iterable[str], opener: Callable[[str], pygame.Surface],
+              thumb_size: Tuple[int, int] = THUMB_SIZE) -> "ThumbnailManifest":
+        """Dekoduje zdjęcia przez `opener` i zmniejsza je do `thumb_size`; błędne pliki pomija."""
+        kept, sizes, original_sizes, chunks, offsets = [], [], [], [], [0]
+        for name in names:
+            try:
+                image = opener(name)
+            except (pygame.error, OSError) as e:
+                print(f"Ostrzeżenie: pomijam miniaturę {name}: {e}")
+                continue
+            if image.get_bitsize() not in (24, 32):
+                image = image.convert(24)
+            thumb = pygame.transform.smoothscale(image, fit_size(image.get_size(), thumb_size))
+            data = pygame.image.tobytes(thumb, "RGB")
+            kept.append(name)
+            sizes.append(thumb.get_size())
+            original_sizes.append(image.get_size())
+            chunks.append(np.frombuffer(data, dtype=np.uint8))
+            offsets.append(offsets[-1] + len(data))
+        pixels = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.uint8)
+        return cls(kept, np.array(sizes).reshape(-1, 2), np.array(original_sizes).reshape(-1, 2),
+                   np.array(offsets), pixels)
+
+    def surface(self, name: str) -> Optional[pygame.Surface]:
+        """Zwraca miniaturę zdjęcia (lub None, gdy nie ma jej w manifeście)."""
+        i = self.index.get(unicodedata.normalize("NFC", name))
+        if i is None:
+            return None
+        data = self.pixels[self.offsets[i]:self.offsets[i + 1]].tobytes()
+        return pygame.image.frombytes(data, tuple(self.sizes[i]), "RGB")
+
+    def placeholder(self, name: str, max_size: Tuple[int, int]) -> Optional[pygame.Surface]:
+        """Zwraca miniaturę powiększoną do rozmiaru, jaki będzie miało pełne zdjęcie."""
+        thumb = self.surface(name)
+        if thumb is None:
+            return None
+        original = tuple(self.original_sizes[self.index[unicodedata.normalize("NFC", name)]])
+        return pygame.transform.scale(thumb, fit_size(original, max_size))
+
+    def save(self, path: str) -> None:
+        """Zapisuje manifest do pliku .npz."""
+        names = sorted(self.index, key=self.index.get)
+        np.savez(path, names=np.array(names), sizes=self.sizes, original_sizes=self.original_sizes,
+                 offsets=self.offsets, pixels=self.pixels)
+
+    @classmethod
+    def load(cls, path: str) -> "ThumbnailManifest":
+        """Wczytuje manifest zapisany przez `save`."""
+        with np.load(path) as data:
+            return cls([str(n) for n in data["names"]], data["sizes"], data["original_sizes"],
+                       data["offsets"], data["pixels"])
+
+
+class PhotoLoader:
+    """Dekoduje pełne zdjęcia w jednym wątku w tle."""
+
+    def __init__(self, decode: Callable[[str, Tuple[int, int]], pygame.Surface]) -> None:
+        """Przyjmuje funkcję dekodującą (np. `ImageCache.decode`)."""
+        self.decode = decode
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="photo-loader")
+        self.path: Optional[str] = None
+        self.future: Optional[Future] = None
+
+    def submit(self, path: str, max_size: Tuple[int, int]) -> None:
+        """Zleca dekodowanie zdjęcia (poprzednie niedokończone zlecenie jest porzucane)."""
+        self.cancel()
+        self.path = path
+        self.future = self.executor.submit(self.decode, path, max_size)
+
+    def cancel(self) -> None:
+        """Porzuca bieżące zlecenie."""
+        if self.future is not None:
+            self.future.cancel()
+        self.path = None
+        self.future = None
+
+    @property
+    def pending(self) -> bool:
+        """Czy trwa dekodowanie zdjęcia."""
+        return self.future is not None
+
+    def poll(self) -> Optional[Tuple[str, pygame.Surface]]:
+        """Zwraca (ścieżka, zdjęcie), gdy dekodowanie się skończyło; błąd dekodowania jest rzucany."""
+        if self.future is None or not self.future.done():
+            return None
+        path, future = self.path, self.future
+        self.path = None
+        self.future = None
+        return path, future.result()
+
+    def wait(self) -> Optional[Tuple[str, pygame.Surface]]:
+        """Czeka na zakończenie bieżącego zlecenia i zwraca jego wynik."""
+        if self.future is None:
+            return None
+        self.future.exception()
+        return self.poll()
+
+    def close(self) -> None:
+        """Zatrzymuje wątek w tle, czekając na dekodowanie, które już się zaczęło."""
+        self.cancel()
+        self.executor.shutdown(wait=True)
+
+
+def build_manifest(folder: str, out_path: str) -> int:
+    """Buduje manifest miniatur dla zdjęć z folderu; zwraca liczbę miniatur."""
+    names = sorted(n for n in os.listdir(folder) if os.path.isfile(os.path.join(folder, n)))
+    manifest = ThumbnailManifest.build(names, lambda n: pygame.image.load(os.path.join(folder, n)))
+    manifest.save(out_path)
+    return len(manifest)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print(__doc__)
+        sys.exit(1)
+    count = build_manifest(sys.argv[1], sys.argv[2])
+    print(f"Zapisano {count} miniatur do {sys.argv[2]}")
@@ -0,0 +1,133 @@
+"""Topologia mapy: wspólne granice (łuki) zapisane raz dla sąsiednich regionów."""
+
+from typing import Dict, List, Sequence, Tuple
+
+from shapely.geometry import LineString
+
+Point2D = Tuple[float, float]
+Edge = Tuple[Point2D, Point2D]
+
+
+def _clean_ring(points: Sequence[Point2D]) -> List[Point2D]:
+    """Usuwa punkt domykający pierścień i powtórzone kolejne wierzchołki."""
+    ring: List[Point2D] = []
+    for p in points:
+        p = (float(p[0]), float(p[1]))
+        if not ring or ring[-1] != p:
+            ring.append(p)
+    if len(ring) > 1 and ring[0] == ring[-1]:
+        ring.pop()
+    return ring
+
+
+def _edge_key(a: Point2D, b: Point2D) -> Edge:
+    """Zwraca klucz krawędzi niezależny od kierunku jej przejścia."""
+    return (a, b) if a <= b else (b, a)
+
+
+class Topology:
+    """
+    Zbiór łuków współdzielonych przez pierścienie regionów.
+
+    Każdy pierścień zapisany jest jako lista odwołań do łuków; odwołanie `i`
+    oznacza łuk `arcs[i]`, a `~i` ten sam łuk przechodzony w odwrotnym kierunku.
+    """
+
+    def __init__(self, arcs: List[List[Point2D]], rings: List[List[List[int]]]) -> None:
+        """Przyjmuje gotowe łuki oraz pierścienie regionów (region -> pierścień -> odwołania)."""
+        self.arcs = arcs
+        self.rings = rings
+
+    @classmethod
+    def build(cls, regions: Sequence[Sequence[Sequence[Point2D]]]) -> "Topology":
+        """Buduje topologię z listy regionów, z których każdy jest listą pierścieni."""
+        cleaned = [[_clean_ring(ring) for ring in region] for region in regions]
+
+        """Właściciele każdej krawędzi (indeksy pierścieni w kolejności wystąpienia)"""
+        owners: Dict[Edge, List[int]] = {}
+        ring_id = 0
+        for region in cleaned:
+            for ring in region:
+                n = len(ring)
+                for k in range(n):
+                    owners.setdefault(_edge_key(ring[k], ring[(k + 1) % n]), []).append(ring_id)
+                ring_id += 1
+
+        arcs: List[List[Point2D]] = []
+        index: Dict[Tuple[Point2D, ...], int] = {}
+        rings: List[List[List[int]]] = []
+        for region in cleaned:
+            region_refs = []
+            for ring in region:
+                region_refs.append(cls._split_ring(ring, owners, arcs, index))
+            rings.append(region_refs)
+        return cls(arcs, rings)
+
+    @staticmethod
+    def _split_ring(ring: List[Point2D], owners: Dict[Edge, List[int]],
+                    arcs: List[List[Point2D]], index: Dict[Tuple[Point2D, ...], int]) -> List[int]:
+        """Dzieli pierścień w węzłach (miejscach zmiany sąsiada) i rejestruje łuki."""
+        n = len(ring)
+        if n < 3:
+            return []
+        edge_owners = [owners[_edge_key(ring[k], ring[(k + 1) % n])] for k in range(n)]
+        junctions = [k for k in range(n) if edge_owners[k - 1] != edge_owners[k]]
+
+        if not junctions:
+            """Pierścień bez węzłów: jeden zamknięty łuk w postaci kanonicznej"""
+            start = ring.index(min(ring))
+            ring = ring[start:] + ring[:start]
+            pieces = [ring + [ring[0]]]
+        else:
+            pieces = []
+            for j, start in enumerate(junctions):
+                end = junctions[(j + 1) % len(junctions)]
+                if end <= start:
+                    end += n
+                pieces.append([ring[k % n] for k in range(start, end + 1)])
+
+        refs = []
+        for piece in pieces:
+            key = tuple(piece)
+            if key in index:
+                refs.append(index[key])
+                continue
+            reversed_key = key[::-1]
+            if reversed_key in index:
+                refs.append(~index[reversed_key])
+                continue
+            index[key] = len(arcs)
+            refs.append(len(arcs))
+            arcs.append(list(piece))
+        return refs
+
+    def ring_points(self, refs: Sequence[int],
+                    arcs: "Sequence[Sequence[Point2D]] | None" = None) -> List[Point2D]:
+        """Składa współrzędne pierścienia z łuków (domyślnie z `self.arcs`)."""
+        arcs = self.arcs if arcs is None else arcs
+        points: List[Point2D] = []
+        for ref in refs:
+            arc = arcs[ref] if ref >= 0 else arcs[~ref][::-1]
+            points.extend(arc[1:] if points else arc)
+        return points
+
+    def vertex_count(self) -> int:
+        """Zwraca łączną liczbę wierzchołków zapisanych w łukach."""
+        return sum(len(arc) for arc in self.arcs)
+
+    def simplified(self, tolerance: float) -> "Topology":
+        """
+        Zwraca topologię z uproszczonymi łukami (Douglas-Peucker).
+
+        Końce łuków są zachowane, a wspólny łuk upraszczany jest raz dla obu
+        sąsiadów, więc między regionami nie powstają szczeliny.
+        """
+        if tolerance <= 0:
+            return self
+        arcs = []
+        for arc in self.arcs:
+            simple = list(LineString(arc).simplify(tolerance, preserve_topology=False).coords)
+            if tuple(arc[0]) == tuple(arc[-1]) and len(simple) < 4:
+                simple = arc
+            arcs.append([(x, y) for x, y in simple])
+        return Topology(arcs, self.rings)
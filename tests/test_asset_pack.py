@@ -0,0 +1,73 @@
+import pytest
+import os
+import sys
+import zipfile
+import pygame
+import importlib
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+asset_pack = importlib.import_module('asset_pack')
+Game = importlib.import_module('Game').Game
+
+@pytest.fixture(autouse=True)
+def init_pygame():
+    '''Inicjalizuje pygame w trybie 'dummy', aby nie otwierać okna.'''
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    pygame.display.init()
+    yield
+    pygame.display.quit()
+
+@pytest.fixture
+def pack(tmp_path):
+    '''Buduje paczkę z dwoma zdjęciami PNG o nazwach z polskimi znakami.'''
+    folder = tmp_path / 'zdjecia'
+    folder.mkdir()
+    for name, size in [('łódzkie_lodz.png', (40, 30)), ('świętokrzyskie_kielce.png', (20, 50))]:
+        surface = pygame.Surface(size)
+        surface.fill((10, 200, 30))
+        pygame.image.save(surface, str(folder / name))
+    path = tmp_path / 'zdjecia.zip'
+    assert asset_pack.build_pack(str(folder), str(path)) == 2
+    photo_pack = asset_pack.PhotoPack(str(path))
+    yield photo_pack
+    photo_pack.close()
+
+def test_pack_is_stored_and_views_share_mapping(pack):
+    '''Sprawdza, że paczka jest nieskompresowana, a widoki wskazują na zmapowany plik.'''
+    with zipfile.ZipFile(pack.path) as archive:
+        assert {i.compress_type for i in archive.infolist()} == {zipfile.ZIP_STORED}
+    assert sorted(pack.names()) == ['łódzkie_lodz.png', 'świętokrzyskie_kielce.png']
+    view = pack.view('łódzkie_lodz.png')
+    assert view.obj is pack.mm
+    assert bytes(view[:8]) == b'\x89PNG\r\n\x1a\n'
+    view.release()
+
+def test_pack_load_decodes_image(pack):
+    '''Sprawdza dekodowanie zdjęcia prosto z paczki.'''
+    surface = pack.load('świętokrzyskie_kielce.png')
+    assert surface.get_size() == (20, 50)
+    assert surface.get_at((5, 5))[:3] == (10, 200, 30)
+
+def test_compressed_pack_is_rejected(tmp_path):
+    '''Sprawdza, że skompresowane archiwum jest odrzucane (nie da się go zmapować bez kopii).'''
+    path = tmp_path / 'skompresowane.zip'
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('a_b.png', b'x' * 100)
+    with pytest.raises(ValueError):
+        asset_pack.PhotoPack(str(path))
+
+def test_game_reads_photos_from_pack(pack):
+    '''Sprawdza, że Game losuje i wczytuje zdjęcia z paczki.'''
+    game = Game()
+    game.photo_pack = pack
+    game.image_cache.loader = pack.load
+    game.images = {}
+    game.load_images()
+    assert game.images == {'łódzkie_lodz.png': 'łódzkie', 'świętokrzyskie_kielce.png': 'świętokrzyskie'}
+    game.image_keys = ['łódzkie_lodz.png']
+    game.pick_next_image()
+    assert game.current_image == 'łódzkie_lodz.png'
+    assert isinstance(game.current_image_surface, pygame.Surface)
@@ -0,0 +1,111 @@
+import pytest
+import os
+import sys
+import threading
+import time
+import numpy as np
+import pygame
+import shapefile
+import importlib
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+asset_store = importlib.import_module('asset_store')
+PolandMapWidget = importlib.import_module('map').PolandMapWidget
+
+NAMES = ["lewe", "prawe"]
+
+@pytest.fixture(autouse=True)
+def init_pygame():
+    '''Inicjalizuje pygame w trybie 'dummy', aby nie otwierać okna.'''
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    pygame.display.init()
+    yield
+    pygame.display.quit()
+
+@pytest.fixture
+def two_regions(tmp_path):
+    '''Zapisuje plik .shp z dwoma prostokątami o wspólnym boku.'''
+    path = str(tmp_path / "dwa")
+    with shapefile.Writer(path, shapeType=shapefile.POLYGON) as w:
+        for field in ("A", "B", "C", "D", "NAZWA"):
+            w.field(field, "C")
+        w.poly([[(0, 0), (0, 4), (4, 4), (4, 0), (0, 0)]])
+        w.record("", "", "", "", NAMES[0])
+        w.poly([[(4, 0), (4, 4), (8, 4), (8, 0), (4, 0)]])
+        w.record("", "", "", "", NAMES[1])
+    return path + ".shp"
+
+@pytest.fixture
+def photos(tmp_path):
+    '''Zwraca funkcję otwierającą dwa "zdjęcia" w różnych kolorach.'''
+    colors = {'lewe_a.png': (200, 10, 10), 'prawe_b.png': (10, 10, 200)}
+    def opener(name):
+        surface = pygame.Surface((80, 40))
+        surface.fill(colors[name])
+        return surface
+    return [('lewe_a.png', 'lewe'), ('prawe_b.png', 'prawe')], opener
+
+def build(two_regions, photos):
+    '''Zwraca funkcję budującą magazyn z mapy i zdjęć.'''
+    def builder(folder):
+        widget = PolandMapWidget(0, 0, 200, 100, two_regions, supersample=1)
+        asset_store.build_store(folder, widget, photos[0], photos[1], (40, 40))
+    return builder
+
+def test_widget_from_store_matches_shapefile(two_regions, photos, tmp_path):
+    '''Sprawdza, że widget z magazynu trafia, rysuje i punktuje jak widget z pliku .shp.'''
+    store = asset_store.open_store(str(tmp_path / 'magazyn'), 'klucz', build(two_regions, photos))
+    assert isinstance(store.hit_raster, np.memmap)
+    widget = PolandMapWidget(0, 0, 200, 100, two_regions, store=store)
+    assert [v['name'] for v in widget.voivodeships] == NAMES
+    assert widget.handle_click((150, 50)) == "prawe"
+    assert widget.region_matrix.points("lewe", "prawe") == 0.5
+    assert widget.render().get_at((50, 50))[:3] == widget.voivodeships[0]['color'][:3]
+
+    photo = store.photo('prawe_b.png')
+    assert photo.get_size() == (40, 20)
+    assert photo.get_at((5, 5))[:3] == (10, 10, 200)
+    assert store.photo_regions == {'lewe_a.png': 'lewe', 'prawe_b.png': 'prawe'}
+
+def test_store_is_built_once(two_regions, photos, tmp_path):
+    '''Sprawdza, że przy kilku równoczesnych otwarciach magazyn buduje tylko jeden wątek.'''
+    builds = []
+    builder = build(two_regions, photos)
+    def slow_build(folder):
+        builds.append(folder)
+        time.sleep(0.2)
+        builder(folder)
+    root = str(tmp_path / 'magazyn')
+    stores = []
+    threads = [threading.Thread(target=lambda: stores.append(asset_store.open_store(root, 'k', slow_build)))
+               for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(builds) == 1
+    assert len(stores) == 3
+    assert sorted(os.listdir(root)) == ['store_k', 'store_k.lock']
+
+def test_store_key_changes_with_sources(tmp_path):
+    '''Sprawdza, że zmiana pliku źródłowego zmienia klucz magazynu.'''
+    path = tmp_path / 'plik.shp'
+    path.write_bytes(b'a')
+    first = asset_store.store_key(asset_store.source_signature(str(path)), (540, 560))
+    path.write_bytes(b'ab')
+    assert asset_store.store_key(asset_store.source_signature(str(path)), (540, 560)) != first
+
+def test_file_lock_times_out(tmp_path):
+    '''Sprawdza, że zajęta blokada po upływie limitu czasu zgłasza TimeoutError zamiast czekać w nieskończoność.'''
+    path = str(tmp_path / 'magazyn.lock')
+    with asset_store.FileLock(path):
+        start = time.monotonic()
+        with pytest.raises(TimeoutError):
+            with asset_store.FileLock(path, timeout=0.3):
+                pass
+        assert time.monotonic() - start >= 0.3
+    with asset_store.FileLock(path, timeout=0.3):
+        pass
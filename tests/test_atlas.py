@@ -0,0 +1,81 @@
+import pytest
+import os
+import sys
+import pygame
+import importlib
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+ThumbnailAtlas = importlib.import_module('atlas').ThumbnailAtlas
+Game = importlib.import_module('Game').Game
+
+@pytest.fixture(autouse=True)
+def init_pygame():
+    '''Inicjalizuje pygame w trybie 'dummy', aby nie otwierać okna.'''
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    pygame.display.init()
+    yield
+    pygame.display.quit()
+
+def photo(color, size=(300, 200)):
+    '''Zwraca jednolite "zdjęcie" w podanym kolorze.'''
+    surface = pygame.Surface(size)
+    surface.fill(color)
+    return surface
+
+def close(color, expected):
+    '''Porównuje kolory z tolerancją na zaokrąglenia smoothscale.'''
+    return all(abs(a - b) <= 3 for a, b in zip(color[:3], expected))
+
+def test_atlas_grows_and_keeps_thumbnails():
+    '''Sprawdza, że po powiększeniu atlasu wcześniejsze miniatury zostają na swoich miejscach.'''
+    atlas = ThumbnailAtlas((30, 20), columns=2, rows=1)
+    rects = [atlas.add(photo((10 * k, 0, 0))) for k in range(5)]
+    assert atlas.rows == 4
+    assert atlas.surface.get_size() == (60, 80)
+    assert rects[0] == pygame.Rect(0, 0, 30, 20)
+    assert close(atlas.surface.get_at(rects[1].center), (10, 0, 0))
+    assert close(atlas.surface.get_at(rects[4].center), (40, 0, 0))
+
+    target = pygame.Surface((30, 20))
+    atlas.draw(target, 3, (0, 0))
+    assert close(target.get_at((15, 10)), (30, 0, 0))
+
+def test_atlas_centers_thumbnail_in_cell():
+    '''Sprawdza, że pionowe zdjęcie jest wyśrodkowane w komórce.'''
+    atlas = ThumbnailAtlas((30, 20), columns=2)
+    rect = atlas.add(photo((0, 200, 0), (100, 200)))
+    assert rect == pygame.Rect(10, 0, 10, 20)
+    target = pygame.Surface((30, 20))
+    target.fill((0, 0, 0))
+    atlas.draw(target, 0, (0, 0))
+    assert close(target.get_at((15, 10)), (0, 200, 0))
+    assert target.get_at((2, 10))[:3] == (0, 0, 0)
+    atlas.clear()
+    assert len(atlas) == 0
+
+def test_game_review_records_every_round():
+    '''Sprawdza zapis rund do galerii i rysowanie jej z atlasu przy wielu rundach.'''
+    game = Game()
+    game.images = {f'mazowieckie_{k}.png': 'mazowieckie' for k in range(60)}
+    game.start_review()
+    for k in range(60):
+        game.current_image_surface = photo((k, 100, 100))
+        odpowiedz = 'mazowieckie' if k % 2 else 'opolskie'
+        game.sprawdz_odpowiedz(f'mazowieckie_{k}.png', odpowiedz)
+        game.record_round(f'mazowieckie_{k}.png', odpowiedz)
+    game.current_image_surface = None
+    game.sprawdz_odpowiedz('mazowieckie_0.png', None)
+    game.record_round('mazowieckie_0.png', None)
+
+    assert len(game.round_log) == 61
+    assert len(game.review_atlas) == 60
+    assert game.round_log[0][1:] == ('mazowieckie', 'opolskie', 0, 0)
+    assert game.round_log[-1][2:] == ('-', 0, -1)
+    game.review_scroll = game.max_review_scroll()
+    assert game.review_scroll > 0
+    game.draw_review_gallery()
+    game.start_review()
+    assert game.round_log == [] and len(game.review_atlas) == 0
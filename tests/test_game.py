@@ -3,6 +3,7 @@ import os
 import sys
 import pygame
 import importlib
+import numpy as np
 
 SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
 if SRC_PATH not in sys.path:
@@ -102,4 +103,74 @@ def test_load_map_widget_missing(monkeypatch, game):
     game.state = GameState.GAMEPAGE
     ret = game.load_map_widget()
     assert ret is None
-    assert game.state == GameState.HOMEPAGE
\ No newline at end of file
+    assert game.state == GameState.HOMEPAGE
+
+def test_sprawdz_odpowiedz_partial(game):
+    '''Sprawdza, że w trybie częściowym sąsiednie województwo daje punkty z tablicy.'''
+    RegionMatrix = importlib.import_module('regions').RegionMatrix
+    names = ['pomorskie', 'kujawsko-pomorskie', 'podkarpackie']
+    adjacency = np.array([[0, 1, 0], [1, 0, 0], [0, 0, 0]], dtype=bool)
+    border = np.array([[0, 0, 500], [0, 0, 400], [500, 400, 0]])
+    game.region_matrix = RegionMatrix(names, adjacency, border, border)
+    game.images = {'pomorskie_01.png': 'pomorskie'}
+    game.score = 0
+    assert game.sprawdz_odpowiedz('pomorskie_01.png', 'Kujawsko-Pomorskie') is False
+    assert game.score == 0
+    game.scoring_mode = 'partial'
+    assert game.sprawdz_odpowiedz('pomorskie_01.png', 'Kujawsko-Pomorskie') is False
+    assert game.score == 0.5
+    assert game.sprawdz_odpowiedz('pomorskie_01.png', 'podkarpackie') is False
+    assert game.score == 0.5
+    assert game.round_log == []
+
+def test_sprawdz_lokalizacje(game):
+    '''Sprawdza ocenę kliknięcia w trybie dokładnym (odległość w km i punkty).'''
+    GpsIndex = importlib.import_module('gps_index').GpsIndex
+    geo = importlib.import_module('geo')
+    game.gps_index = GpsIndex(['mazowieckie_warszawa.jpg'], [(52.2297, 21.0122)])
+    game.score = 0
+    x, y = geo.wgs84_to_puwg1992(52.2297, 21.0122)
+    points = game.sprawdz_lokalizacje('mazowieckie_warszawa.jpg', (float(x), float(y)))
+    assert points == 1.0
+    assert game.last_distance_km == pytest.approx(0.0, abs=1e-3)
+    assert game.location_log[0][0] == 'mazowieckie_warszawa.jpg'
+
+def test_image_cache_lru_budget(monkeypatch):
+    '''Sprawdza trafienia, usuwanie najdawniej używanych wpisów i limit bajtów pamięci zdjęć.'''
+    ImageCache = importlib.import_module('image_cache').ImageCache
+    loads = []
+    def fake_load(path):
+        loads.append(path)
+        return pygame.Surface((200, 100))
+    monkeypatch.setattr(pygame.image, 'load', fake_load)
+    pygame.display.set_mode((10, 10))
+    cache = ImageCache(budget_bytes=2 * 100 * 50 * 4)
+    first = cache.get('a.jpg', (100, 100))
+    assert first.get_size() == (100, 50)
+    assert cache.get('a.jpg', (100, 100)) is first
+    cache.get('b.jpg', (100, 100))
+    cache.get('a.jpg', (100, 100))
+    cache.get('c.jpg', (100, 100))
+    assert ('b.jpg', (100, 100)) not in cache
+    assert ('a.jpg', (100, 100)) in cache
+    assert loads == ['a.jpg', 'b.jpg', 'c.jpg']
+    assert cache.resident_bytes <= cache.budget_bytes
+    assert cache.hit_rate == pytest.approx(2 / 5)
+
+def test_load_map_widget_reused_between_games(monkeypatch, game):
+    '''Sprawdza, że kolejna gra dostaje ten sam widget mapy, z wyczyszczonym zaznaczeniem.'''
+    created = []
+    class FakeWidget:
+        def __init__(self, *args, **kwargs):
+            self.region_matrix = None
+            self.selected_voivodeship = 'mazowieckie'
+            created.append(self)
+        def reset(self):
+            self.selected_voivodeship = None
+    monkeypatch.setattr(os.path, 'exists', lambda path: True)
+    monkeypatch.setattr(importlib.import_module('Game'), 'PolandMapWidget', FakeWidget)
+    first = game.load_map_widget()
+    first.selected_voivodeship = 'mazowieckie'
+    assert game.load_map_widget() is first
+    assert first.selected_voivodeship is None
+    assert len(created) == 1
@@ -0,0 +1,82 @@
+import pytest
+import os
+import sys
+import struct
+import importlib
+import numpy as np
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+geo = importlib.import_module('geo')
+gps_index = importlib.import_module('gps_index')
+
+def make_exif_jpeg(lat, lon):
+    '''Buduje minimalny plik JPEG z segmentem APP1/EXIF zawierającym tagi GPS.'''
+    def rational(value):
+        d = int(value)
+        m = int((value - d) * 60)
+        s = round(((value - d) * 60 - m) * 60 * 100)
+        return struct.pack('<6I', d, 1, m, 1, s, 100)
+
+    ifd0 = 8
+    gps_ifd = ifd0 + 2 + 12 + 4
+    data = gps_ifd + 2 + 4 * 12 + 4
+    tiff = b'II' + struct.pack('<HI', 42, ifd0)
+    tiff += struct.pack('<H', 1) + struct.pack('<HHII', 0x8825, 4, 1, gps_ifd) + struct.pack('<I', 0)
+    tiff += struct.pack('<H', 4)
+    tiff += struct.pack('<HHI', 1, 2, 2) + b'N\x00\x00\x00'
+    tiff += struct.pack('<HHII', 2, 5, 3, data)
+    tiff += struct.pack('<HHI', 3, 2, 2) + b'E\x00\x00\x00'
+    tiff += struct.pack('<HHII', 4, 5, 3, data + 24)
+    tiff += struct.pack('<I', 0) + rational(lat) + rational(lon)
+    segment = b'Exif\x00\x00' + tiff
+    return b'\xff\xd8\xff\xe1' + struct.pack('>H', len(segment) + 2) + segment + b'\xff\xd9'
+
+def test_puwg1992_round_trip():
+    '''Sprawdza przeliczenie WGS84 -> PUWG 1992 -> WGS84 oraz południk osiowy 19°.'''
+    x, y = geo.wgs84_to_puwg1992([52.2297, 54.352], [21.0122, 18.6466])
+    lat, lon = geo.puwg1992_to_wgs84(x, y)
+    assert lat == pytest.approx([52.2297, 54.352], abs=1e-7)
+    assert lon == pytest.approx([21.0122, 18.6466], abs=1e-7)
+    assert geo.puwg1992_to_wgs84(500000.0, 300000.0)[1] == pytest.approx(19.0)
+
+def test_read_exif_gps(tmp_path):
+    '''Sprawdza odczyt współrzędnych GPS z EXIF.'''
+    path = tmp_path / 'zdjecie.jpg'
+    path.write_bytes(make_exif_jpeg(50.0647, 19.945))
+    lat, lon = gps_index.read_exif_gps(str(path))
+    assert lat == pytest.approx(50.0647, abs=1e-4)
+    assert lon == pytest.approx(19.945, abs=1e-4)
+    (tmp_path / 'brak.jpg').write_bytes(b'\xff\xd8\xff\xd9')
+    assert gps_index.read_exif_gps(str(tmp_path / 'brak.jpg')) is None
+
+def test_build_index_and_score_log(tmp_path):
+    '''Sprawdza budowę indeksu (EXIF + CSV) i ocenę całego zapisu gry naraz.'''
+    folder = tmp_path / 'zdjecia'
+    folder.mkdir()
+    (folder / 'małopolskie_krakow.jpg').write_bytes(make_exif_jpeg(50.0647, 19.945))
+    (folder / 'pomorskie_gdansk.jpg').write_bytes(b'\xff\xd8\xff\xd9')
+    (folder / 'lubuskie_zary.jpg').write_bytes(b'\xff\xd8\xff\xd9')
+    sidecar = tmp_path / 'wspolrzedne.csv'
+    sidecar.write_text('zdjecie,szerokosc,dlugosc\npomorskie_gdansk.jpg,54.352,18.6466\n', encoding='utf-8')
+
+    index = gps_index.GpsIndex.build(str(folder), str(sidecar))
+    assert sorted(index.names) == ['małopolskie_krakow.jpg', 'pomorskie_gdansk.jpg']
+    index.save(str(tmp_path / 'indeks.npz'))
+    index = gps_index.GpsIndex.load(str(tmp_path / 'indeks.npz'))
+
+    log = tmp_path / 'gra.csv'
+    gps_index.write_log(str(log), [
+        ('małopolskie_krakow.jpg', 50.0647, 19.945),
+        ('pomorskie_gdansk.jpg', 52.2297, 21.0122),
+        ('lubuskie_zary.jpg', 51.64, 15.13),
+    ])
+    distances, points = index.score_log(str(log))
+    assert distances[0] == pytest.approx(0.0, abs=1e-6)
+    assert distances[1] == pytest.approx(284, abs=5)
+    assert np.isnan(distances[2])
+    assert points[0] == pytest.approx(1.0)
+    assert 0 < points[1] < 0.1
+    assert points[2] == 0.0
@@ -0,0 +1,165 @@
+import pytest
+import os
+import sys
+import pygame
+import shapefile
+import importlib
+from shapely.geometry import Polygon
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+PolandMapWidget = importlib.import_module('map').PolandMapWidget
+Topology = importlib.import_module('topology').Topology
+
+NAMES = ["pierwsze", "drugie", "trzecie", "czwarte"]
+
+def square(x0, y0, size=4):
+    '''Zwraca pierścień kwadratu (zgodnie z ruchem wskazówek zegara) z wierzchołkiem co 1 jednostkę.'''
+    pts = [(x0, y0 + k) for k in range(size)]
+    pts += [(x0 + k, y0 + size) for k in range(size)]
+    pts += [(x0 + size, y0 + size - k) for k in range(size)]
+    pts += [(x0 + size - k, y0) for k in range(size)]
+    return pts + [pts[0]]
+
+@pytest.fixture(autouse=True)
+def init_pygame():
+    '''Inicjalizuje pygame w trybie 'dummy', aby nie otwierać okna.'''
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    pygame.display.init()
+    yield
+    pygame.display.quit()
+
+@pytest.fixture
+def grid_shapefile(tmp_path):
+    '''Zapisuje plik .shp z czterema sąsiadującymi kwadratami (siatka 2x2).'''
+    path = str(tmp_path / "siatka")
+    with shapefile.Writer(path, shapeType=shapefile.POLYGON) as w:
+        for field in ("A", "B", "C", "D", "NAZWA"):
+            w.field(field, "C")
+        for name, (x0, y0) in zip(NAMES, [(0, 0), (4, 0), (0, 4), (4, 4)]):
+            w.poly([square(x0, y0)])
+            w.record("", "", "", "", name)
+    return path + ".shp"
+
+@pytest.fixture
+def slanted_shapefile(tmp_path):
+    '''Zapisuje plik .shp z dwoma trójkątami dzielącymi kwadrat wzdłuż przekątnej.'''
+    path = str(tmp_path / "skos")
+    diagonal = [(k, k) for k in range(9)]
+    with shapefile.Writer(path, shapeType=shapefile.POLYGON) as w:
+        for field in ("A", "B", "C", "D", "NAZWA"):
+            w.field(field, "C")
+        w.poly([diagonal + [(0, 8), (0, 0)]])
+        w.record("", "", "", "", NAMES[0])
+        w.poly([diagonal[::-1] + [(8, 0), (8, 8)]])
+        w.record("", "", "", "", NAMES[1])
+    return path + ".shp"
+
+def test_topology_stores_shared_borders_once():
+    '''Sprawdza, że wspólna granica dwóch regionów jest jednym łukiem użytym w obu kierunkach.'''
+    topo = Topology.build([[square(0, 0)], [square(4, 0)]])
+    (left,), (right,) = topo.rings
+    shared = set(left) & {~ref for ref in right}
+    assert len(shared) == 1
+    assert topo.vertex_count() < 2 * (len(square(0, 0)) - 1)
+    for region, refs in zip(([square(0, 0)], [square(4, 0)]), topo.rings):
+        rebuilt = Polygon(topo.ring_points(refs[0]))
+        assert rebuilt.equals(Polygon(region[0]))
+
+def test_topology_simplification_keeps_neighbours_closed():
+    '''Sprawdza, że po uproszczeniu sąsiednie regiony nadal dzielą dokładnie tę samą granicę.'''
+    topo = Topology.build([[square(0, 0)], [square(4, 0)]]).simplified(0.1)
+    left = Polygon(topo.ring_points(topo.rings[0][0]))
+    right = Polygon(topo.ring_points(topo.rings[1][0]))
+    assert left.intersection(right).length == pytest.approx(4.0)
+    assert left.union(right).area == pytest.approx(32.0)
+
+def test_widget_draws_from_topology(grid_shapefile):
+    '''Sprawdza, że widget buduje topologię i rysuje mapę oraz zaznaczenie.'''
+    widget = PolandMapWidget(0, 0, 200, 200, grid_shapefile, supersample=1)
+    assert [v['name'] for v in widget.voivodeships] == NAMES
+    assert all(v['arc_rings'] for v in widget.voivodeships)
+    assert widget.handle_click((50, 150)) == "pierwsze"
+    screen = pygame.Surface((200, 200))
+    widget.draw(screen)
+    assert widget.cache_surface.get_at((100, 50))[:3] == (0, 0, 0)
+
+def test_region_matrix_adjacency_and_points(grid_shapefile, tmp_path):
+    '''Sprawdza sąsiedztwo z łuków, tablicę punktów i zapis/odczyt macierzy.'''
+    RegionMatrix = importlib.import_module('regions').RegionMatrix
+    matrix = PolandMapWidget(0, 0, 200, 200, grid_shapefile).region_matrix
+    assert sorted(matrix.neighbours("pierwsze")) == ["drugie", "trzecie"]
+    assert matrix.points("pierwsze", "pierwsze") == 1.0
+    assert matrix.points("pierwsze", "drugie") == 0.5
+    assert matrix.points("pierwsze", "czwarte") == 0.25
+    assert matrix.points("pierwsze", "nieznane") == 0.0
+
+    path = str(tmp_path / "macierz.npz")
+    matrix.save(path)
+    loaded = RegionMatrix.load(path)
+    assert loaded.names == matrix.names
+    assert (loaded.points_table == matrix.points_table).all()
+
+def test_reset_keeps_base_map_cache(grid_shapefile):
+    '''Sprawdza, że reset czyści zaznaczenie, ale nie wyrzuca narysowanej bazowej mapy.'''
+    widget = PolandMapWidget(0, 0, 200, 200, grid_shapefile)
+    widget.render()
+    cache = widget.cache_surface
+    widget.reset()
+    assert not widget.needs_redraw
+    widget.handle_click((50, 150))
+    widget.render()
+    widget.reset()
+    assert widget.selected_voivodeship is None and widget.hovered_voivodeship is None
+    assert widget.needs_redraw
+    widget.render()
+    assert widget.cache_surface is cache
+
+def test_supersampled_base_map_is_antialiased(slanted_shapefile):
+    '''Sprawdza, że nadpróbkowana mapa ma półtony przy ukośnej granicy, a zwykła nie.'''
+    widget = PolandMapWidget(0, 0, 210, 190, slanted_shapefile)
+    plain = widget.rasterize_base_map(1)
+    smooth = widget.rasterize_base_map(4)
+    assert smooth.get_size() == plain.get_size() == (210, 190)
+    colors = {tuple(v['color'][:3]) for v in widget.voivodeships} | {(0, 0, 0)}
+    def blended(surface):
+        '''Liczy kolory spoza palety we wnętrzu mapy, gdzie jedyną granicą jest przekątna.'''
+        pixels = pygame.surfarray.array3d(surface)[40:170, 40:150].reshape(-1, 3)
+        return sum(tuple(p) not in colors for p in set(map(tuple, pixels)))
+    assert blended(plain) == 0
+    assert blended(smooth) > 0
+
+def test_baked_map_loaded_instead_of_drawing(grid_shapefile, tmp_path):
+    '''Sprawdza wczytanie wypalonej mapy i pominięcie obrazu o złym rozmiarze lub starszego od .shp.'''
+    map_module = importlib.import_module('map')
+    folder = str(tmp_path / 'wypalone')
+    os.makedirs(folder)
+    baked = PolandMapWidget(0, 0, 200, 200, grid_shapefile).rasterize_base_map()
+    baked.fill((1, 2, 3, 255), pygame.Rect(0, 0, 5, 5))
+    path = map_module.baked_map_path(folder, (200, 200))
+    pygame.image.save(baked, path)
+
+    widget = PolandMapWidget(0, 0, 200, 200, grid_shapefile, baked_folder=folder)
+    widget.render()
+    assert widget.cache_surface.get_at((2, 2))[:3] == (1, 2, 3)
+    assert PolandMapWidget(0, 0, 100, 100, grid_shapefile, baked_folder=folder).load_baked_map() is None
+
+    os.utime(path, (0, 0))
+    assert widget.load_baked_map() is None
+
+def test_hover_and_click_agree_along_shared_border(slanted_shapefile, monkeypatch):
+    '''Sprawdza, że przy ukośnej wspólnej granicy kliknięcie punktuje to samo województwo, które jest podświetlone.'''
+    widget = PolandMapWidget(0, 0, 200, 200, slanted_shapefile)
+    mouse = {'pos': (0, 0)}
+    monkeypatch.setattr(pygame.mouse, 'get_pos', lambda: mouse['pos'])
+    names = set()
+    for y in range(200):
+        for x in range(max(0, y - 4), min(200, y + 5)):
+            mouse['pos'] = (x, y)
+            widget.update()
+            hovered = widget.hovered_voivodeship['name'] if widget.hovered_voivodeship else None
+            assert widget.handle_click((x, y)) == hovered
+            names.add(hovered)
+    assert set(NAMES[:2]) <= names
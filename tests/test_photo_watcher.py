@@ -0,0 +1,123 @@
+import pytest
+import os
+import sys
+import time
+import pygame
+import importlib
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+PhotoWatcher = importlib.import_module('photo_watcher').PhotoWatcher
+Game = importlib.import_module('Game').Game
+
+@pytest.fixture(autouse=True)
+def init_pygame():
+    '''Inicjalizuje pygame w trybie 'dummy', aby nie otwierać okna.'''
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    pygame.display.init()
+    yield
+    pygame.display.quit()
+
+def age_folder(folder):
+    '''Cofa czas modyfikacji katalogu, aby nie mieścił się w oknie "racy mtime".'''
+    past = time.time() - 60
+    os.utime(folder, (past, past))
+
+def test_large_folder_diff_applied_to_game(tmp_path):
+    '''Sprawdza na 100 tys. plików, że bez zmian nie ma skanowania, a zmiany trafiają do gry jako różnica.'''
+    folder = tmp_path / 'zdjecia'
+    folder.mkdir()
+    names = [f'mazowieckie_{k:06d}.jpg' for k in range(100_000)]
+    for name in names:
+        open(folder / name, 'wb').close()
+    age_folder(folder)
+
+    watcher = PhotoWatcher(str(folder), names)
+    assert watcher.scans == 1
+    assert watcher.poll() == (set(), set())
+    assert watcher.check() is False
+    assert watcher.scans == 1
+
+    open(folder / 'opolskie_nowe.jpg', 'wb').close()
+    os.remove(folder / names[5])
+    os.remove(folder / names[7])
+    age_folder(folder)
+    assert watcher.check() is True
+    assert watcher.check() is False
+    assert watcher.scans == 2
+
+    game = Game()
+    game.image_folder = str(folder)
+    game.images = {name: 'mazowieckie' for name in names}
+    game.image_keys = list(names)
+    game.photo_watcher = watcher
+    game.apply_photo_changes()
+    assert len(game.images) == 100_000 - 1
+    assert game.images['opolskie_nowe.jpg'] == 'opolskie'
+    assert names[5] not in game.images and names[7] not in game.image_keys
+    assert game.image_keys[-1] == 'opolskie_nowe.jpg'
+    game.apply_photo_changes()
+    assert len(game.image_keys) == 100_000 - 1
+
+def test_watcher_thread_and_deleted_current_photo(tmp_path):
+    '''Sprawdza wątek w tle oraz pominięcie zdjęcia usuniętego w trakcie gry.'''
+    folder = tmp_path / 'zdjecia'
+    folder.mkdir()
+    for name in ('lubuskie_a.png', 'opolskie_b.png'):
+        surface = pygame.Surface((20, 20))
+        pygame.image.save(surface, str(folder / name))
+    game = Game()
+    game.photo_pack = None
+    game.image_folder = str(folder)
+    game.images = {'lubuskie_a.png': 'lubuskie', 'opolskie_b.png': 'opolskie'}
+    game.image_keys = list(game.images)
+    game.start_photo_watcher()
+    game.photo_watcher.interval = 0.01
+    try:
+        os.remove(folder / 'lubuskie_a.png')
+        pygame.image.save(pygame.Surface((20, 20)), str(folder / 'podlaskie_c.png'))
+        deadline = time.time() + 5
+        while time.time() < deadline and 'podlaskie_c.png' not in game.images:
+            game.apply_photo_changes()
+            time.sleep(0.01)
+        assert set(game.images) == {'opolskie_b.png', 'podlaskie_c.png'}
+        assert sorted(game.image_keys) == ['opolskie_b.png', 'podlaskie_c.png']
+
+        """Plik usunięty, zanim obserwator to zgłosi, jest pomijany przy losowaniu"""
+        os.remove(folder / 'podlaskie_c.png')
+        game.image_keys = ['podlaskie_c.png', 'opolskie_b.png']
+        game.pick_next_image()
+        assert game.current_image == 'opolskie_b.png'
+        assert game.current_image_surface is not None
+    finally:
+        game.photo_watcher.stop()
+
+def test_changes_before_start_and_gps_index_diff(tmp_path, monkeypatch):
+    '''Sprawdza zgłoszenie pliku dodanego przed utworzeniem obserwatora i przeniesienie różnicy do indeksu GPS.'''
+    GpsIndex = importlib.import_module('gps_index').GpsIndex
+    folder = tmp_path / 'zdjecia'
+    folder.mkdir()
+    (folder / 'podkatalog').mkdir()
+    for name in ('lubuskie_a.jpg', 'opolskie_b.jpg'):
+        open(folder / name, 'wb').close()
+    game = Game()
+    game.image_folder = str(folder)
+    game.images = {'lubuskie_a.jpg': 'lubuskie', 'opolskie_b.jpg': 'opolskie'}
+    game.image_keys = list(game.images)
+    game.gps_index = GpsIndex(['lubuskie_a.jpg', 'opolskie_b.jpg'], [(52.0, 15.0), (50.7, 17.9)])
+    sidecar = tmp_path / 'wspolrzedne.csv'
+    sidecar.write_text('zdjecie,szerokosc,dlugosc\npodlaskie_c.jpg,53.1,23.2\n', encoding='utf-8')
+    monkeypatch.setattr(importlib.import_module('Game'), 'PHOTO_COORDINATES_PATH', str(sidecar))
+
+    open(folder / 'podlaskie_c.jpg', 'wb').close()
+    os.remove(folder / 'opolskie_b.jpg')
+    age_folder(folder)
+    game.photo_watcher = PhotoWatcher(str(folder), game.images)
+    assert game.photo_watcher.check() is False
+    game.apply_photo_changes()
+    assert set(game.images) == {'lubuskie_a.jpg', 'podlaskie_c.jpg'}
+    assert 'opolskie_b.jpg' not in game.gps_index
+    assert game.gps_index.get('podlaskie_c.jpg') == (53.1, 23.2)
+    assert game.gps_index.get('lubuskie_a.jpg') == (52.0, 15.0)
@@ -0,0 +1,48 @@
+import os
+import sys
+import pstats
+import importlib
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+profiling = importlib.import_module('profiling')
+GameState = importlib.import_module('game_state').GameState
+
+class FakeGame:
+    '''Minimalny obiekt z metodami o nazwach takich jak w Game.'''
+    def __init__(self):
+        self.state = GameState.GAMEPAGE
+        self.current_round = 0
+
+    def handle_gamepage(self):
+        for self.current_round in range(2):
+            self.run_single_round()
+        return 'koniec'
+
+    def run_single_round(self):
+        return sum(range(1000))
+
+    def draw_header(self):
+        pass
+
+def test_profiler_writes_file_per_state_and_round(tmp_path):
+    '''Sprawdza, że profiler zapisuje osobne pliki .pstats dla stanu i każdej rundy.'''
+    game = FakeGame()
+    profiler = profiling.StateProfiler(str(tmp_path))
+    profiler.install(game)
+    assert 'draw_header' not in vars(game)
+    assert game.handle_gamepage() == 'koniec'
+    names = sorted(os.path.basename(p) for p in profiler.written)
+    assert names == ['GAMEPAGE_001.pstats', 'run_single_round_runda01_001.pstats',
+                     'run_single_round_runda02_001.pstats']
+    stats = pstats.Stats(os.path.join(str(tmp_path), 'run_single_round_runda01_001.pstats'))
+    assert stats.total_calls > 0
+
+def test_profiler_disabled_without_env(monkeypatch, tmp_path):
+    '''Sprawdza, że bez ZW_PROFILE profiler nie jest tworzony.'''
+    monkeypatch.delenv('ZW_PROFILE', raising=False)
+    assert profiling.profiler_from_env(str(tmp_path)) is None
+    monkeypatch.setenv('ZW_PROFILE', str(tmp_path / 'profile'))
+    assert profiling.profiler_from_env('inny').folder == str(tmp_path / 'profile')
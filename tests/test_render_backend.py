@@ -0,0 +1,58 @@
+import pytest
+import os
+import sys
+import pygame
+import importlib
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+render_backend = importlib.import_module('render_backend')
+Game = importlib.import_module('Game').Game
+
+@pytest.fixture(autouse=True)
+def init_pygame():
+    '''Inicjalizuje pygame w trybie 'dummy', aby nie otwierać okna.'''
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    pygame.display.init()
+    yield
+    pygame.display.quit()
+
+def test_default_backend_is_surface(monkeypatch):
+    '''Sprawdza, że bez ZW_RENDERER gra rysuje na powierzchni ekranu.'''
+    monkeypatch.delenv(render_backend.RENDERER_ENV, raising=False)
+    game = Game()
+    assert isinstance(game.backend, render_backend.SurfaceBackend)
+    assert game.screen is pygame.display.get_surface()
+
+def test_texture_backend_uploads_only_changed_layers():
+    '''Sprawdza, że warstwa jest wysyłana ponownie tylko po zmianie powierzchni lub wersji.'''
+    backend = render_backend.create_backend((64, 48), "test", "sdl2-software")
+    layer = pygame.Surface((10, 10))
+    layer.fill((255, 0, 0))
+    for version in (0, 0, 0, 1, 1):
+        backend.begin((0, 0, 255))
+        backend.layer("warstwa", layer, (5, 5), version)
+        backend.end()
+    assert backend.uploads == 2
+
+    frame = backend.renderer.to_surface()
+    assert frame.get_at((7, 7))[:3] == (255, 0, 0)
+    assert frame.get_at((40, 40))[:3] == (0, 0, 255)
+
+def test_texture_backend_flip_shows_screen_surface():
+    '''Sprawdza, że ekrany rysowane na `screen` trafiają do renderera w flip().'''
+    backend = render_backend.create_backend((32, 32), "test", "sdl2-software")
+    backend.screen.fill((0, 200, 0))
+    backend.flip()
+    assert backend.renderer.to_surface().get_at((16, 16))[:3] == (0, 200, 0)
+
+def test_game_header_rendered_once_per_change(monkeypatch):
+    '''Sprawdza, że nagłówek jest renderowany ponownie dopiero po zmianie wyniku.'''
+    monkeypatch.setenv(render_backend.RENDERER_ENV, "sdl2-software")
+    game = Game()
+    first = game.header_surface()
+    assert game.header_surface() is first
+    game.score += 1
+    assert game.header_surface() is not first
@@ -0,0 +1,65 @@
+import pytest
+import os
+import sys
+import pygame
+import importlib
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+scene = importlib.import_module('scene')
+Game = importlib.import_module('Game').Game
+GameState = importlib.import_module('game_state').GameState
+
+@pytest.fixture(autouse=True)
+def init_pygame():
+    '''Inicjalizuje pygame w trybie 'dummy', aby nie otwierać okna.'''
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    pygame.display.init()
+    yield
+    pygame.display.quit()
+
+def test_static_layer_renders_once():
+    '''Sprawdza, że warstwa statyczna jest renderowana tylko raz, aż do unieważnienia.'''
+    calls = []
+    layer = scene.StaticLayer(lambda surf: calls.append(surf.fill((1, 2, 3))), (10, 10))
+    target = pygame.Surface((10, 10))
+    for ticks in range(5):
+        layer.draw(target, ticks)
+    assert len(calls) == 1
+    assert target.get_at((5, 5))[:3] == (1, 2, 3)
+    layer.invalidate()
+    layer.draw(target, 0)
+    assert len(calls) == 2
+
+def test_wave_frames_match_original_formula():
+    '''Sprawdza, że przygotowane klatki odpowiadają pozycjom liczonym przez Vector2.rotate.'''
+    frames = scene.wave_background_frames(100, 60, 720, (0, 0, 0))
+    layer = scene.AnimatedLayer(frames, 500)
+    for ticks in (0, 12_000, 47_500, 89_000):
+        frame = frames[layer.frame_index(ticks)]
+        offset = ticks / 500
+        expected = [
+            y + int(10 * abs(pygame.math.Vector2(0, y).rotate(offset).y / 720))
+            for y in range(60, 720, 20)
+        ]
+        assert [pos[1] for _, pos in frame] == expected
+
+def test_sprite_layer_uses_time_since_enter():
+    '''Sprawdza, że pozycja warstwy ruchomej liczona jest od wejścia do sceny.'''
+    positions = []
+    sprite = pygame.Surface((2, 2))
+    s = scene.Scene([scene.SpriteLayer(sprite, lambda t: positions.append(t) or (0, 0))])
+    s.enter(1000)
+    s.draw(pygame.Surface((4, 4)), 1250)
+    assert positions == [250]
+
+def test_game_scenes_are_cached():
+    '''Sprawdza, że każdy ekran gry ma scenę budowaną raz i rysowaną bez wyjątków.'''
+    game = Game()
+    for state in (GameState.HOMEPAGE, GameState.DIFFICULTY_SELECT, GameState.STARTPAGE,
+                  GameState.INSTRUCTIONPAGE, GameState.RESULTPAGE):
+        built = game.enter_scene(state)
+        built.draw(game.screen, pygame.time.get_ticks())
+        assert game.get_scene(state) is built
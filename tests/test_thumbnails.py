@@ -0,0 +1,143 @@
+import pytest
+import os
+import sys
+import time
+import pygame
+import importlib
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+thumbnails = importlib.import_module('thumbnails')
+game_module = importlib.import_module('Game')
+Game = game_module.Game
+
+@pytest.fixture(autouse=True)
+def init_pygame():
+    '''Inicjalizuje pygame w trybie 'dummy', aby nie otwierać okna.'''
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    pygame.display.init()
+    yield
+    pygame.display.quit()
+
+@pytest.fixture
+def photo_folder(tmp_path):
+    '''Zapisuje dwa zdjęcia PNG i jeden uszkodzony plik.'''
+    folder = tmp_path / 'zdjecia'
+    folder.mkdir()
+    for name, size, color in [('łódzkie_lodz.png', (400, 300), (200, 30, 30)),
+                              ('opolskie_opole.png', (100, 200), (30, 30, 200))]:
+        surface = pygame.Surface(size)
+        surface.fill(color)
+        pygame.image.save(surface, str(folder / name))
+    (folder / 'uszkodzone_zdjecie.png').write_bytes(b'to nie jest png')
+    return folder
+
+def test_manifest_roundtrip_and_placeholder(photo_folder, tmp_path):
+    '''Sprawdza zapis/odczyt manifestu i rozmiar miniatury powiększonej jak pełne zdjęcie.'''
+    path = str(tmp_path / 'miniatury.npz')
+    assert thumbnails.build_manifest(str(photo_folder), path) == 2
+    manifest = thumbnails.ThumbnailManifest.load(path)
+    assert 'uszkodzone_zdjecie.png' not in manifest
+    thumb = manifest.surface('łódzkie_lodz.png')
+    assert thumb.get_size() == (48, 36)
+    assert all(abs(a - b) <= 3 for a, b in zip(thumb.get_at((10, 10)), (200, 30, 30)))
+    assert manifest.surface('opolskie_opole.png').get_size() == (18, 36)
+    assert manifest.placeholder('łódzkie_lodz.png', (200, 200)).get_size() == (200, 150)
+    assert manifest.placeholder('brak.png', (200, 200)) is None
+
+def test_game_shows_placeholder_then_full_photo(photo_folder):
+    '''Sprawdza, że gra od razu pokazuje miniaturę, a pełne zdjęcie podmienia po dekodowaniu.'''
+    game = Game()
+    game.image_folder = str(photo_folder)
+    game.thumbnails = thumbnails.ThumbnailManifest.build(
+        ['łódzkie_lodz.png'], lambda n: pygame.image.load(str(photo_folder / n)))
+    game.image_cache.clear()
+    game.image_keys = ['łódzkie_lodz.png']
+    game.pick_next_image()
+    placeholder = game.current_image_surface
+    assert placeholder is not None
+    assert game.photo_loader.pending
+
+    game.photo_loader.future.result(timeout=5)
+    game.poll_photo()
+    assert not game.photo_loader.pending
+    assert game.current_image_surface is not placeholder
+    assert game.current_image_surface.get_size() == placeholder.get_size()
+    assert (str(photo_folder / 'łódzkie_lodz.png'), game_module.IMAGE_MAX_SIZE) in game.image_cache
+
+    game.image_keys = ['łódzkie_lodz.png']
+    game.pick_next_image()
+    assert not game.photo_loader.pending
+
+def test_failed_background_decode_skips_photo(photo_folder):
+    '''Sprawdza, że uszkodzone zdjęcie dekodowane w tle jest pomijane.'''
+    game = Game()
+    game.image_folder = str(photo_folder)
+    game.thumbnails = thumbnails.ThumbnailManifest.build(
+        ['łódzkie_lodz.png'], lambda n: pygame.image.load(str(photo_folder / n)))
+    game.thumbnails.index['uszkodzone_zdjecie.png'] = game.thumbnails.index.pop('łódzkie_lodz.png')
+    game.image_keys = ['uszkodzone_zdjecie.png']
+    game.pick_next_image()
+    assert game.photo_loader.pending
+    game.photo_loader.future.exception(timeout=5)
+    game.image_keys = ['opolskie_opole.png']
+    game.poll_photo()
+    assert game.current_image == 'opolskie_opole.png'
+    assert game.current_image_surface is not None
+
+def test_photo_deleted_while_decoding_skips_photo(photo_folder):
+    '''Sprawdza, że zdjęcie usunięte, gdy dekodowanie w tle jeszcze czeka, jest pomijane bez wyjątku.'''
+    game = Game()
+    game.image_folder = str(photo_folder)
+    game.thumbnails = thumbnails.ThumbnailManifest.build(
+        ['łódzkie_lodz.png'], lambda n: pygame.image.load(str(photo_folder / n)))
+    game.image_cache.clear()
+    busy = game.photo_loader.executor.submit(time.sleep, 0.3)
+    game.image_keys = ['łódzkie_lodz.png']
+    game.pick_next_image()
+    assert game.photo_loader.pending
+    os.remove(photo_folder / 'łódzkie_lodz.png')
+    busy.result()
+    game.photo_loader.future.exception(timeout=5)
+    game.image_keys = ['opolskie_opole.png']
+    game.poll_photo()
+    assert game.current_image == 'opolskie_opole.png'
+    assert game.current_image_surface is not None
+
+def test_hard_mode_timer_starts_when_photo_is_visible(monkeypatch):
+    '''Sprawdza, że limit 8 s w trybie trudnym liczy się od pokazania pełnego zdjęcia, a nie od startu rundy.'''
+    class SlowLoader:
+        pending = True
+        path = None
+        def poll(self):
+            return None
+    class FakeWidget:
+        visible = False
+        def update(self):
+            pass
+        def handle_event(self, event):
+            return None
+    clock = {'ticks': 0, 'frames': 0}
+    def next_frame():
+        clock['ticks'] += 500
+        clock['frames'] += 1
+        if clock['frames'] == 40:
+            game.photo_loader.pending = False
+        return []
+    monkeypatch.setattr(pygame.time, 'get_ticks', lambda: clock['ticks'])
+    monkeypatch.setattr(pygame.event, 'get', next_frame)
+    game = Game()
+    game.photo_loader = SlowLoader()
+    game.images = {'mazowieckie_a.png': 'mazowieckie'}
+    game.current_image = 'mazowieckie_a.png'
+    game.photo_visible_at = None
+    feedback = []
+    game.pokaz_feedback = lambda status, woj: feedback.append((status, clock['ticks']))
+
+    game.run_single_round_hard_mode(FakeWidget())
+    assert game.photo_visible_at == 20_000
+    [(status, timed_out_at)] = feedback
+    assert status == 'czas'
+    assert 20_000 + 8_000 < timed_out_at <= 20_000 + 9_000